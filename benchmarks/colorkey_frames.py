@@ -0,0 +1,61 @@
+"""Microbenchmark: frames com alfa por pixel vs. frames otimizados por 'optimize_frame'.
+
+Para cada animação, mostra quantos frames usam cada caminho de blit (os de alfa binário viram
+superfícies com cor transparente codificadas em RLE) e o tempo de desenhar todos os frames
+na tela antes e depois da otimização.
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.colorkey_frames
+"""
+import os
+import timeit
+from collections import Counter
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.event_manager import EventManager
+from managers.frame_cache import FrameCache
+from managers.resource_manager import ResourceManager
+from managers.sprite_manager import SpriteManager
+from utils.frame_set import frame_format
+
+ITERATIONS = 200
+
+
+def _blit_time(screen: pygame.Surface, frames) -> float:
+    # Tempo médio, em segundos, para desenhar todos os frames da animação.
+    blits = [(frame, (0, 0)) for frame in frames]
+    screen.blits(blits, doreturn=False)
+    return timeit.timeit(lambda: screen.blits(blits, doreturn=False), number=ITERATIONS) / ITERATIONS
+
+
+def main() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    resource_manager = ResourceManager()
+    managers = {
+        optimize: SpriteManager(resource_manager, EventManager(), frame_cache=FrameCache(), optimize_frames=optimize)
+        for optimize in (False, True)
+    }
+    print(f"{'animação':<26}{'formatos':<30}{'alfa (ms)':>11}{'otimizado (ms)':>16}{'ganho':>8}")
+    total = {False: 0.0, True: 0.0}
+    for sheet_name, coords in SpriteManager.ANIMATIONS:
+        frames = {optimize: manager.get_frames(sheet_name, coords) for optimize, manager in managers.items()}
+        formats = Counter(frame_format(frame) for frame in frames[True])
+        times = {optimize: _blit_time(screen, animation) for optimize, animation in frames.items()}
+        for optimize, seconds in times.items():
+            total[optimize] += seconds
+        description = ', '.join(f'{count} {name}' for name, count in sorted(formats.items()))
+        print(
+            f'{sheet_name:<26}{description:<30}{times[False] * 1e3:>11.3f}{times[True] * 1e3:>16.3f}'
+            f'{times[False] / times[True]:>7.1f}x'
+        )
+    print(f"{'total':<56}{total[False] * 1e3:>11.3f}{total[True] * 1e3:>16.3f}{total[False] / total[True]:>7.1f}x")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
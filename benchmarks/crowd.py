@@ -0,0 +1,72 @@
+"""Benchmark: movimentação dos mobs por objeto vs. CrowdSimulation vetorizada (modo horda).
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.crowd
+"""
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from core.game import Game
+
+MOB_COUNTS = (100, 1000, 3000)
+TICKS = 60
+
+
+def _horde_game(mob_count: int, crowd: bool) -> Game:
+    # Cria um jogo headless com 'mob_count' mobs espalhados pelo mapa.
+    random.seed(mob_count)
+    game = Game(headless=True, crowd=crowd)
+    for index in range(mob_count):
+        mob = game._mob_factory.create_mob('Soul' if index % 2 else 'Troll')
+        mob.rect.centerx = random.randrange(400, Game.MAP_WIDTH - 400)
+    return game
+
+
+def _movement_time(game: Game) -> float:
+    # Mede o tempo médio por tick gasto movendo os mobs (kernel + handle_collision).
+    sprite_manager = game._sprite_manager
+    mobs = list(sprite_manager.mob_sprites)
+    elapsed = 0.0
+    for _ in range(TICKS):
+        game._world.begin_tick()
+        sprite_manager.player_index.refresh()
+        started = time.perf_counter()
+        if sprite_manager.crowd_simulation is not None:
+            sprite_manager.crowd_simulation.step(Game.FIXED_DELTA_TIME)
+        for mob in mobs:
+            mob.movement_component.handle_collision(Game.FIXED_DELTA_TIME)
+            if hasattr(mob, 'float_component'):
+                mob.float_component.update(Game.FIXED_DELTA_TIME)
+        elapsed += time.perf_counter() - started
+    return elapsed / TICKS
+
+
+def _tick_time(game: Game) -> float:
+    # Mede o tempo médio de um tick completo da simulação.
+    started = time.perf_counter()
+    for _ in range(TICKS):
+        game.step()
+    return (time.perf_counter() - started) / TICKS
+
+
+def main() -> None:
+    print(f"{'mobs':>6}{'mov. objeto (ms)':>18}{'mov. multidão (ms)':>20}{'tick objeto (ms)':>18}{'tick multidão (ms)':>20}")
+    for mob_count in MOB_COUNTS:
+        results = []
+        for measure in (_movement_time, _tick_time):
+            for crowd in (False, True):
+                results.append(measure(_horde_game(mob_count, crowd)))
+                pygame.quit()
+        print(
+            f'{mob_count:>6}{results[0] * 1e3:>18.2f}{results[1] * 1e3:>20.2f}'
+            f'{results[2] * 1e3:>18.2f}{results[3] * 1e3:>20.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: atualização dos mobs um a um vs. sistemas do EntityStore.
+
+A referência repete, para cada mob, o trabalho do antigo 'Mob.update' (e das versões de
+Soul e Troll): colisão, ataque, barra de vida, orientação e a flutuação ou a animação.
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.entity_store
+"""
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from core.game import Game
+
+MOB_COUNTS = (100, 1000, 3000)
+TICKS = 60
+
+
+def _horde_game(mob_count: int) -> Game:
+    # Cria um jogo headless com 'mob_count' mobs espalhados pelo mapa.
+    random.seed(mob_count)
+    game = Game(headless=True)
+    for index in range(mob_count):
+        mob = game._mob_factory.create_mob('Soul' if index % 2 else 'Troll')
+        mob.rect.centerx = random.randrange(400, Game.MAP_WIDTH - 400)
+    return game
+
+
+def _update_mob(mob: pygame.sprite.Sprite, delta_time: float) -> None:
+    # Atualização por mob, na ordem do antigo 'Mob.update' seguido do passo de Soul ou Troll.
+    mob.movement_component.handle_collision(delta_time)
+    mob.attack_component.update()
+    mob.life_bar_component.update_life_bar()
+    mob.sync_orientation()
+    if hasattr(mob, 'float_component'):
+        mob.float_component.update(delta_time)
+    if hasattr(mob, 'animation_component'):
+        mob.animation_component.update(delta_time)
+
+
+def _update_time(game: Game, use_store: bool) -> float:
+    # Mede o tempo médio por tick da atualização dos mobs.
+    sprite_manager = game._sprite_manager
+    elapsed = 0.0
+    for _ in range(TICKS):
+        game._world.begin_tick()
+        sprite_manager.player_index.refresh()
+        started = time.perf_counter()
+        if use_store:
+            sprite_manager.entity_store.sync(sprite_manager.mob_sprites)
+            sprite_manager.entity_store.run(Game.FIXED_DELTA_TIME)
+        else:
+            for mob in sprite_manager.mob_sprites.sprites():
+                _update_mob(mob, Game.FIXED_DELTA_TIME)
+        elapsed += time.perf_counter() - started
+    return elapsed / TICKS
+
+
+def main() -> None:
+    print(f"{'mobs':>6}{'por mob (ms)':>20}{'EntityStore (ms)':>20}")
+    for mob_count in MOB_COUNTS:
+        results = []
+        for use_store in (False, True):
+            results.append(_update_time(_horde_game(mob_count), use_store))
+            pygame.quit()
+        print(f'{mob_count:>6}{results[0] * 1e3:>20.2f}{results[1] * 1e3:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
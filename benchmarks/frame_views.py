@@ -0,0 +1,66 @@
+"""Microbenchmark: frames copiados do spritesheet vs. subsuperfícies que compartilham seus pixels.
+
+Mede, para cada animação, o tempo de desenhar todos os frames na tela e a memória própria
+dos frames (sem as variantes espelhadas, que são cópias nos dois modos).
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.frame_views
+"""
+import os
+import timeit
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.event_manager import EventManager
+from managers.frame_cache import FrameCache
+from managers.resource_manager import ResourceManager
+from managers.sprite_manager import SpriteManager
+
+ITERATIONS = 200
+MEGABYTE = 2 ** 20
+
+
+def _owned_bytes(frames) -> int:
+    # Bytes de pixels pertencentes aos próprios frames (as subsuperfícies não têm pixels próprios).
+    return sum(
+        frame.get_width() * frame.get_height() * frame.get_bytesize()
+        for frame in frames if frame.get_parent() is None
+    )
+
+
+def main() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    resource_manager = ResourceManager()
+    managers = {
+        views: SpriteManager(resource_manager, EventManager(), frame_cache=FrameCache(), frame_views=views)
+        for views in (False, True)
+    }
+    print(
+        f"{'animação':<26}{'cópias (ms)':>13}{'views (ms)':>12}"
+        f"{'cópias (MB)':>13}{'views (MB)':>12}{'spritesheet (MB)':>18}"
+    )
+    for sheet_name, coords in SpriteManager.ANIMATIONS:
+        sheet = resource_manager.get_image(sheet_name)
+        frames = {views: list(manager.get_frames(sheet_name, coords)) for views, manager in managers.items()}
+        times = {
+            views: timeit.timeit(
+                lambda: screen.blits([(frame, (0, 0)) for frame in animation], doreturn=False),
+                number=ITERATIONS
+            ) / ITERATIONS
+            for views, animation in frames.items()
+        }
+        sheet_bytes = ResourceManager.surface_bytes(sheet)
+        print(
+            f'{sheet_name:<26}{times[False] * 1e3:>13.3f}{times[True] * 1e3:>12.3f}'
+            f'{_owned_bytes(frames[False]) / MEGABYTE:>13.2f}{_owned_bytes(frames[True]) / MEGABYTE:>12.2f}'
+            f'{sheet_bytes / MEGABYTE:>18.2f}'
+        )
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
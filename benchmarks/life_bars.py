@@ -0,0 +1,73 @@
+"""Microbenchmark: barras de vida com 'pygame.draw.rect' vs. superfícies pré-renderizadas em lote.
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.life_bars
+"""
+import os
+import random
+import timeit
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLUE_LIFEBAR, RED
+from core.camera import Camera
+from components.life_bar_component import LifeBarComponent
+
+BAR_COUNTS = (10, 50, 200)
+ITERATIONS = 200
+BAR_SIZE = (100, 10)
+
+
+class _FakeMob:
+    # Entidade mínima com os atributos lidos pelo LifeBarComponent.
+    def __init__(self, x: int, y: int) -> None:
+        self.rect = pygame.Rect(x, y, 80, 80)
+        self.life = 100
+
+
+class _NullEventManager:
+    def subscribe(self, *args, **kwargs) -> None:
+        pass
+
+
+def _create_bars(count: int) -> list:
+    bars = []
+    for _ in range(count):
+        mob = _FakeMob(random.randrange(SCREEN_WIDTH), random.randrange(40, SCREEN_HEIGHT))
+        bar = LifeBarComponent(mob, _NullEventManager(), *BAR_SIZE, RED)
+        mob.life = random.randrange(0, 101)
+        bar.update_life_bar()
+        bars.append(bar)
+    return bars
+
+
+def main() -> None:
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT)
+    sprite = pygame.Surface(BAR_SIZE, pygame.SRCALPHA)
+    sprite.fill((200, 30, 30, 255))
+    print(f"{'barras':>8}{'draw.rect (ms)':>16}{'blits (ms)':>12}{'sprites (ms)':>14}")
+    for count in BAR_COUNTS:
+        bars = _create_bars(count)
+
+        def draw_rects() -> None:
+            for bar in bars:
+                pygame.draw.rect(screen, bar.color, camera.apply(bar.inner), border_radius=5)
+                pygame.draw.rect(screen, BLUE_LIFEBAR, camera.apply(bar.outline), width=2, border_radius=5)
+
+        def batched() -> None:
+            screen.blits([bar.life_bar_blit(camera) for bar in bars])
+
+        positions = [(sprite, bar.outline.topleft) for bar in bars]
+        rects_time = timeit.timeit(draw_rects, number=ITERATIONS) / ITERATIONS
+        blits_time = timeit.timeit(batched, number=ITERATIONS) / ITERATIONS
+        sprites_time = timeit.timeit(lambda: screen.blits(positions), number=ITERATIONS) / ITERATIONS
+        print(f'{count:>8}{rects_time * 1e3:>16.3f}{blits_time * 1e3:>12.3f}{sprites_time * 1e3:>14.3f}')
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
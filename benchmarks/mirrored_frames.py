@@ -0,0 +1,74 @@
+"""Microbenchmark: espelhamento em tempo de execução vs. frames espelhados pré-calculados.
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.mirrored_frames
+"""
+import os
+import timeit
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.event_manager import EventManager
+from managers.resource_manager import ResourceManager
+from managers.sprite_manager import SpriteManager
+from utils.frame_set import FrameSet
+
+ITERATIONS = 2000
+
+
+def _load_frame_sets(sprite_manager: SpriteManager, resource_manager: ResourceManager) -> dict:
+    sheets = {
+        'player idle': ('player_spritesheet', sprite_manager.player_sprite_coords),
+        'player attack': ('player_attacking', sprite_manager.attack_sprite_coords),
+        'player cannon': ('cannon_attack', sprite_manager.cannon_attack_coords),
+        'troll idle': ('troll_idle_spritesheet', sprite_manager.troll_sprite_coords['idle']),
+        'troll death': ('troll_death_spritesheet', sprite_manager.troll_sprite_coords['death']),
+    }
+    return {
+        label: FrameSet(
+            sprite_manager.get_sprite(resource_manager.get_image(sheet), *coords) 
+            for coords in coords_list
+        )
+        for label, (sheet, coords_list) in sheets.items()
+    }
+
+
+def _bench(frames: FrameSet) -> tuple:
+    count = len(frames)
+    state = {'index': 0}
+
+    def runtime_flip() -> None:
+        state['index'] = (state['index'] + 1) % count
+        pygame.transform.flip(frames[state['index']], True, False)
+
+    def precomputed() -> None:
+        state['index'] = (state['index'] + 1) % count
+        frames.get(state['index'], mirrored=True)
+
+    flip_time = timeit.timeit(runtime_flip, number=ITERATIONS) / ITERATIONS
+    lookup_time = timeit.timeit(precomputed, number=ITERATIONS) / ITERATIONS
+    # Cada flip aloca uma superfície nova do tamanho do frame; o lookup não aloca nada.
+    allocated = sum(frame.get_width() * frame.get_height() * frame.get_bytesize() for frame in frames) / count
+    return flip_time, lookup_time, allocated
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    resource_manager = ResourceManager()
+    sprite_manager = SpriteManager(resource_manager, EventManager())
+    print(f"{'animação':<16}{'flip (µs)':>12}{'lookup (µs)':>14}{'speedup':>10}{'KiB/frame evitados':>22}")
+    for label, frames in _load_frame_sets(sprite_manager, resource_manager).items():
+        flip_time, lookup_time, allocated = _bench(frames)
+        print(
+            f'{label:<16}{flip_time * 1e6:>12.2f}{lookup_time * 1e6:>14.2f}'
+            f'{flip_time / lookup_time:>9.0f}x{allocated / 1024:>22.1f}'
+        )
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
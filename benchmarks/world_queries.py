@@ -0,0 +1,74 @@
+"""Microbenchmark: consultas ao mundo via EventManager.notify vs. World.
+
+Reproduz o custo por mob, por tick, das três consultas feitas antes por
+'has_collided', 'move' e 'BasicAttackComponent._perform_attack'.
+
+Executar a partir da raiz do projeto:
+    python -m benchmarks.world_queries
+"""
+import timeit
+import pygame
+from typing import Any, Dict
+from managers.event_manager import EventManager
+from managers.world import World
+
+ITERATIONS = 200_000
+QUERIES_PER_MOB = 3
+
+
+class _LegacySpriteQueries:
+    """Reproduz o 'notify' antigo do SpriteManager, com a cadeia de ifs."""
+
+    def __init__(self, sprite_manager: '_SpriteManagerStub') -> None:
+        self._sprite_manager = sprite_manager
+
+    def notify(self, event: Dict[str, Any]) -> pygame.sprite.Group | None:
+        if event['type'] == 'get_mob_sprites':
+            return self._sprite_manager.mob_sprites
+        elif event['type'] == 'get_player_sprites':
+            return self._sprite_manager.player_sprites
+
+
+class _SpriteManagerStub:
+    """Apenas os grupos e índices lidos pelas consultas."""
+
+    def __init__(self) -> None:
+        self.player_sprites = pygame.sprite.Group(pygame.sprite.Sprite())
+        self.mob_sprites = pygame.sprite.Group()
+        self.player_index = object()
+        self.mob_index = object()
+
+
+def main() -> None:
+    sprite_manager = _SpriteManagerStub()
+    event_manager = EventManager()
+    legacy = _LegacySpriteQueries(sprite_manager)
+    event_manager.subscribe('get_mob_sprites', legacy)
+    event_manager.subscribe('get_player_sprites', legacy)
+    world = World(sprite_manager)
+
+    def legacy_mob_tick() -> None:
+        for _ in range(QUERIES_PER_MOB):
+            event_manager.notify({'type': 'get_player_sprites'})
+
+    def world_mob_tick() -> None:
+        for _ in range(QUERIES_PER_MOB):
+            world.player_index
+
+    def world_players_mob_tick() -> None:
+        for _ in range(QUERIES_PER_MOB):
+            world.players
+
+    results = {
+        'EventManager.notify': timeit.timeit(legacy_mob_tick, number=ITERATIONS),
+        'World.player_index': timeit.timeit(world_mob_tick, number=ITERATIONS),
+        'World.players (cache)': timeit.timeit(world_players_mob_tick, number=ITERATIONS),
+    }
+    baseline = results['EventManager.notify']
+    print(f"{'consulta':<24}{'ns/mob/tick':>14}{'speedup':>10}")
+    for label, elapsed in results.items():
+        print(f'{label:<24}{elapsed / ITERATIONS * 1e9:>14.0f}{baseline / elapsed:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,12 @@
-import pygame
-from typing import List, Union, TYPE_CHECKING
+from typing import Union, TYPE_CHECKING
 from .animation_interface import AnimationComponent
+from utils.frame_set import frame_rect
 
 if TYPE_CHECKING:
     from entities.player import Player
     from entities.mob import Mob
     from managers.event_manager import EventManager
+    from utils.frame_set import FrameSet
 
 class BasicAnimationComponent(AnimationComponent):
     """Gerencia a animação da entidade."""
@@ -15,23 +16,27 @@ class BasicAnimationComponent(AnimationComponent):
     def __init__(
             self: 'BasicAnimationComponent', 
             entity: Union['Player', 'Mob'], 
-            animation_frames: List[pygame.Surface], 
+            animation_frames: 'FrameSet', 
             event_manager: 'EventManager'
         ) -> None:
         """Inicializa os atributos de animação."""
         super().__init__()
-        self._initial_entity = self._entity = entity
+        self._entity = entity
         self._initial_animation_frames = self._animation_frames = animation_frames
         self._event_manager = event_manager
         self._initial_rect = entity.rect
         self._animation_speed = self.IDLE_ANIMATION_SPEED
         self._last_frame_index = -1  # Rastrear quando a imagem realmente muda
         self._state = self.IDLE_STATE
-        self._event_manager.subscribe(event_type='damage_event', listener=self)
+        self.subscribe_to_events()
+
+    def subscribe_to_events(self) -> None:
+        """Inscreve o componente nos eventos de dano da própria entidade."""
+        self._event_manager.subscribe(event_type='damage_event', listener=self, target=self._entity)
 
     def notify(self, event) -> None:
+        """Inicia a animação de dano recebida no evento (apenas eventos da própria entidade)."""
         if event['type'] == 'damage_event':
-            self._entity = event['target']
             self._animation_frames = event['animation_frames']
             self.frame_counter = 0
 
@@ -46,7 +51,6 @@ class BasicAnimationComponent(AnimationComponent):
         self.frame_counter += self._animation_speed * delta_time
         if self.frame_counter >= len(self._animation_frames):
             self.frame_counter = 0
-            self._entity = self._initial_entity
             if self._animation_frames != self._initial_animation_frames:
                 self._animation_frames = self._initial_animation_frames
 
@@ -57,10 +61,12 @@ class BasicAnimationComponent(AnimationComponent):
     def _update_image(self) -> None:
         """Atualiza a imagem do sprite caso haja mudança de frames."""
         if self.current_frame_index != self._last_frame_index:
-            self._entity.image = self._animation_frames[self.current_frame_index]
-            if self._entity.movement_component.facing_right:
-                self._entity.image = pygame.transform.flip(self._entity.image, True, False)
-            self.rect = self._entity.image.get_rect(
+            self._entity.image = self._animation_frames.get(
+                self.current_frame_index, 
+                mirrored=self._entity.movement_component.facing_right
+            )
+            self.rect = frame_rect(
+                self._entity.image, 
                 centerx=self._entity.rect.centerx, 
                 bottom=self._initial_rect.bottom
             )
\ No newline at end of file
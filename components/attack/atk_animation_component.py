@@ -1,6 +1,7 @@
 import pygame
 from typing import TYPE_CHECKING, Union
 from ..animation.animation_interface import AnimationComponent
+from utils.frame_set import frame_rect
 
 if TYPE_CHECKING:
     from entities.player import Player
@@ -57,13 +58,15 @@ class AttackAnimationComponent(AnimationComponent):
     def _update_entity_image(self) -> None:
         """Atualiza a imagem do entity com base no frame de ataque atual."""
         self.entity.image = self._get_current_frame()
-        if self.entity.movement_component.facing_right:
-            self.entity.image = pygame.transform.flip(self.entity.image, True, False)
-        self.entity.rect = self.entity.image.get_rect(centerx=self.entity.rect.centerx, bottom=self._initial_rect.bottom + 6)
+        self.entity.rect = frame_rect(self.entity.image, centerx=self.entity.rect.centerx, bottom=self._initial_rect.bottom + 6)
 
     def _get_current_frame(self) -> pygame.Surface:
-        """Retorna o frame atual baseado no tipo de ataque."""
-        return self.entity.attack_frames[self.current_frame_index] if self.attack_type == 1 else self.entity.cannon_frames[self.current_frame_index]
+        """Retorna o frame atual baseado no tipo de ataque e na direção da entidade."""
+        frames = self.entity.attack_frames if self.attack_type == 1 else self.entity.cannon_frames
+        return frames.get(
+            self.current_frame_index, 
+            mirrored=self.entity.movement_component.facing_right
+        )
     
     @property
     def attack_type(self) -> int:
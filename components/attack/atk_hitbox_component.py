@@ -1,9 +1,10 @@
 import pygame
-from typing import TYPE_CHECKING, Tuple, Union
+from typing import List, TYPE_CHECKING, Tuple, Union
 
 if TYPE_CHECKING:
     from entities.player import Player
     from entities.mob import Mob
+    from utils.collision_index import CollisionIndex
 
 class AttackHitboxComponent:
     """Gerencia a hitbox de ataques de uma entidade."""
@@ -28,6 +29,10 @@ class AttackHitboxComponent:
         """Verifica se a hitbox atingiu o alvo."""
         return self.attack_hitbox.colliderect(target.rect)
 
+    def targets_in(self, index: 'CollisionIndex') -> List['Mob']:
+        """Retorna os alvos do índice de colisão atingidos pela hitbox."""
+        return index.query_rect(self.attack_hitbox)
+
     def _get_attack_hitbox_size(self, attack_type: int, current_frame_index: int) -> Tuple[int, int]:
         # Retorna o tamanho da hitbox de acordo com o tipo de ataque atual.
         return (
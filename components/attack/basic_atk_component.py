@@ -4,6 +4,7 @@ from .atk_component_interface import AttackComponent
 
 if TYPE_CHECKING:
     from managers.event_manager import EventManager
+    from managers.world import World
     from entities.player import Player
     from entities.mob import Mob
 
@@ -24,7 +25,8 @@ class BasicAttackComponent(AttackComponent):
             attack_duration: int, 
             attack_range: int, 
             attack_sound: pygame.mixer.Sound, 
-            event_manager: 'EventManager'
+            event_manager: 'EventManager',
+            world: 'World'
         ) -> None:
         """Inicializa os atributos para genrenciar os ataques."""
         super().__init__(entity)
@@ -34,6 +36,7 @@ class BasicAttackComponent(AttackComponent):
         self._attack_range = attack_range
         self._attack_sound = attack_sound
         self._event_manager = event_manager
+        self._world = world
         self._attack_feature = (
             self.STATIC_ATTACK if entity.type == 'Soul' else self.ANIMATED_ATTACK
         )
@@ -72,9 +75,8 @@ class BasicAttackComponent(AttackComponent):
 
     def _perform_attack(self) -> None:
         """Verifica colisão com o jogador e inflige dano."""
-        target_sprites = self._event_manager.notify({'type': 'get_player_sprites'})
-        for target in target_sprites:
-            if self._entity.rect.colliderect(target.rect) and not self._hit_target:
+        for target in self._world.player_index.query_rect(self._entity.rect):
+            if not self._hit_target:
                 self._hit_target = True
                 self._set_attacking_image()
                 self.inflict_damage(target, self._attack_damage)
@@ -106,14 +108,9 @@ class BasicAttackComponent(AttackComponent):
 
     def _set_attacking_image(self) -> None:
         """Aplica a imagem de ataque com base na direção da entidade."""
-        if hasattr(self._entity, 'attack_image'):
-            self._entity.image = (self._entity.attack_image if self._entity.direction == 1 
-                                else pygame.transform.flip(self._entity.attack_image, True, False))
-        elif hasattr(self._entity, 'attack_frames'):
-            self._entity.image = (self._entity.attack_frames[0] if self._entity.direction == 1 
-                                else pygame.transform.flip(self._entity.attack_frames[0], True, False))
-        else:
+        if not hasattr(self._entity, 'attack_frames'):
             raise ValueError(f"Imagem de ataque não encontrada para {self._entity}!")
+        self._entity.image = self._entity.attack_frames.get(0, mirrored=self._entity.direction != 1)
 
     def _move_through_target(self, target: Union['Player', 'Mob']) -> None:
         """Move a entidade para atravessar o alvo durante o ataque."""
@@ -125,18 +122,9 @@ class BasicAttackComponent(AttackComponent):
 
     def _reset_attack(self) -> None:
         """Retorna a imagem da entidade à sua imagem padrão."""
-        if hasattr(self._entity, 'default_image'):
-            self._entity.image = (
-                self._entity.default_image if self._entity.direction == 1
-                else pygame.transform.flip(self._entity.default_image, True, False)
-            )
-        elif hasattr(self._entity, 'default_frames'):
-            self._entity.image = (
-                self._entity.default_frames[0] if self._entity.direction == 1 
-                else pygame.transform.flip(self._entity.default_frames[0], True, False)
-            )
-        else:
+        if not hasattr(self._entity, 'default_frames'):
             raise ValueError("Imagem padrão não reconhecida!")
+        self._entity.image = self._entity.default_frames.get(0, mirrored=self._entity.direction != 1)
         self.state = self.IDLE_STATE
         self._attack_progress = 0
         self._hit_target = False
\ No newline at end of file
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from pygame.mixer import Sounds
     from entities.player import Player
     from managers.event_manager import EventManager
+    from managers.world import World
 
 class PlayerAttackComponent(AttackComponent):
     """Gerencia o componente de ataque do player."""
@@ -15,13 +16,15 @@ class PlayerAttackComponent(AttackComponent):
             self, 
             player: 'Player', 
             sounds: Dict[str, 'Sounds'], 
-            event_manager: 'EventManager'
+            event_manager: 'EventManager',
+            world: 'World'
         ) -> None:
         """Inicializa o componente de ataque do Player."""
         super().__init__(player)
         self._player = player
         self._sounds = sounds
         self._event_manager = event_manager
+        self._world = world
         self._attack_animation = AttackAnimationComponent(player)
         self._attack_hitbox = AttackHitboxComponent(player)
         self._hit_targets = set()
@@ -48,12 +51,11 @@ class PlayerAttackComponent(AttackComponent):
 
     def _perform_attack(self) -> None:
         """Verifica a colisão com alvos e inflige dano."""
-        target_sprites = self._event_manager.notify({'type': 'get_mob_sprites'})
         attack_type = self._attack_animation.attack_type
         damage, add_to__hit_targets = self._get_attack_details(attack_type)
         
-        for target in target_sprites:
-            if self._attack_hitbox.hit_target(target) and target not in self._hit_targets:
+        for target in self._attack_hitbox.targets_in(self._world.mob_index):
+            if target not in self._hit_targets:
                 self.inflict_damage(target, damage)
                 self.knockback_target(target)
                 if add_to__hit_targets:
@@ -1,5 +1,5 @@
 import pygame
-from typing import Tuple
+from typing import Dict, Tuple
 from config.constants import BLUE_LIFEBAR
 from core.camera import Camera
 from managers.event_manager import EventManager
@@ -8,8 +8,13 @@ from entities.mob import Mob
 class LifeBarComponent:
     """Gerencia a posição e dimensões da barra de vida com base no status da entidade.
 
-    Desenha a barra de vida na tela.
+    Desenha a barra de vida na tela. As barras são pré-renderizadas (contorno e preenchimento)
+    em superfícies compartilhadas por (largura, altura, cor, pixels preenchidos), de modo que
+    desenhar uma barra custa um blit, que pode ser agrupado com os das demais barras.
     """
+
+    _surfaces: Dict[Tuple[int, int, Tuple[int, int, int], int], pygame.Surface] = {}
+
     def __init__(
             self, 
             entity: Mob, 
@@ -39,7 +44,12 @@ class LifeBarComponent:
             self.width, 
             self.height
         )
-        self.event_manager.subscribe('damage_event', self)
+        self._surface = self._get_surface()
+        self.subscribe_to_events()
+
+    def subscribe_to_events(self) -> None:
+        """Inscreve a barra nos eventos de dano da própria entidade."""
+        self.event_manager.subscribe('damage_event', self, target=self.entity)
 
     def notify(self, event):
         """Chama os métodos inscritos no tipo do evento recebido."""
@@ -50,13 +60,30 @@ class LifeBarComponent:
         """Cria e retorna a barra de vida utilizando as medidas apropriadas."""
         return pygame.Rect(centerx - width // 2, top -15, width, height)
 
-    def draw_life_bar(self, screen: pygame.Surface, camera: Camera):
-        """ Desenha a barra de vida e seu contorno na tela considerando a câmera. """
+    def draw_life_bar(
+            self, 
+            screen: pygame.Surface, 
+            camera: Camera, 
+            offset: Tuple[int, int] = (0, 0)
+        ) -> pygame.Rect:
+        """ Desenha a barra de vida e seu contorno na tela considerando a câmera.
+
+        Retorna a área da tela ocupada pela barra.
+        """
+        return screen.blit(*self.life_bar_blit(camera, offset))
+
+    def life_bar_blit(
+            self, 
+            camera: Camera, 
+            offset: Tuple[int, int] = (0, 0)
+        ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """ Retorna a superfície da barra e sua posição na tela, no formato de 'Surface.blits'. """
         self._update_life_bar_position()
-        outline_pos = camera.apply(self.outline)
-        inner_pos = camera.apply(self.inner)
-        pygame.draw.rect(screen, self.color, inner_pos, border_radius=5)
-        pygame.draw.rect(screen, BLUE_LIFEBAR, outline_pos, width=2, border_radius=5)
+        camera_x, camera_y = camera.camera.topleft
+        return self._surface, (
+            self.outline.x + camera_x + offset[0], 
+            self.outline.y + camera_y + offset[1]
+        )
 
     def update_life_bar(self) -> None:
         """Atualiza a barra de vida da entidade quando houver alteração."""
@@ -68,10 +95,34 @@ class LifeBarComponent:
         else:
             self.inner.width = 0
         self._update_life_bar_position()
+        self._surface = self._get_surface()
 
     def _update_life_bar_position(self) -> None:
         """Atualiza a posição da barra de acordo com a posição da entidade."""
         self.outline.centerx = self.entity_rect.centerx 
         self.inner.centerx = self.entity_rect.centerx
         self.outline.top = self.entity_rect.top -15
-        self.inner.top = self.entity_rect.top -15
\ No newline at end of file
+        self.inner.top = self.entity_rect.top -15
+
+    def _get_surface(self) -> pygame.Surface:
+        # Retorna a barra pré-renderizada para a largura preenchida atual, criando-a se necessário.
+        key = (self.width, self.height, self.color, self.inner.width)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = self._render_surface(*key)
+        return surface
+
+    @staticmethod
+    def _render_surface(
+            width: int, 
+            height: int, 
+            color: Tuple[int, int, int], 
+            fill: int
+        ) -> pygame.Surface:
+        # Desenha o preenchimento (centralizado, como o 'inner') e o contorno em uma superfície transparente.
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        inner = pygame.Rect(0, 0, fill, height)
+        inner.centerx = width // 2
+        pygame.draw.rect(surface, color, inner, border_radius=5)
+        pygame.draw.rect(surface, BLUE_LIFEBAR, surface.get_rect(), width=2, border_radius=5)
+        return surface
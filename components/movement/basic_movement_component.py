@@ -1,10 +1,11 @@
 import pygame
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from .movement_interface import MovementComponent
 from config.constants import LEFT_BOUNDARY, RIGHT_BOUNDARY
 
 if TYPE_CHECKING:
     from managers.event_manager import EventManager
+    from managers.input_manager import InputManager
 
 class BasicMovementComponent(MovementComponent):
     """Componente de movimento para as entidades do jogo.
@@ -15,12 +16,14 @@ class BasicMovementComponent(MovementComponent):
             self: 'BasicMovementComponent', 
             entity_rect: pygame.Rect, 
             movement_speed: int, 
-            event_manager: 'EventManager'
+            event_manager: 'EventManager',
+            input_manager: Optional['InputManager'] = None
         ) -> None:
         super().__init__()
         self.entity_rect = entity_rect
         self.movement_speed = movement_speed
         self.event_manager = event_manager
+        self.input_manager = input_manager
         self.state = self.IDLE_STATE
         self.facing_right = True
         self._subscribe_to_events()
@@ -38,7 +41,10 @@ class BasicMovementComponent(MovementComponent):
         self.limits_movements(LEFT_BOUNDARY, RIGHT_BOUNDARY)
 
     def handle_movements(self, delta_time: float) -> None:
-        keys = pygame.key.get_pressed()
+        keys = (
+            self.input_manager.get_pressed() if self.input_manager 
+            else pygame.key.get_pressed()
+        )
         if keys[pygame.K_a]:
             self.move_left(delta_time)
             self.facing_right = False
@@ -0,0 +1,27 @@
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from entities.mob import Mob
+
+class FloatComponent:
+    """Efeito de flutuação vertical da entidade.
+
+    Oscila o topo do rect em torno de 'base_y' com uma senoide. No modo multidão a
+    CrowdSimulation calcula a flutuação e o componente não altera a posição.
+    """
+
+    def __init__(self, entity: 'Mob', amplitude: float, speed: float, base_y: int) -> None:
+        """Inicializa a amplitude, a velocidade e a fase da flutuação."""
+        self.entity = entity
+        self.amplitude = amplitude
+        self.speed = speed
+        self.base_y = base_y
+        self.offset = 0.0
+
+    def update(self, delta_time: float) -> None:
+        """Avança a fase da flutuação e atualiza a posição 'y' da entidade."""
+        if self.entity.crowd_driven:
+            return
+        self.offset += self.speed * delta_time
+        self.entity.rect.y = int(self.base_y + self.amplitude * math.sin(self.offset))
@@ -1,52 +1,67 @@
+from typing import Optional, Tuple
 from config.constants import LEFT_BOUNDARY, RIGHT_BOUNDARY
 from entities.mob import Mob
 from components.attack.basic_atk_component import BasicAttackComponent
-from managers.event_manager import EventManager
+from managers.world import World
 
 class MobMovementComponent:
-    """Gerencia a movimentação do mob verificando colisões e limites da tela."""
+    """Gerencia a movimentação do mob verificando colisões e limites da tela.
+
+    No modo multidão o movimento é calculado pela CrowdSimulation, que preenche 'crowd_state'
+    com (colidiu, direção); o componente apenas aplica esse resultado no tick.
+    """
+
+    DISTANCE_THRESHOLD = 150  # Distância mínima para considerar colisão
 
     def __init__(
             self, 
             mob: Mob, 
             attack_component: BasicAttackComponent, 
-            event_manager: EventManager
+            world: World
         ) -> None:
         """Inicializa os atributos necessários para gerenciar os movimentos."""
         self.mobs = [mob]
         self.attack_component = attack_component
-        self.event_manager = event_manager
+        self.world = world
         self.facing_right = True
+        self.crowd_state: Optional[Tuple[bool, int]] = None
 
     def handle_collision(self, delta_time: float) -> None:
         """Verifica se houve colisão com o player e lida de acordo."""
+        if self.crowd_state is not None:
+            self._apply_crowd_state(*self.crowd_state)
+            self.crowd_state = None
+            return
         for mob in self.mobs:
             self.move(mob, delta_time) if not self.has_collided(mob) else self.attack_component.attack()
 
     def has_collided(self, mob: Mob) -> bool:
         """Verifica colisão com o jogador considerando uma distância mínima."""
-        player_sprites = self.event_manager.notify({'type': 'get_player_sprites'})
-        if player_sprites:
-            for target in player_sprites:
-                distance_threshold = 150  # Distância mínima para considerar colisão
-                if abs(mob.rect.centerx - target.rect.centerx) <= distance_threshold:
-                    return True
-        return False
+        return bool(self.world.player_index.query_range(mob.rect.centerx, self.DISTANCE_THRESHOLD))
 
     def move(self, mob: Mob, delta_time: float) -> None:
-        """Move o mob e limita o movimento dentro das bordas."""
-        player_sprites = self.event_manager.notify({'type': 'get_player_sprites'})
-        if player_sprites:
-            for player in player_sprites:
-                if mob.rect.centerx <= player.rect.centerx:
-                    mob.direction = 1
-                    mob.rect.x += mob.speed * delta_time
-                    self.facing_right = False
-                elif mob.rect.centerx >= player.rect.centerx:
-                    mob.direction = -1
-                    mob.rect.x -= mob.speed * delta_time
-                    self.facing_right = True
-                self._limit_movements(mob)
+        """Move o mob em direção ao jogador mais próximo e limita o movimento dentro das bordas."""
+        player = self.world.player_index.nearest(mob.rect.centerx)
+        if player is None:
+            return
+        if mob.rect.centerx <= player.rect.centerx:
+            mob.direction = 1
+            mob.rect.x += mob.speed * delta_time
+            self.facing_right = False
+        elif mob.rect.centerx >= player.rect.centerx:
+            mob.direction = -1
+            mob.rect.x -= mob.speed * delta_time
+            self.facing_right = True
+        self._limit_movements(mob)
+
+    def _apply_crowd_state(self, collided: bool, direction: int) -> None:
+        """Ataca ou atualiza a direção conforme o passo da CrowdSimulation, que já moveu o mob."""
+        if collided:
+            self.attack_component.attack()
+        elif direction:
+            for mob in self.mobs:
+                mob.direction = direction
+            self.facing_right = direction != 1
 
     def _limit_movements(self, mob: Mob) -> None:
         """Limita os movimentos do mob dentro da janela do jogo."""
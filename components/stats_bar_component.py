@@ -1,7 +1,13 @@
 import pygame
+from typing import Optional, Tuple
 
 class StatsBarComponent:
-    """Gerencia a barra de stats do Player."""
+    """Gerencia a barra de stats do Player.
+
+    A interface e as duas barras são compostas em uma única superfície, reconstruída apenas
+    quando a vida, a experiência ou a experiência máxima mudam; nos demais quadros o HUD
+    custa um único blit.
+    """
 
     INTERFACE_POSITION = (20, 20)
     LIFE_BAR_POSITION = (150, 76)
@@ -18,26 +24,48 @@ class StatsBarComponent:
         self.life_bar_position = self.LIFE_BAR_POSITION
         self.xp_bar_position = self.XP_BAR_POSITION
         self.max_experience = self.MAX_EXPERIENCE
+        self.area = self.interface.get_rect(topleft=self.interface_position).union(
+            self.life_bar.get_rect(topleft=self.life_bar_position)
+        ).union(self.xp_bar.get_rect(topleft=self.xp_bar_position))
+        self.composite = pygame.Surface(self.area.size, pygame.SRCALPHA)
+        self._composite_key: Optional[Tuple[float, float, float]] = None
         self.event_manager.subscribe('player_up', self)
 
     def notify(self, event) -> None:
         if event['type'] == 'player_up':
             self.max_experience *= 1.5
 
-    def draw_stats_bar(self, screen: pygame.Surface) -> None:
-        """Desenha a interface da barra."""
-        screen.blit(self.interface, self.interface_position)
+    def draw_stats_bar(self, screen: pygame.Surface) -> pygame.Rect:
+        """Desenha a interface da barra e retorna a área da tela ocupada por ela."""
         self.update_bars()
-        self.draw_bars(screen)
+        return screen.blit(self.composite, self.area)
 
     def update_bars(self) -> None:
-        """Atualiza a largura das barras com base nos valores atuais de vida e experiência."""
-        life_width = int(self.life_bar.get_width() * (self.player.life / self.player.MAX_LIFE))
-        xp_width = int(self.xp_bar.get_width() * (self.player.xp / self.max_experience))
-        self.current_life_bar = pygame.transform.scale(self.life_bar, (life_width, self.life_bar.get_height()))
-        self.current_xp_bar = pygame.transform.scale(self.xp_bar, (xp_width, self.xp_bar.get_height()))
-
-    def draw_bars(self, screen: pygame.Surface) -> None:
-        """Desenha a barra de vida e de experiência com base nos valores atuais."""
-        screen.blit(self.current_life_bar, self.life_bar_position)
-        screen.blit(self.current_xp_bar, self.xp_bar_position)
\ No newline at end of file
+        """Recompõe o HUD caso a vida, a experiência ou a experiência máxima tenham mudado."""
+        key = (self.player.life, self.player.xp, self.max_experience)
+        if key == self._composite_key:
+            return
+        self._composite_key = key
+        life_width = self._bar_width(self.life_bar, self.player.life / self.player.MAX_LIFE)
+        xp_width = self._bar_width(self.xp_bar, self.player.xp / self.max_experience)
+        self.composite.fill((0, 0, 0, 0))
+        self.composite.blit(self.interface, self._local(self.interface_position))
+        self.composite.blit(
+            self.life_bar, 
+            self._local(self.life_bar_position), 
+            (0, 0, life_width, self.life_bar.get_height())
+        )
+        self.composite.blit(
+            self.xp_bar, 
+            self._local(self.xp_bar_position), 
+            (0, 0, xp_width, self.xp_bar.get_height())
+        )
+
+    @staticmethod
+    def _bar_width(bar: pygame.Surface, ratio: float) -> int:
+        # Largura visível da barra para a fração informada, limitada ao tamanho da imagem.
+        return max(0, min(bar.get_width(), int(bar.get_width() * ratio)))
+
+    def _local(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        # Converte uma posição da tela para coordenadas da superfície composta.
+        return (position[0] - self.area.x, position[1] - self.area.y)
@@ -9,6 +9,7 @@ RIGHT_BOUNDARY = 3272
 # Diretórios de recursos
 IMAGES_DIR = 'resources/images'
 SOUNDS_DIR = 'resources/sounds'
+ASSET_PACK_PATH = 'resources/frames.pack'
 
 # Cores
 BLACK = (0, 0, 0)
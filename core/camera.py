@@ -1,5 +1,5 @@
 import pygame
-from typing import Union, TYPE_CHECKING
+from typing import Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from entities.player import Player
@@ -17,6 +17,8 @@ class Camera:
         self.height = height
         self.map_width = map_width
         self.map_height = map_height
+        self._position: Optional[Tuple[int, int]] = None
+        self._previous_position: Optional[Tuple[int, int]] = None
 
     def apply(self, entity: Union['Player', 'Mob']) -> pygame.Rect:
         """Aplica a câmera à entidade."""
@@ -24,6 +26,15 @@ class Camera:
             return entity.rect.move(self.camera.topleft)
         return entity.move(self.camera.topleft)
 
+    def visible_area(self, margin: int = 0) -> pygame.Rect:
+        """Retorna a área do mapa visível pela câmera, expandida por 'margin' pixels de cada lado."""
+        return pygame.Rect(
+            -self.camera.x - margin, 
+            -self.camera.y - margin, 
+            self.width + 2 * margin, 
+            self.height + 2 * margin
+        )
+
     def update(self, target: Union['Player', 'Mob']) -> None:
         """Atualiza a posição da câmera com base na posição do alvo."""
         x = -target.rect.centerx + int(self.width / 2)
@@ -32,4 +43,19 @@ class Camera:
         # Limita a câmera aos limites do mapa
         x = max(min(x, 0), -(self.map_width - self.width))  # Lados esquerdo e direito
         y = max(min(y, 0), -(self.map_height - self.height))  # Parte superior e inferior
-        self.camera = pygame.Rect(x, y, self.width, self.height)
\ No newline at end of file
+        self._previous_position = self._position or (x, y)
+        self._position = (x, y)
+        self.camera = pygame.Rect(x, y, self.width, self.height)
+
+    def interpolate(self, alpha: float) -> None:
+        """Posiciona a câmera entre as posições dos dois últimos ticks para a renderização."""
+        if self._position is None:
+            return
+        previous_x, previous_y = self._previous_position
+        x, y = self._position
+        self.camera = pygame.Rect(
+            round(previous_x + (x - previous_x) * alpha), 
+            round(previous_y + (y - previous_y) * alpha), 
+            self.width, 
+            self.height
+        )
\ No newline at end of file
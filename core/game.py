@@ -1,32 +1,91 @@
 # Imports
+import os
+import time
 import pygame
 import traceback
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 # Imports internos
 from managers.screen_manager import ScreenManager
 from managers.resource_manager import ResourceManager
 from managers.event_manager import EventManager
 from managers.sprite_manager import SpriteManager
+from managers.input_manager import InputManager
+from managers.input_recording import InputRecorder, InputReplay
+from managers.service_registry import ServiceRegistry
+from managers.world import World
+from managers.dirty_rect_renderer import DirtyRectRenderer
+from managers.crowd_simulation import CrowdSimulation
+from managers.frame_profiler import FrameProfiler, FrameOverlay
+from managers.frame_cache import FrameCache
 from core.camera import Camera
 from entities.player_factory import PlayerFactory
 from entities.mob_factory import MobFactory
+from config.constants import ASSET_PACK_PATH
 
 class Game:
     """Classe principal. Coordena o ciclo do jogo. 
     
     É responsável pela inicialização, atualização e exibição dos elementos do jogo. 
+    No modo headless não abre janela nem emite áudio (drivers 'dummy' do SDL), não desenha
+    e não limita o FPS, permitindo avançar a simulação tick a tick com 'step'.
+    Com 'dirty_rects', cada quadro redesenha apenas as áreas alteradas da tela; com 'crowd',
+    os mobs são movidos em lote pela CrowdSimulation (requer numpy); com 'asset_pack', os
+    frames vêm já recortados do pacote mapeado em memória. As entradas podem ser
+    gravadas e reproduzidas de forma determinística ('record_inputs' e 'replay_inputs').
+    O tempo de cada etapa do quadro é medido pelo FrameProfiler ('frame_stats') e pode ser
+    exibido na tela com F3.
     """
     
     FPS = 60
     MAP_WIDTH = 3072
     MAP_HEIGHT = 768
-    FIXED_DELTA_TIME = 0.016
+    FIXED_DELTA_TIME = 1 / FPS
+    MAX_FRAME_TIME = 0.25
+    MAX_STEPS_PER_FRAME = 5
+    MOB_PREWARM = {'Soul': 2, 'Troll': 2}
 
-    def __init__(self) -> None:
-        """Inicializa a biblioteca pygame e os componentes do jogo."""
+    def __init__(
+            self, 
+            headless: bool = False, 
+            fps_cap: int = FPS, 
+            dirty_rects: bool = False, 
+            crowd: bool = False, 
+            asset_pack: bool = False, 
+            memory_budget: Optional[int] = None, 
+            frame_views: bool = False
+        ) -> None:
+        """Inicializa a biblioteca pygame e os componentes do jogo.
+
+        Args:
+        - headless: Executa sem janela, sem áudio e sem desenhar.
+        - fps_cap: Limite de quadros renderizados por segundo (0 para não limitar).
+        - dirty_rects: Usa a renderização por retângulos sujos em vez de redesenhar a tela inteira.
+        - crowd: Move os mobs com a simulação vetorizada de multidão.
+        - asset_pack: Carrega os frames já recortados do pacote mapeado em memória.
+        - memory_budget: Limite, em bytes, para as imagens mantidas pelo ResourceManager.
+        - frame_views: Usa frames que compartilham os pixels dos spritesheets, com um cache
+          de frames próprio (o cache compartilhado guarda cópias).
+        """
+        self._headless = headless
+        self._fps_cap = fps_cap
+        self._dirty_rects = dirty_rects
+        self._crowd = crowd
+        self._asset_pack = asset_pack
+        self._memory_budget = memory_budget
+        self._frame_views = frame_views
+        self._fast_forward = False
+        self._created = time.perf_counter()
+        self._time_to_first_frame: Optional[float] = None
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
         pygame.init()
         self._running = False
         self._menu = False
+        self._tick = 0
+        self._simulation_time = 0.0
+        self._accumulator = 0.0
         self._initialize_managers()
         self._initialize_factories()
         self._initialize_entities()
@@ -34,27 +93,53 @@ class Game:
     def _initialize_managers(self) -> None:
         """Inicializa os gerenciadores do loop principal."""
         self._screen_manager = ScreenManager()
-        self._resource_manager = ResourceManager()
+        self._resource_manager = ResourceManager(
+            asset_pack=ASSET_PACK_PATH if self._asset_pack else None, 
+            animations=SpriteManager.ANIMATIONS, 
+            memory_budget=self._memory_budget
+        )
         self._event_manager = EventManager()
-        self._sprite_manager = SpriteManager(self._resource_manager, self._event_manager)
+        self._input_manager = InputManager()
+        self._frame_profiler = FrameProfiler()
+        self._frame_overlay = FrameOverlay(self._frame_profiler)
+        self._sprite_manager = SpriteManager(
+            self._resource_manager, 
+            self._event_manager, 
+            frame_cache=FrameCache() if self._frame_views else None, 
+            profiler=self._frame_profiler, 
+            frame_views=self._frame_views
+        )
+        self._world = World(self._sprite_manager)
+        self._services = ServiceRegistry()
+        self._services.register(InputManager, self._input_manager)
+        self._services.register(World, self._world)
         self._camera = Camera(
             width=self._screen_manager.screen.get_width(), 
             height=self._screen_manager.screen.get_height(), 
             map_width=self.MAP_WIDTH, 
             map_height=self.MAP_HEIGHT
         )
+        self._dirty_rect_renderer = DirtyRectRenderer(
+            self._screen_manager, 
+            self._resource_manager, 
+            self._sprite_manager
+        ) if self._dirty_rects else None
+        if self._crowd:
+            self._sprite_manager.crowd_simulation = CrowdSimulation(self._world)
 
     def _initialize_factories(self) -> None:
         """Inicializa as fábricas de entidades."""
         self._player_factory = PlayerFactory(
             self._event_manager, 
             self._resource_manager, 
-            self._sprite_manager
+            self._sprite_manager,
+            self._services
         )
         self._mob_factory = MobFactory(
             self._event_manager, 
             self._resource_manager, 
-            self._sprite_manager
+            self._sprite_manager,
+            self._services
         )
 
     def _initialize_entities(self) -> None:
@@ -62,28 +147,178 @@ class Game:
         self._player = self._player_factory.create_player()
         self._mob_factory.create_mob("Soul")
         self._mob_factory.create_mob("Troll")
+        self._mob_factory.prewarm(self.MOB_PREWARM)
 
     def menu(self):
         """Inicia o menu do jogo."""
         self._menu = True
 
-    def run(self) -> None:
-        """Inicia o ciclo principal do jogo."""
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        """Inicia o ciclo principal do jogo.
+
+        Args:
+        - max_ticks: Número máximo de ticks a executar. Obrigatório no modo headless, exceto
+          durante um replay, que termina com a gravação.
+        """
+        replay = self._input_manager.replay
+        if replay is not None and max_ticks is None:
+            max_ticks = replay.length
+        if self._headless and max_ticks is None:
+            raise ValueError('O modo headless requer um número máximo de ticks.')
         self._running = True
+        self._screen_manager.clock.tick()
+        started = time.perf_counter()
         try:
-            while self._running:
-                self._game_loop()
+            while self._running and (max_ticks is None or self._tick < max_ticks):
+                self.step() if self._headless else self._game_loop()
         except Exception as e:
             self._handle_exception(e)
         finally:
+            self._input_manager.stop_recording(self._tick)
+            if self._headless:
+                stats = self._frame_profiler.stats()
+                print(f'{self._tick} ticks a {self.ticks_per_second:.0f} ticks/s (p95 {stats["p95_ms"]:.2f} ms)')
+            elif replay is not None:
+                elapsed = time.perf_counter() - started
+                print(f'Replay: {self._tick} ticks em {elapsed:.2f}s ({self._tick / elapsed:.0f} ticks/s)')
             pygame.quit()
 
-    def _game_loop(self) -> None:
-        """Executa o ciclo do loop principal do jogo chamando os métodos correspondentes."""
-        self._screen_manager.clock.tick(self.FPS)
-        self._handle_events()
+    def record_inputs(self, path: str) -> None:
+        """Grava as entradas de cada tick no arquivo informado."""
+        self._input_manager.start_recording(InputRecorder(path, self.FPS))
+
+    def replay_inputs(self, path: str, fast_forward: bool = False) -> None:
+        """Reproduz as entradas gravadas no arquivo informado.
+
+        Args:
+        - fast_forward: Simula um tick por quadro, sem esperar o relógio, em vez do tempo real.
+        """
+        replay = InputReplay(path)
+        if replay.ticks_per_second != self.FPS:
+            raise ValueError(f'Replay gravado a {replay.ticks_per_second} ticks/s; o jogo usa {self.FPS}.')
+        self._input_manager.start_replay(replay)
+        if fast_forward:
+            self._fast_forward = True
+            self._fps_cap = 0
+
+    def step(self, inputs: Iterable[int] = ()) -> Dict[str, Any]:
+        """Avança a simulação em um tick e retorna a observação do novo estado.
+
+        Args:
+        - inputs: Teclas (constantes 'pygame.K_*') pressionadas durante o tick.
+        """
+        started = time.perf_counter()
+        self._frame_profiler.begin_frame()
+        self._input_manager.set_pressed(inputs)
         self._update(self.FIXED_DELTA_TIME)
-        self._draw()
+        self._frame_profiler.end_frame()
+        self._simulation_time += time.perf_counter() - started
+        return self.observe()
+
+    def observe(self) -> Dict[str, Any]:
+        """Retorna um resumo compacto do estado atual da simulação."""
+        return {
+            'tick': self._tick,
+            'player': {
+                'x': self._player.rect.centerx,
+                'y': self._player.rect.centery,
+                'life': self._player.life,
+                'xp': self._player.xp,
+                'level': self._player.level_manager.level,
+                'alive': self._player.alive()
+            },
+            'mobs': [
+                {'type': mob.type, 'x': mob.rect.centerx, 'y': mob.rect.centery, 'life': mob.life}
+                for mob in self._sprite_manager.mob_sprites
+            ]
+        }
+
+    @property
+    def tick(self) -> int:
+        """Número de ticks simulados desde o início."""
+        return self._tick
+
+    def frame_stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas de tempo dos últimos quadros (ou ticks, no modo headless).
+
+        Veja 'FrameProfiler.stats'.
+        """
+        return self._frame_profiler.stats()
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Retorna a memória ocupada pelas imagens residentes e pelos frames recortados.
+
+        'formats' traz o caminho de blit dos frames de cada spritesheet ('FrameCache.format_report').
+        """
+        return {
+            'images': self._resource_manager.memory_report(),
+            'frames': self._sprite_manager.frame_cache.stats(),
+            'formats': self._sprite_manager.frame_cache.format_report()
+        }
+
+    def toggle_frame_overlay(self) -> None:
+        """Mostra ou oculta o painel com as estatísticas de tempo dos quadros."""
+        self._frame_overlay.toggle()
+
+    @property
+    def time_to_first_frame(self) -> Optional[float]:
+        """Segundos entre a criação do jogo e a exibição do primeiro quadro (None até lá)."""
+        return self._time_to_first_frame
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Taxa média de ticks simulados por segundo (apenas tempo de atualização)."""
+        return self._tick / self._simulation_time if self._simulation_time else 0.0
+
+    @classmethod
+    def fixed_steps(cls, accumulator: float, frame_time: float) -> Tuple[int, float]:
+        """Soma o tempo do quadro ao acumulador e o consome em passos fixos de simulação.
+
+        O tempo do quadro é limitado a 'MAX_FRAME_TIME' e o número de passos, a
+        'MAX_STEPS_PER_FRAME'; ao atingir esse limite, o atraso que não pôde ser simulado é
+        descartado e só a fração de passo é mantida. O acumulador restante é sempre menor que
+        'FIXED_DELTA_TIME', de modo que a interpolação fica em [0, 1).
+
+        Returns:
+        - O número de passos a simular e o novo valor do acumulador.
+        """
+        accumulator += min(frame_time, cls.MAX_FRAME_TIME)
+        steps = 0
+        while accumulator >= cls.FIXED_DELTA_TIME and steps < cls.MAX_STEPS_PER_FRAME:
+            accumulator -= cls.FIXED_DELTA_TIME
+            steps += 1
+        if accumulator >= cls.FIXED_DELTA_TIME:
+            # Descarta o atraso acumulado que não pôde ser simulado neste quadro
+            accumulator %= cls.FIXED_DELTA_TIME
+        return steps, accumulator
+
+    def _game_loop(self) -> None:
+        """Executa o ciclo do loop principal do jogo chamando os métodos correspondentes.
+
+        O tempo medido do quadro alimenta um acumulador consumido em passos fixos de
+        simulação. O número de passos por quadro é limitado para evitar a espiral da morte,
+        e o resto do acumulador define a interpolação usada ao desenhar.
+        """
+        frame_time = self._screen_manager.clock.tick(self._fps_cap) / 1000
+        if self._fast_forward:
+            # Um tick por quadro, tão rápido quanto possível
+            frame_time = self.FIXED_DELTA_TIME
+        steps, self._accumulator = self.fixed_steps(self._accumulator, frame_time)
+        self._frame_profiler.begin_frame()
+        with self._frame_profiler.section('events'):
+            self._handle_events()
+        self._input_manager.poll()
+        for _ in range(steps):
+            self._update(self.FIXED_DELTA_TIME)
+        with self._frame_profiler.section('draw'):
+            self._draw(self._accumulator / self.FIXED_DELTA_TIME)
+        self._frame_profiler.end_frame()
+        if self._time_to_first_frame is None:
+            self._time_to_first_frame = time.perf_counter() - self._created
+            print(
+                f'Primeiro quadro em {self._time_to_first_frame:.2f}s '
+                f'(recursos: {self._resource_manager.load_time:.2f}s)'
+            )
 
     def _handle_events(self) -> None:
         """Lida com os eventos do jogo/resposta de comandos."""
@@ -92,22 +327,52 @@ class Game:
                 self._running = False
             if event.type == pygame.KEYDOWN:
                 self._handle_keydown(event)
+            if event.type == pygame.WINDOWEXPOSED and self._dirty_rect_renderer:
+                self._dirty_rect_renderer.invalidate()
 
     def _handle_keydown(self, event: pygame.event.Event) -> None:
         """Lida com as teclas pressionadas chamando suas respectivas funções."""
         if event.key == pygame.K_r:
-            self._sprite_manager.reset_game()
+            self._input_manager.request_reset()
+        if event.key == pygame.K_F3:
+            self.toggle_frame_overlay()
 
     def _update(self, delta_time: float) -> None:
         """Atualiza os sprites e a câmera."""
-        self._sprite_manager.update_all(delta_time)
-        self._camera.update(self._player)
+        with self._frame_profiler.section('update'):
+            if self._input_manager.begin_tick(self._tick):
+                self._sprite_manager.reset_game()
+                self._refresh_player()
+            self._world.begin_tick()
+            self._sprite_manager.store_previous_positions()
+            self._sprite_manager.update_all(delta_time)
+            self._camera.update(self._player)
+        self._tick += 1
+
+    def _refresh_player(self) -> None:
+        """Passa a acompanhar o player atual (o reset cria um novo se o anterior morreu)."""
+        for player in self._sprite_manager.player_sprites:
+            self._player = player
+
+    def _draw(self, alpha: float = 1.0) -> None:
+        """Desenha os elementos do jogo e atualiza a tela.
 
-    def _draw(self) -> None:
-        """Desenha os elementos do jogo e atualiza a tela."""
+        Args:
+        - alpha: Fração do passo fixo já decorrida, usada para interpolar as posições.
+        """
+        self._camera.interpolate(alpha)
+        overlay = self._frame_overlay.draw if self._frame_overlay.visible else None
+        if self._dirty_rect_renderer:
+            self._dirty_rect_renderer.draw(self._camera, alpha, overlay)
+            return
+        screen = self._screen_manager.screen
         self._screen_manager.draw_window(self._resource_manager, self._camera)
-        self._sprite_manager.draw_all(self._screen_manager.screen, self._camera)
-        pygame.display.flip()
+        with self._frame_profiler.section('draw.sprites'):
+            self._sprite_manager.draw_all(screen, self._camera, alpha)
+        if overlay is not None:
+            overlay(screen)
+        with self._frame_profiler.section('draw.flip'):
+            pygame.display.flip()
 
     def _handle_exception(self, e: Exception, **kwargs) -> None:
         """Trata diferentes tipos de exceções e fornece logs detalhados."""
@@ -18,6 +18,11 @@ class LevelManager:
         self._upgrade_points = 0
         self._event_manager.subscribe('mob_defeated', self)
 
+    @property
+    def level(self) -> int:
+        """Retorna o nível atual do jogador."""
+        return self._level
+
     def add_experience(self, amount: int) -> None:
         """Adiciona xp e verifica se atingiu o próximo nível."""
         self.player.xp += amount
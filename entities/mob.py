@@ -1,22 +1,45 @@
 import pygame
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from managers.event_manager import EventManager
     from core.camera import Camera
+    from managers.world import World
+    from utils.frame_set import FrameSet
 
 class Mob(ABC, pygame.sprite.Sprite):
     """Classe abstrata para representar e gerenciar mobs no jogo.
 
     Define comportamentos comuns para mobs, como movimento, 
-    combate e interação com outros componentes do jogo.
+    combate e interação com outros componentes do jogo. Os mobs não
+    têm 'update' próprio: são atualizados pelos sistemas do EntityStore,
+    a partir dos componentes expostos em 'components()'.
+
+    Limitação: os tipos de mob ainda são subclasses de Mob (Soul, Troll) que
+    criam seus componentes em 'initialize_components', e o EntityStore os
+    encontra pelos nomes de atributo de 'COMPONENT_ATTRIBUTES'. Um novo tipo
+    de mob continua exigindo uma subclasse que use esses nomes; a montagem
+    de mobs apenas por composição de componentes, na MobFactory, não foi feita.
     """
 
-    def __init__(self, event_manager: 'EventManager') -> None:
+    frame_sets: Tuple['FrameSet', ...] = ()
+    event_listeners: Tuple[object, ...] = ()
+    crowd_driven = False  # Movido pela CrowdSimulation (modo multidão)
+    COMPONENT_ATTRIBUTES = {
+        'movement': 'movement_component', 
+        'attack': 'attack_component', 
+        'float': 'float_component', 
+        'life_bar': 'life_bar_component', 
+        'animation': 'animation_component'
+    }
+
+    def __init__(self, event_manager: 'EventManager', world: 'World') -> None:
         super().__init__()
         self._event_manager = event_manager
+        self._world = world
         self._direction = 1 # 1 for left, -1 for right
+        self._rendered_direction = self._direction
 
     @abstractmethod
     def initialize_image_attributes(self):
@@ -33,18 +56,52 @@ class Mob(ABC, pygame.sprite.Sprite):
         """Inicializa os componentes utilizados pelo Mob."""
         raise NotImplementedError('As subclasses de "Mob" devem implementar este método.')
 
-    def draw_life_bar(self, screen: pygame.Surface, camera: 'Camera') -> None:
-        """Desenha a barra de vida do mob de acordo com a posição."""
-        self.life_bar_component.draw_life_bar(screen, camera)
-
-    def update(self, delta_time: float) -> None:
-        """Atualiza a direção, o movimento, os ataques e a barra de vida do mob."""
-        previous_direction = self._direction
-        self.movement_component.handle_collision(delta_time)
-        self.attack_component.update()
-        self.life_bar_component.update_life_bar()
-        if self._direction != previous_direction:
-            self.image = pygame.transform.flip(self.image, True, False)
+    def draw_life_bar(
+            self, 
+            screen: pygame.Surface, 
+            camera: 'Camera', 
+            offset: Tuple[int, int] = (0, 0)
+        ) -> pygame.Rect:
+        """Desenha a barra de vida do mob de acordo com a posição e retorna a área ocupada."""
+        return self.life_bar_component.draw_life_bar(screen, camera, offset)
+
+    def life_bar_blit(
+            self, 
+            camera: 'Camera', 
+            offset: Tuple[int, int] = (0, 0)
+        ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Retorna a barra de vida do mob e sua posição na tela, para desenho em lote."""
+        return self.life_bar_component.life_bar_blit(camera, offset)
+
+    def components(self) -> Dict[str, object]:
+        """Retorna os componentes do mob por tipo, usados para montá-lo no EntityStore.
+
+        Os componentes são lidos dos atributos listados em 'COMPONENT_ATTRIBUTES' (os
+        ausentes são ignorados), de modo que uma subclasse define o arquétipo pelos
+        componentes que cria com esses nomes; o tipo 'orientation' (o próprio mob) espelha
+        a imagem quando a direção muda.
+        """
+        components = {
+            kind: getattr(self, attribute) 
+            for kind, attribute in self.COMPONENT_ATTRIBUTES.items() 
+            if hasattr(self, attribute)
+        }
+        components['orientation'] = self
+        return components
+
+    def sync_orientation(self) -> None:
+        """Espelha a imagem do mob caso sua direção tenha mudado desde o último tick."""
+        if self._direction != self._rendered_direction:
+            self._rendered_direction = self._direction
+            self.image = self._mirror_image(self.image)
+
+    def _mirror_image(self, image: pygame.Surface) -> pygame.Surface:
+        # Retorna a variante espelhada pré-calculada da imagem, se pertencer a um dos frame_sets.
+        for frames in self.frame_sets:
+            mirrored = frames.mirror(image)
+            if mirrored is not None:
+                return mirrored
+        return pygame.transform.flip(image, True, False)
 
     def receive_damage(self, damage: int) -> None:
         """Recebe a quantidade de dano e notifica os listeners."""
@@ -65,10 +122,18 @@ class Mob(ABC, pygame.sprite.Sprite):
         self.death_sound.play()
         self._event_manager.notify({'type': 'mob_defeated', 'xp_points': self.xp_points})
 
+    def kill(self) -> None:
+        """Remove o mob dos grupos e cancela as inscrições de seus componentes."""
+        super().kill()
+        for listener in self.event_listeners:
+            self._event_manager.unsubscribe_all(listener)
+
     def reset(self) -> None:
-        """Reseta o mob para seu estado inicial padrão e emite o evento de reset."""
+        """Reseta o mob para seu estado inicial padrão, reinscreve seus componentes e emite o evento de reset."""
         self.life = self.MAX_LIFE
         self.rect.center = self.INITIAL_POSITION
+        for listener in self.event_listeners:
+            listener.subscribe_to_events()
         self._event_manager.notify({'type': 'mob_reset', 'target': self})
 
     @property
@@ -1,14 +1,16 @@
-import pygame
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 from entities.soul import Soul
 from entities.troll import Troll
 from utils.object_pool import ObjectPool
+from managers.world import World
 
 if TYPE_CHECKING:
     from managers.event_manager import EventManager
     from managers.resource_manager import ResourceManager
     from managers.sprite_manager import SpriteManager
+    from managers.service_registry import ServiceRegistry
     from entities.mob import Mob
+    from utils.frame_set import FrameSet
 
 class MobFactory:
     """Fabrica os mobs do jogo."""
@@ -16,13 +18,15 @@ class MobFactory:
             self, 
             event_manager: 'EventManager', 
             resource_manager: 'ResourceManager', 
-            sprite_manager: 'SpriteManager'
+            sprite_manager: 'SpriteManager',
+            services: 'ServiceRegistry'
         ) -> None:
         """Inicializa a factory para criação de mobs."""
         self.event_manager = event_manager
         self.resource_manager = resource_manager
         self.sprite_manager = sprite_manager
-        self.mob_pool = ObjectPool(self.create_mob)
+        self.world = services.get(World)
+        self.mob_pool = ObjectPool(self._build_mob)
         self.event_manager.subscribe('release_mob', self)
         self.event_manager.subscribe('get_mob', self)
 
@@ -32,7 +36,14 @@ class MobFactory:
         Implementa dicionários com imagens e sons específicos para o mob.
         Adiciona o mob ao grupo de sprite em sprite_manager, e por fim o retona.
         """
-        return self._create_soul() if name == 'Soul' else self._create_troll()
+        mob = self._build_mob(name)
+        self.sprite_manager.add_mob(mob)
+        return mob
+
+    def prewarm(self, counts: Dict[str, int]) -> None:
+        """Cria antecipadamente mobs ociosos no pool, por tipo, para uso durante o combate."""
+        for name, count in counts.items():
+            self.mob_pool.prewarm(name, count)
 
     def notify(self, event: Dict[str, Any]) -> Optional['Mob']:
         """Notifica os métodos inscritos nos eventos."""
@@ -42,26 +53,26 @@ class MobFactory:
             return self._get_mob(event['name'])
         return None
 
+    def _build_mob(self, name: str) -> 'Mob':
+        # Constrói o mob sem adicioná-lo aos grupos de sprites (usado também pelo pool).
+        return self._create_soul() if name == 'Soul' else self._create_troll()
+
     def _create_soul(self) -> 'Mob':
         # Cria um Soul com recursos específicos e o retorna.
         images, sounds = self._get_resources('Soul')
-        soul = Soul("Soul", images, sounds, self.event_manager)
-        self.sprite_manager.add_mob(soul)
-        return soul
+        return Soul("Soul", images, sounds, self.event_manager, self.world)
 
     def _create_troll(self) -> 'Mob':
         # Cria um Troll com recursos específicos e o retorna.
         images, sounds = self._get_resources('Troll')
-        troll = Troll('Troll', images, sounds, self.event_manager)
-        self.sprite_manager.add_mob(troll)
-        return troll
+        return Troll('Troll', images, sounds, self.event_manager, self.world)
     
-    def _get_resources(self, name: str) -> Dict[str, pygame.Surface | list]:
+    def _get_resources(self, name: str) -> Dict[str, 'FrameSet']:
         # Obtém os recursos necessários para criar o mob.
         if name == 'Soul':
             images = {
-                'default': self.resource_manager.get_image('soul_default'),
-                'attacking': self.resource_manager.get_image('soul_attacking')
+                'default': self.sprite_manager.get_frames('soul_default'),
+                'attacking': self.sprite_manager.get_frames('soul_attacking')
             }
             sounds = {
                 'blood_pop': self.resource_manager.get_sound('blood_pop'),
@@ -78,14 +89,14 @@ class MobFactory:
             }
         return images, sounds
     
-    def _get_troll_images(self) -> Dict[str, list]:
-        # Obtém as imagens específicas do Troll.
+    def _get_troll_images(self) -> Dict[str, 'FrameSet']:
+        # Obtém as imagens específicas do Troll (recortadas uma única vez por processo).
         troll_spritesheets = {
-            'idle': self.resource_manager.get_image('troll_idle_spritesheet'),
-            'attack': self.resource_manager.get_image('troll_attack_spritesheet'),
-            'damage': self.resource_manager.get_image('troll_damage_spritesheet'),
-            'death': self.resource_manager.get_image('troll_death_spritesheet'),
-            'spawn': self.resource_manager.get_image('troll_spawn_spritesheet')
+            'idle': 'troll_idle_spritesheet',
+            'attack': 'troll_attack_spritesheet',
+            'damage': 'troll_damage_spritesheet',
+            'death': 'troll_death_spritesheet',
+            'spawn': 'troll_spawn_spritesheet'
         }
         troll_sprites = {
             'idle_frames': self._get_sprites(troll_spritesheets['idle'], 'idle'),
@@ -96,21 +107,15 @@ class MobFactory:
         }
         return troll_sprites
 
-    def _get_sprites(
-            self, 
-            spritesheet: pygame.Surface, 
-            animation_type: str
-        ) -> List[pygame.Surface]:
-        # Extrai sprites de um spritesheet com base no tipo de animação fornecido.
+    def _get_sprites(self, sheet_name: str, animation_type: str) -> 'FrameSet':
+        # Obtém os frames de um spritesheet com base no tipo de animação fornecido.
         coords = self.sprite_manager.troll_sprite_coords.get(animation_type, [])
         if not coords:
             raise ValueError(f'Coordenadas não encontradas para {animation_type}')
-        return [
-            self.sprite_manager.get_sprite(spritesheet, *coord) for coord in coords
-        ]
+        return self.sprite_manager.get_frames(sheet_name, coords)
 
     def _get_mob(self, name: str) -> 'Mob':
-        return self.mob_pool.get(name)
+        return self.mob_pool.get(name=name)
 
     def _release_mob(self, mob: 'Mob') -> None:
         self.mob_pool.release(mob)
\ No newline at end of file
@@ -2,11 +2,14 @@ import pygame
 from typing import Dict
 
 from managers.event_manager import EventManager
+from managers.input_manager import InputManager
+from managers.world import World
 from components.animation.basic_animation_component import BasicAnimationComponent
 from components.attack.player_atk_component import PlayerAttackComponent
 from components.movement.basic_movement_component import BasicMovementComponent
 from components.stats_bar_component import StatsBarComponent
 from entities.level_manager import LevelManager
+from utils.frame_set import FrameSet, frame_rect
 
 class Player(pygame.sprite.Sprite):
     """Uma classe para representar o jogador."""
@@ -21,9 +24,11 @@ class Player(pygame.sprite.Sprite):
 
     def __init__(
             self: 'Player', 
-            images: Dict[str, pygame.Surface], 
+            images: Dict[str, pygame.Surface | FrameSet], 
             sounds: Dict[str, pygame.mixer.Sound], 
-            event_manager: EventManager
+            event_manager: EventManager,
+            input_manager: InputManager,
+            world: World
         ) -> None:
         """Inicializa um novo jogador e configura seus atributos.""" 
         super().__init__()
@@ -31,6 +36,8 @@ class Player(pygame.sprite.Sprite):
         self.images = images
         self.sounds = sounds
         self.event_manager = event_manager
+        self.input_manager = input_manager
+        self.world = world
         self._life = self.MAX_LIFE
         self.strength = self.INITIAL_STRENGTH
         self.speed = self.MOVE_SPEED
@@ -45,7 +52,7 @@ class Player(pygame.sprite.Sprite):
         self.attack_frames = self.images['attacking']
         self.cannon_frames = self.images['cannon']
         self.image = self.idle_frames[0]
-        self.rect = self.image.get_rect(center = self.INITIAL_POSITION)
+        self.rect = frame_rect(self.image, center = self.INITIAL_POSITION)
 
     def _initialize_combat_attributes(self) -> None:
         """Inicializa os atributos de combate do Player."""
@@ -67,7 +74,8 @@ class Player(pygame.sprite.Sprite):
                 'attack_sound_2': self.attack_sound_2, 
                 'cannon_sound': self.cannon_sound
             }, 
-            event_manager=self.event_manager
+            event_manager=self.event_manager,
+            world=self.world
         )
         self.stats_bar_component = StatsBarComponent(
             player=self, 
@@ -79,7 +87,8 @@ class Player(pygame.sprite.Sprite):
         self.movement_component = BasicMovementComponent(
             entity_rect=self.rect, 
             movement_speed=self.speed, 
-            event_manager=self.event_manager
+            event_manager=self.event_manager,
+            input_manager=self.input_manager
         )
         self.animation_component = BasicAnimationComponent(
             entity=self, 
@@ -87,10 +96,16 @@ class Player(pygame.sprite.Sprite):
             event_manager=self.event_manager
         )
         self.level_manager = LevelManager(self, self.event_manager)
+        self.event_listeners = (
+            self.stats_bar_component, 
+            self.movement_component, 
+            self.animation_component, 
+            self.level_manager
+        )
 
-    def draw_stats_bar(self, screen: pygame.Surface) -> None:
-        """Desenha a barra de stats do jogador."""
-        self.stats_bar_component.draw_stats_bar(screen)
+    def draw_stats_bar(self, screen: pygame.Surface) -> pygame.Rect:
+        """Desenha a barra de stats do jogador e retorna a área ocupada."""
+        return self.stats_bar_component.draw_stats_bar(screen)
 
     def update(self, delta_time: float) -> None:
         """Atualiza o estado do jogador."""
@@ -100,7 +115,7 @@ class Player(pygame.sprite.Sprite):
 
     def handle_events(self) -> None:
         """Lida com os eventos do jogador, como ataques."""
-        keys = pygame.key.get_pressed()
+        keys = self.input_manager.get_pressed()
         if keys[pygame.K_SPACE]:
             self.attack_component.attack(1)
         if keys[pygame.K_LCTRL]:
@@ -118,6 +133,12 @@ class Player(pygame.sprite.Sprite):
         """Lida com os efeitos de game over."""
         self.death_sound.play()
 
+    def kill(self) -> None:
+        """Remove o jogador dos grupos e cancela as inscrições de seus componentes."""
+        super().kill()
+        for listener in self.event_listeners:
+            self.event_manager.unsubscribe_all(listener)
+
     def reset(self) -> None:
         """Reseta a posição e vida do jogador."""
         self.rect.center = self.INITIAL_POSITION
@@ -1,12 +1,16 @@
 from typing import Any, Dict, TYPE_CHECKING
 from entities.player import Player
+from managers.input_manager import InputManager
+from managers.world import World
 
 if TYPE_CHECKING:
     from pygame.surface import Surface
     from pygame.mixer import Sound
     from managers.event_manager import EventManager
+    from managers.service_registry import ServiceRegistry
     from managers.resource_manager import ResourceManager
     from managers.sprite_manager import SpriteManager
+    from utils.frame_set import FrameSet
 
 class PlayerFactory:
     """Classe para fabricar jogadores."""
@@ -15,12 +19,15 @@ class PlayerFactory:
             self: 'PlayerFactory', 
             event_manager: 'EventManager', 
             resource_manager: 'ResourceManager', 
-            sprite_manager: 'SpriteManager'
+            sprite_manager: 'SpriteManager',
+            services: 'ServiceRegistry'
         ) -> None:
-        """Inicializa os managers necessários para a criação do Player."""
+        """Inicializa os managers e serviços necessários para a criação do Player."""
         self.event_manager = event_manager
         self.resource_manager = resource_manager
         self.sprite_manager = sprite_manager
+        self.input_manager = services.get(InputManager)
+        self.world = services.get(World)
         self.event_manager.subscribe(event_type='create_player', listener=self)
 
     def create_player(self) -> Player:
@@ -31,7 +38,7 @@ class PlayerFactory:
         """
         images = self._load_images()
         sounds = self._load_sounds()
-        player = Player(images, sounds, self.event_manager)
+        player = Player(images, sounds, self.event_manager, self.input_manager, self.world)
         self.sprite_manager.add_player(player)
         return player
 
@@ -40,26 +47,18 @@ class PlayerFactory:
         if event['type'] == 'create_player':
             return self.create_player()
         
-    def _load_images(self) -> Dict[str, 'Surface']:
-        spritesheet = self.resource_manager.get_image('player_spritesheet')
-        attack_spritesheet = self.resource_manager.get_image('player_attacking')
-        cannon_attack = self.resource_manager.get_image('cannon_attack')
-        player_sprites = [
-            self.sprite_manager.get_sprite(spritesheet, *coords) 
-            for coords in self.sprite_manager.player_sprite_coords
-        ]
-        attack_sprites = [
-            self.sprite_manager.get_sprite(attack_spritesheet, *coords) 
-            for coords in self.sprite_manager.attack_sprite_coords
-        ]
-        cannon_sprites = [
-            self.sprite_manager.get_sprite(cannon_attack, *coords) 
-            for coords in self.sprite_manager.cannon_attack_coords
-        ]
+    def _load_images(self) -> Dict[str, 'Surface | FrameSet']:
+        # Os frames vêm do cache compartilhado: cada animação é recortada uma única vez.
         return {
-            'default': player_sprites,
-            'attacking': attack_sprites,
-            'cannon': cannon_sprites,
+            'default': self.sprite_manager.get_frames(
+                'player_spritesheet', self.sprite_manager.player_sprite_coords
+            ),
+            'attacking': self.sprite_manager.get_frames(
+                'player_attacking', self.sprite_manager.attack_sprite_coords
+            ),
+            'cannon': self.sprite_manager.get_frames(
+                'cannon_attack', self.sprite_manager.cannon_attack_coords
+            ),
             'stats_interface': self.resource_manager.get_image('stats_interface'),
             'life_bar': self.resource_manager.get_image('life_bar'),
             'xp_bar': self.resource_manager.get_image('xp_bar')
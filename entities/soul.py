@@ -1,14 +1,16 @@
 import pygame
-import math
 from typing import Any, Dict, TYPE_CHECKING
 from entities.mob import Mob
 from config.constants import RED
 from components.life_bar_component import LifeBarComponent
 from components.attack.basic_atk_component import BasicAttackComponent
 from components.movement.mob_movement_component import MobMovementComponent
+from components.movement.float_component import FloatComponent
 
 if TYPE_CHECKING:
     from managers.event_manager import EventManager
+    from managers.world import World
+    from utils.frame_set import FrameSet
 
 class Soul(Mob, pygame.sprite.Sprite):
     """Entidade inimiga que representa um Mob "Soul" no jogo.
@@ -32,12 +34,13 @@ class Soul(Mob, pygame.sprite.Sprite):
     def __init__(
             self: 'Soul', 
             name: str, 
-            images: Dict[str, pygame.Surface], 
+            images: Dict[str, 'FrameSet'], 
             sounds: Dict[str, pygame.mixer.Sound], 
-            event_manager: 'EventManager'
+            event_manager: 'EventManager',
+            world: 'World'
         ) -> None:
         """ Inicializa os atributos específicos para Soul. """
-        super().__init__(event_manager)
+        super().__init__(event_manager, world)
         self._name = name
         self._images = images
         self._sounds = sounds
@@ -55,17 +58,16 @@ class Soul(Mob, pygame.sprite.Sprite):
     def initialize_image_attributes(self) -> None:
         """Inicializa os atributos de imagem do Soul.
 
-        Define as imagens padrão e de ataque, posiciona o mob na tela e configura parâmetros
-        visuais como amplitude e velocidade de flutuação.
+        Define as imagens padrão e de ataque e posiciona o mob na tela.
         """
-        self.default_image = self._images["default"]
-        self.attack_image = self._images["attacking"]
-        self.damage_image = self._images["attacking"]
+        self.default_frames = self._images["default"]
+        self.attack_frames = self._images["attacking"]
+        self.frame_sets = (self.default_frames, self.attack_frames)
+        self.default_image = self.default_frames[0]
+        self.attack_image = self.attack_frames[0]
+        self.damage_image = self.attack_frames[0]
         self.image = self.default_image
         self.rect = self.image.get_rect(center = self.INITIAL_POSITION) 
-        self._float_amplitude = self.FLOAT_AMPLITUDE
-        self._float_speed = self.FLOAT_SPEED
-        self._float_offset = 0
 
     def initialize_combat_attributes(self) -> None:
         """Inicializa os atributos de combate."""
@@ -80,7 +82,8 @@ class Soul(Mob, pygame.sprite.Sprite):
             attack_duration=self.ATTACK_DURATION, 
             attack_range=self.ATTACK_RANGE, 
             attack_sound=self._sounds["hit_player"], 
-            event_manager=self._event_manager
+            event_manager=self._event_manager,
+            world=self._world
         )
         self.life_bar_component = LifeBarComponent(
             entity=self, 
@@ -92,18 +95,12 @@ class Soul(Mob, pygame.sprite.Sprite):
         self.movement_component = MobMovementComponent(
             mob=self,
             attack_component=self.attack_component,
-            event_manager=self._event_manager
+            world=self._world
         )
-
-    def update(self, delta_time: float) -> None:
-        """Atualiza a direção, o movimento, os ataques, a barra de vida e a flutuação do mob."""
-        super().update(delta_time)
-        self._update_float(delta_time)
-
-    def _update_float(self, delta_time: float) -> None:
-        # Atualiza a posição 'y' do mob para criar um efeito de flutuação.
-        self._float_offset += self._float_speed * delta_time
-        self.rect.y = int(
-            self.INITIAL_POSITION[1] + self._float_amplitude * math.sin(self._float_offset)
+        self.float_component = FloatComponent(
+            entity=self, 
+            amplitude=self.FLOAT_AMPLITUDE, 
+            speed=self.FLOAT_SPEED, 
+            base_y=self.INITIAL_POSITION[1]
         )
-        self.life_bar_component.update_life_bar()
\ No newline at end of file
+        self.event_listeners = (self.life_bar_component,)
@@ -2,6 +2,7 @@ import pygame
 
 from entities.mob import Mob
 from config.constants import RED
+from utils.frame_set import frame_rect
 from components.animation.basic_animation_component import BasicAnimationComponent
 from components.attack.basic_atk_component import BasicAttackComponent
 from components.life_bar_component import LifeBarComponent
@@ -23,9 +24,9 @@ class Troll(Mob, pygame.sprite.Sprite):
     ATTACK_DURATION = 20
     ATTACK_SPEED = 5
 
-    def __init__(self, name, images, sounds, event_manager) -> None:
+    def __init__(self, name, images, sounds, event_manager, world) -> None:
         """Inicializa os atributos específicos do Troll."""
-        super().__init__(event_manager)
+        super().__init__(event_manager, world)
         self._name = name
         self._images = images
         self._sounds = sounds
@@ -49,8 +50,11 @@ class Troll(Mob, pygame.sprite.Sprite):
         self.attack_frames = self._images['attack_frames']
         self.damage_frames = self._images['damage_frames']
         self.death_frames = self._images['death_frames']
+        self.frame_sets = (
+            self.default_frames, self.attack_frames, self.damage_frames, self.death_frames
+        )
         self.image = self.default_frames[0]
-        self.rect = self.image.get_rect(center=self._initial_position)
+        self.rect = frame_rect(self.image, center=self._initial_position)
 
     def initialize_combat_attributes(self) -> None:
         """Inicializa os atributos de combate do Troll."""
@@ -70,7 +74,8 @@ class Troll(Mob, pygame.sprite.Sprite):
             attack_duration=self.ATTACK_DURATION, 
             attack_range=self.ATTACK_RANGE, 
             attack_sound=self._sounds, 
-            event_manager=self._event_manager
+            event_manager=self._event_manager,
+            world=self._world
         )
         self.life_bar_component = LifeBarComponent(
             entity=self, 
@@ -82,10 +87,6 @@ class Troll(Mob, pygame.sprite.Sprite):
         self.movement_component = MobMovementComponent(
             mob=self,
             attack_component=self.attack_component,
-            event_manager=self._event_manager
+            world=self._world
         )
-
-    def update(self, delta_time: float) -> None:
-        """Atualiza a direção, o movimento, os ataques e a barra de vida do mob."""
-        super().update(delta_time)
-        self.animation_component.update(delta_time)
\ No newline at end of file
+        self.event_listeners = (self.animation_component, self.life_bar_component)
@@ -1,19 +1,91 @@
 # Imports
+import argparse
 import cProfile
 import pstats
 from core.game import Game
 
+PROFILE_LINES = 30
+MEGABYTE = 2 ** 20
+
 
 def main() -> None:
     """Função principal. Chama o método run de 'Game' para iniciar o jogo."""
-    game = Game()
-    game.run()
+    args = _parse_args()
+    if not args.profile:
+        _run(args)
+        return
+    # cProfile pesa em cada chamada; para o tempo por quadro use o painel (F3) ou 'Game.frame_stats'
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        _run(args)
+    finally:
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats('cumtime').print_stats(PROFILE_LINES)
+
+
+def _run(args: argparse.Namespace) -> None:
+    game = Game(
+        headless=args.headless, 
+        fps_cap=args.fps_cap, 
+        dirty_rects=args.dirty_rects, 
+        crowd=args.crowd, 
+        asset_pack=args.asset_pack, 
+        memory_budget=args.memory_budget * MEGABYTE if args.memory_budget is not None else None, 
+        frame_views=args.frame_views
+    )
+    if args.record:
+        game.record_inputs(args.record)
+    if args.replay:
+        game.replay_inputs(args.replay, fast_forward=args.fast_forward)
+    if args.overlay:
+        game.toggle_frame_overlay()
+    game.run(max_ticks=args.ticks)
+    if args.memory_report:
+        _print_memory_report(game.memory_report())
+
+
+def _print_memory_report(report: dict) -> None:
+    images, frames = report['images'], report['frames']
+    budget = f"{images['budget'] / MEGABYTE:.1f} MB" if images['budget'] is not None else 'sem limite'
+    print(f"Imagens residentes: {images['resident_bytes'] / MEGABYTE:.1f} MB ({budget})")
+    for name, size in images['images'].items():
+        print(f'  {name:<28} {size / MEGABYTE:8.2f} MB')
+    for name, size in images['released_in_use'].items():
+        print(f'  {name:<28} {size / MEGABYTE:8.2f} MB (liberada, ainda em uso)')
+    print(f"Descartes: {images['evictions']}, recarregamentos: {images['reloads']}")
+    print(
+        f"Frames recortados: {frames['frames']} em {frames['animations']} animações, {frames['bytes'] / MEGABYTE:.1f} MB"
+        f" (+{frames['shared_bytes'] / MEGABYTE:.1f} MB compartilhados com os spritesheets)"
+    )
+    if frames['untrimmed_area']:
+        print(
+            f"Área dos frames: {frames['area']} px (antes de aparar: {frames['untrimmed_area']} px, "
+            f"{frames['area'] / frames['untrimmed_area']:.0%})"
+        )
+    print('Formatos dos frames:')
+    for name, formats in report['formats'].items():
+        print(f"  {name:<28} {', '.join(f'{count} {path}' for path, count in sorted(formats.items()))}")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Slayer')
+    parser.add_argument('--headless', action='store_true', help='Simula sem janela, áudio ou limite de FPS.')
+    parser.add_argument('--fps-cap', type=int, default=Game.FPS, help='Limite de FPS de renderização (0 para não limitar).')
+    parser.add_argument('--ticks', type=int, default=None, help='Número de ticks a simular (obrigatório com --headless).')
+    parser.add_argument('--dirty-rects', action='store_true', help='Redesenha apenas as áreas alteradas da tela.')
+    parser.add_argument('--crowd', action='store_true', help='Move os mobs em lote com NumPy (modo multidão).')
+    parser.add_argument('--asset-pack', action='store_true', help='Usa o pacote de frames pré-recortados (gerado se necessário).')
+    parser.add_argument('--frame-views', action='store_true', help='Frames compartilham os pixels dos spritesheets (sem cópias).')
+    parser.add_argument('--memory-budget', type=float, metavar='MB', default=None, help='Limite de memória para as imagens residentes.')
+    parser.add_argument('--memory-report', action='store_true', help='Imprime o uso de memória e o formato dos frames ao sair.')
+    parser.add_argument('--record', metavar='ARQUIVO', default=None, help='Grava as entradas da sessão.')
+    parser.add_argument('--replay', metavar='ARQUIVO', default=None, help='Reproduz as entradas gravadas.')
+    parser.add_argument('--fast-forward', action='store_true', help='Reproduz o replay tão rápido quanto possível.')
+    parser.add_argument('--overlay', action='store_true', help='Exibe o painel de tempo dos quadros (alternado com F3).')
+    parser.add_argument('--profile', action='store_true', help='Executa sob o cProfile e imprime as funções mais caras.')
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    profiler = cProfile.Profile()
-    profiler.enable()
     main()
-    profiler.disable()
-    stats = pstats.Stats(profiler).sort_stats('cumtime')
-    #stats.print_stats()
\ No newline at end of file
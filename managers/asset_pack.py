@@ -0,0 +1,282 @@
+"""Pacote de frames pré-recortados, mapeado em memória.
+
+Gera o pacote a partir dos spritesheets (ou o atualiza, se estiver desatualizado):
+
+    python -m managers.asset_pack [--output resources/frames.pack] [--force]
+"""
+import os
+import json
+import mmap
+import time
+import struct
+import hashlib
+import argparse
+import pygame
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from utils.frame_set import frame_anchor, frame_box_size, set_anchor, trim_frame
+
+# Formato do pacote: cabeçalho (assinatura, versão, tamanho do índice), índice em JSON e os
+# pixels de cada frame no formato da tela (32 bits, bytes em ordem BGRA), alinhados a
+# 'ALIGNMENT' bytes. O índice guarda a impressão digital dos arquivos de origem e da tabela
+# de animações usada para gerar o pacote. Os frames recortados são gravados aparados, com a
+# âncora (posição dentro da caixa original) e o tamanho da caixa.
+MAGIC = b'SLPK'
+VERSION = 2
+HEADER = struct.Struct('<4sHI')
+ALIGNMENT = 16
+PIXEL_FORMAT = 'BGRA'
+OPAQUE_IMAGES = frozenset({'background'})
+
+Coords = Optional[Tuple[Tuple[int, int, int, int], ...]]
+Animations = Sequence[Tuple[str, Optional[Sequence[Tuple[int, int, int, int]]]]]
+
+
+def animation_key(coords: Optional[Sequence[Sequence[int]]]) -> Coords:
+    """Normaliza as coordenadas de uma animação para uso como chave (None para a imagem inteira)."""
+    return tuple(tuple(coord) for coord in coords) if coords is not None else None
+
+
+def layout_fingerprint(image_files: Mapping[str, str], animations: Animations) -> str:
+    """Retorna a impressão digital dos arquivos e da tabela de animações que definem o pacote."""
+    layout = {
+        'version': VERSION,
+        'images': dict(image_files),
+        'animations': [[sheet_name, animation_key(coords)] for sheet_name, coords in animations]
+    }
+    return hashlib.sha1(json.dumps(layout, sort_keys=True).encode()).hexdigest()
+
+
+def file_fingerprint(path: str) -> Dict[str, Any]:
+    """Retorna a data de modificação, o tamanho e o hash SHA-1 de um arquivo de origem."""
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': _sha1(path)}
+
+
+def bake(
+        path: str,
+        images_dir: str,
+        image_files: Mapping[str, str],
+        animations: Animations
+    ) -> Dict[str, int]:
+    """Gera o pacote com os frames recortados e convertidos para o formato da tela.
+
+    Requer uma janela criada ('convert_alpha'). Os spritesheets com animações na tabela são
+    gravados apenas como frames recortados; as demais imagens, inteiras. O arquivo é escrito
+    em um temporário e renomeado, de modo que um pacote incompleto nunca é lido.
+
+    Returns:
+    - Um dicionário com o número de animações, de frames e de bytes de pixels gravados.
+    """
+    sliced: Dict[str, List[Coords]] = {}
+    for sheet_name, coords in animations:
+        sliced.setdefault(sheet_name, []).append(animation_key(coords))
+    entries, blobs = [], []
+    offset = 0
+    for name, file in image_files.items():
+        image = pygame.image.load(f'{images_dir}/{file}')
+        image = image.convert() if name in OPAQUE_IMAGES else image.convert_alpha()
+        for coords in sliced.get(name, [None]):
+            frames = [image] if coords is None else [trim_frame(_slice(image, coord)) for coord in coords]
+            records = []
+            for frame in frames:
+                pixels = pygame.image.tobytes(frame, PIXEL_FORMAT)
+                records.append([offset, *frame.get_size(), *frame_anchor(frame), *frame_box_size(frame)])
+                padding = -len(pixels) % ALIGNMENT
+                blobs.append(pixels + bytes(padding))
+                offset += len(pixels) + padding
+            entries.append({'sheet': name, 'coords': coords, 'opaque': name in OPAQUE_IMAGES, 'frames': records})
+    index = json.dumps({
+        'layout': layout_fingerprint(image_files, animations),
+        'sources': {file: file_fingerprint(f'{images_dir}/{file}') for file in image_files.values()},
+        'animations': entries
+    }).encode()
+    data_start = _data_start(len(index))
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as pack:
+        pack.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        pack.write(index)
+        pack.write(bytes(data_start - HEADER.size - len(index)))
+        pack.writelines(blobs)
+    os.replace(temporary, path)
+    return {
+        'animations': len(entries),
+        'frames': sum(len(entry['frames']) for entry in entries),
+        'bytes': offset
+    }
+
+
+class AssetPack:
+    """Pacote de frames gerado por 'bake', mapeado em memória.
+
+    As superfícies são criadas com 'pygame.image.frombuffer' diretamente sobre o mapeamento
+    (sem decodificar PNG nem recortar) e compartilham seus pixels; por isso o pacote deve
+    permanecer vivo enquanto elas forem usadas. O mapeamento é privado (cópia na escrita):
+    desenhar sobre um frame nunca altera o arquivo.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Mapeia o pacote e lê seu índice."""
+        self.path = path
+        with open(path, 'rb') as pack:
+            self._mmap = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_COPY)
+        self.index = _parse_index(self._mmap)
+        self._data_start = _data_start(HEADER.unpack_from(self._mmap)[2])
+        self._entries = {
+            (entry['sheet'], animation_key(entry['coords'])): entry for entry in self.index['animations']
+        }
+
+    @classmethod
+    def ensure(
+            cls,
+            path: str,
+            images_dir: str,
+            image_files: Mapping[str, str],
+            animations: Animations
+        ) -> 'AssetPack':
+        """Abre o pacote, gerando-o antes caso não exista ou esteja desatualizado."""
+        if not cls.is_fresh(path, images_dir, image_files, animations):
+            bake(path, images_dir, image_files, animations)
+        return cls(path)
+
+    @staticmethod
+    def is_fresh(
+            path: str,
+            images_dir: str,
+            image_files: Mapping[str, str],
+            animations: Animations
+        ) -> bool:
+        """Verifica se o pacote corresponde aos arquivos de origem e à tabela de animações.
+
+        Um arquivo com data de modificação diferente só torna o pacote desatualizado se o
+        seu conteúdo (hash SHA-1) também tiver mudado; caso contrário, a nova data é gravada
+        no índice, para que as próximas verificações não recalculem o hash. Um arquivo de
+        origem ausente torna o pacote desatualizado.
+        """
+        try:
+            with open(path, 'rb') as pack:
+                header = pack.read(HEADER.size)
+                index_size = HEADER.unpack(header)[2]
+                index = _parse_index(header + pack.read(index_size))
+        except (OSError, ValueError, struct.error):
+            return False
+        if index['layout'] != layout_fingerprint(image_files, animations):
+            return False
+        touched = {}
+        for file in image_files.values():
+            source = index['sources'].get(file)
+            try:
+                stat = os.stat(f'{images_dir}/{file}')
+                if source is None or source['size'] != stat.st_size:
+                    return False
+                if source['mtime_ns'] != stat.st_mtime_ns:
+                    if source['sha1'] != _sha1(f'{images_dir}/{file}'):
+                        return False
+                    touched[file] = stat.st_mtime_ns
+            except OSError:
+                return False
+        if touched:
+            _record_mtimes(path, index, index_size, touched)
+        return True
+
+    def frames(
+            self,
+            sheet_name: str,
+            coords: Optional[Sequence[Sequence[int]]] = None
+        ) -> Optional[List[pygame.Surface]]:
+        """Retorna os frames da animação (ou a imagem inteira, sem coordenadas).
+
+        Retorna None se a animação não estiver no pacote.
+        """
+        entry = self._entries.get((sheet_name, animation_key(coords)))
+        if entry is None:
+            return None
+        frames = []
+        for offset, width, height, anchor_x, anchor_y, box_width, box_height in entry['frames']:
+            start = self._data_start + offset
+            view = memoryview(self._mmap)[start:start + width * height * 4]
+            frame = pygame.image.frombuffer(view, (width, height), PIXEL_FORMAT)
+            # O fundo opaco é convertido (copiado) para o formato sem alfa, de blit mais rápido
+            frame = frame.convert() if entry['opaque'] else frame
+            if (width, height) != (box_width, box_height):
+                set_anchor(frame, (anchor_x, anchor_y), (box_width, box_height))
+            frames.append(frame)
+        return frames
+
+    def image(self, name: str) -> Optional[pygame.Surface]:
+        """Retorna a imagem inteira gravada no pacote, ou None se ela só foi gravada recortada."""
+        frames = self.frames(name)
+        return frames[0] if frames else None
+
+
+def _slice(image: pygame.Surface, coord: Tuple[int, int, int, int]) -> pygame.Surface:
+    # Mesmo recorte de 'SpriteManager.get_sprite' (aparado em seguida, como em '_slice_frames').
+    x, y, width, height = coord
+    frame = pygame.Surface((width, height), pygame.SRCALPHA)
+    frame.blit(image, (0, 0), (x, y, width, height))
+    return frame
+
+
+def _parse_index(data: bytes) -> Dict[str, Any]:
+    # Valida o cabeçalho e decodifica o índice JSON.
+    magic, version, index_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Pacote de frames inválido ou de outra versão.')
+    return json.loads(bytes(data[HEADER.size:HEADER.size + index_size]))
+
+
+def _record_mtimes(path: str, index: Dict[str, Any], index_size: int, mtimes: Mapping[str, int]) -> None:
+    # Grava as novas datas de modificação no índice, no mesmo espaço (completado com espaços,
+    # que o JSON ignora), sem mover os pixels. Se o índice não couber mais ou o arquivo não
+    # puder ser escrito, o pacote continua válido e o hash é recalculado na próxima vez.
+    for file, mtime_ns in mtimes.items():
+        index['sources'][file]['mtime_ns'] = mtime_ns
+    data = json.dumps(index).encode()
+    if len(data) > index_size:
+        return
+    try:
+        with open(path, 'r+b') as pack:
+            pack.seek(HEADER.size)
+            pack.write(data.ljust(index_size))
+    except OSError:
+        pass
+
+
+def _data_start(index_size: int) -> int:
+    # Início dos pixels: logo após o índice, alinhado a 'ALIGNMENT' bytes.
+    end = HEADER.size + index_size
+    return end + (-end % ALIGNMENT)
+
+
+def _sha1(path: str) -> str:
+    with open(path, 'rb') as source:
+        return hashlib.sha1(source.read()).hexdigest()
+
+
+def main(argv: Sequence[str] = None) -> None:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from config.constants import ASSET_PACK_PATH, IMAGES_DIR
+    from managers.resource_manager import ResourceManager
+    from managers.sprite_manager import SpriteManager
+
+    parser = argparse.ArgumentParser(description='Gera o pacote de frames pré-recortados.')
+    parser.add_argument('--output', default=ASSET_PACK_PATH, help='Arquivo do pacote.')
+    parser.add_argument('--force', action='store_true', help='Gera o pacote mesmo que esteja atualizado.')
+    args = parser.parse_args(argv)
+    image_files, animations = ResourceManager.IMAGE_FILES, SpriteManager.ANIMATIONS
+    if not args.force and AssetPack.is_fresh(args.output, IMAGES_DIR, image_files, animations):
+        print(f'{args.output} já está atualizado.')
+        return
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    started = time.perf_counter()
+    stats = bake(args.output, IMAGES_DIR, image_files, animations)
+    print(
+        f"{args.output}: {stats['animations']} animações, {stats['frames']} frames, "
+        f"{stats['bytes'] / 2 ** 20:.1f} MB em {time.perf_counter() - started:.2f}s"
+    )
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
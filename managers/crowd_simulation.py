@@ -0,0 +1,123 @@
+from typing import Tuple, TYPE_CHECKING
+from config.constants import LEFT_BOUNDARY, RIGHT_BOUNDARY
+from components.movement.mob_movement_component import MobMovementComponent
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o modo multidão fica indisponível
+    np = None
+
+if TYPE_CHECKING:
+    from managers.world import World
+    from entities.mob import Mob
+
+class CrowdSimulation:
+    """Movimentação vetorizada (NumPy) de todos os mobs em um único passo por tick.
+
+    As posições, dimensões, velocidades e fases de flutuação dos mobs ficam em arrays
+    (estrutura de arrays). A cada tick, a perseguição ao jogador mais próximo, o limite das
+    bordas do mapa e a flutuação dos Souls são calculados para todos os mobs de uma vez e
+    escritos nos rects. O resultado de cada mob (atacar ou a nova direção) fica em
+    'movement_component.crowd_state' e é aplicado pelo próprio mob no seu update.
+
+    As posições x são mantidas em ponto flutuante; se o rect de um mob for alterado fora da
+    simulação (ataques, reset), a posição do rect é adotada.
+    """
+
+    DISTANCE_THRESHOLD = MobMovementComponent.DISTANCE_THRESHOLD
+
+    def __init__(self, world: 'World') -> None:
+        """Inicializa a simulação sem mobs; os arrays são montados no primeiro passo."""
+        if np is None:
+            raise ImportError('O modo multidão requer o pacote numpy.')
+        self._world = world
+        self._mobs: Tuple['Mob', ...] = ()
+        self._rebuild(())
+
+    def __len__(self) -> int:
+        return len(self._mobs)
+
+    def step(self, delta_time: float) -> None:
+        """Move todos os mobs do mundo em um passo vetorizado e escreve o resultado nos rects."""
+        mobs = self._world.mobs
+        if mobs != self._mobs:
+            self._rebuild(mobs)
+        if not mobs:
+            return
+        count = len(mobs)
+        rect_x = np.fromiter((mob.rect.x for mob in mobs), float, count)
+        y = np.fromiter((mob.rect.y for mob in mobs), float, count)
+        x = np.where(rect_x != self._written_x, rect_x, self._x)
+        collided = np.zeros(count, dtype=bool)
+        direction = np.zeros(count, dtype=np.int64)
+
+        players = self._world.players
+        if players:
+            player_x = np.fromiter((player.rect.centerx for player in players), float, len(players))
+            distance = np.abs((rect_x + self._half_width)[:, None] - player_x[None, :])
+            collided = (distance <= self.DISTANCE_THRESHOLD).any(axis=1)
+            target_x = player_x[distance.argmin(axis=1)]
+            direction = np.where(rect_x + self._half_width <= target_x, 1, -1) * ~collided
+            x = x + direction * self._speed * delta_time
+            # Mobs que saem das bordas voltam à posição inicial
+            left = np.rint(x)
+            outside = (direction != 0) & ((left < LEFT_BOUNDARY) | (left + self._width > RIGHT_BOUNDARY))
+            x = np.where(outside, self._initial_x - self._half_width, x)
+            y = np.where(outside, self._initial_y - self._half_height, y)
+
+        # A flutuação oscila o topo do rect em torno de 'base_y', como no FloatComponent
+        self._phase += self._float_speed * delta_time
+        y = np.where(
+            self._floating, 
+            np.trunc(self._float_base_y + self._float_amplitude * np.sin(self._phase)), 
+            y
+        )
+        self._x = x
+        self._written_x = np.rint(x)
+        for mob, mob_x, mob_y, mob_collided, mob_direction in zip(
+            mobs, 
+            self._written_x.astype(np.int64).tolist(), 
+            y.astype(np.int64).tolist(), 
+            collided.tolist(), 
+            direction.tolist()
+        ):
+            rect = mob.rect
+            rect.x = mob_x
+            rect.y = mob_y
+            mob.movement_component.crowd_state = (mob_collided, mob_direction)
+
+    def _rebuild(self, mobs: Tuple['Mob', ...]) -> None:
+        # Remonta os arrays quando os mobs do mundo mudam, preservando a fase de quem continua.
+        previous = dict(zip(self._mobs, self._phase.tolist())) if self._mobs else {}
+        current = set(mobs)
+        for mob, phase in previous.items():
+            if mob not in current:
+                mob.crowd_driven = False
+                float_component = getattr(mob, 'float_component', None)
+                if float_component is not None:
+                    float_component.offset = phase
+        for mob in mobs:
+            mob.crowd_driven = True
+        self._mobs = mobs
+        self._x = np.array([mob.rect.x for mob in mobs], dtype=float)
+        self._written_x = self._x.copy()
+        self._width = np.array([mob.rect.width for mob in mobs], dtype=float)
+        self._half_width = self._width // 2
+        self._half_height = np.array([mob.rect.height // 2 for mob in mobs], dtype=float)
+        self._speed = np.array([mob.speed for mob in mobs], dtype=float)
+        self._initial_x = np.array([mob.INITIAL_POSITION[0] for mob in mobs], dtype=float)
+        self._initial_y = np.array([mob.INITIAL_POSITION[1] for mob in mobs], dtype=float)
+        floats = [getattr(mob, 'float_component', None) for mob in mobs]
+        self._floating = np.array([component is not None for component in floats], dtype=bool)
+        self._float_amplitude = np.array(
+            [component.amplitude if component else 0 for component in floats], dtype=float
+        )
+        self._float_speed = np.array([component.speed if component else 0 for component in floats], dtype=float)
+        self._float_base_y = np.array([component.base_y if component else 0 for component in floats], dtype=float)
+        self._phase = np.array(
+            [
+                previous.get(mob, component.offset if component else 0.0) 
+                for mob, component in zip(mobs, floats)
+            ], 
+            dtype=float
+        )
@@ -0,0 +1,130 @@
+import pygame
+from typing import Callable, List, Optional, Tuple
+from managers.screen_manager import ScreenManager
+from managers.resource_manager import ResourceManager
+from managers.sprite_manager import SpriteManager
+from core.camera import Camera
+
+class DirtyRectRenderer:
+    """Renderização por retângulos sujos.
+
+    Guarda as áreas desenhadas no quadro anterior e, no quadro seguinte, restaura o fundo
+    apenas nelas antes de desenhar os sprites de novo, enviando ao display somente as áreas
+    alteradas com 'pygame.display.update'. Quando a câmera anda pouco, o conteúdo da tela é
+    rolado com 'Surface.scroll' e só as faixas expostas recebem o fundo; acima de
+    'SCROLL_THRESHOLD' pixels (ou no primeiro quadro) a tela é redesenhada por completo.
+    """
+
+    SCROLL_THRESHOLD = 32
+
+    def __init__(
+            self, 
+            screen_manager: ScreenManager, 
+            resource_manager: ResourceManager, 
+            sprite_manager: SpriteManager
+        ) -> None:
+        """Inicializa o renderizador sem nenhum quadro anterior."""
+        self._screen_manager = screen_manager
+        self._resource_manager = resource_manager
+        self._sprite_manager = sprite_manager
+        self._previous_rects: List[pygame.Rect] = []
+        self._camera_position: Optional[Tuple[int, int]] = None
+        self.full_redraws = 0
+        self.partial_redraws = 0
+
+    def invalidate(self) -> None:
+        """Força o redesenho completo no próximo quadro (ex.: a janela foi exposta de novo)."""
+        self._camera_position = None
+
+    def draw(
+            self, 
+            camera: Camera, 
+            alpha: float = 1.0, 
+            overlay: Optional[Callable[[pygame.Surface], pygame.Rect]] = None
+        ) -> None:
+        """Desenha o quadro atual, redesenhando apenas o necessário.
+
+        Args:
+        - camera: Câmera já interpolada para o quadro.
+        - alpha: Fração do passo fixo já decorrida, usada para interpolar as posições.
+        - overlay: Função que desenha um painel sobre os sprites e retorna a área ocupada.
+        """
+        position = camera.camera.topleft
+        previous = self._camera_position
+        self._camera_position = position
+        if previous is None:
+            self._draw_full(camera, alpha, overlay)
+            return
+        dx, dy = position[0] - previous[0], position[1] - previous[1]
+        if abs(dx) > self.SCROLL_THRESHOLD or abs(dy) > self.SCROLL_THRESHOLD:
+            self._draw_full(camera, alpha, overlay)
+        else:
+            self._draw_partial(camera, alpha, dx, dy, overlay)
+
+    def _draw_full(
+            self, 
+            camera: Camera, 
+            alpha: float, 
+            overlay: Optional[Callable[[pygame.Surface], pygame.Rect]] = None
+        ) -> None:
+        # Redesenha a tela inteira, como o caminho padrão de 'Game._draw'.
+        screen = self._screen_manager.screen
+        section = self._sprite_manager.profiler.section
+        self._screen_manager.draw_window(self._resource_manager, camera)
+        self._previous_rects = self._draw_sprites(screen, camera, alpha, overlay)
+        with section('draw.flip'):
+            pygame.display.flip()
+        self.full_redraws += 1
+
+    def _draw_sprites(
+            self, 
+            screen: pygame.Surface, 
+            camera: Camera, 
+            alpha: float, 
+            overlay: Optional[Callable[[pygame.Surface], pygame.Rect]]
+        ) -> List[pygame.Rect]:
+        # Desenha os sprites e o painel, retornando as áreas alteradas.
+        with self._sprite_manager.profiler.section('draw.sprites'):
+            drawn = self._sprite_manager.draw_all(screen, camera, alpha)
+        if overlay is not None:
+            drawn.append(overlay(screen))
+        return drawn
+
+    def _draw_partial(
+            self, 
+            camera: Camera, 
+            alpha: float, 
+            dx: int, 
+            dy: int, 
+            overlay: Optional[Callable[[pygame.Surface], pygame.Rect]] = None
+        ) -> None:
+        # Restaura o fundo sob o quadro anterior (rolado junto com a câmera) e redesenha os sprites.
+        screen = self._screen_manager.screen
+        restored = [rect.move(dx, dy) for rect in self._previous_rects]
+        if dx or dy:
+            screen.scroll(dx, dy)
+            restored.extend(self._exposed_strips(screen.get_rect(), dx, dy))
+        self._screen_manager.restore_background(self._resource_manager, camera, restored)
+        drawn = self._draw_sprites(screen, camera, alpha, overlay)
+        with self._sprite_manager.profiler.section('draw.flip'):
+            if dx or dy:
+                # A rolagem alterou todos os pixels da tela
+                pygame.display.flip()
+            else:
+                pygame.display.update([rect for rect in restored + drawn if rect.width and rect.height])
+        self._previous_rects = drawn
+        self.partial_redraws += 1
+
+    @staticmethod
+    def _exposed_strips(screen_rect: pygame.Rect, dx: int, dy: int) -> List[pygame.Rect]:
+        # Retorna as faixas da tela descobertas pela rolagem de (dx, dy) pixels.
+        strips = []
+        if dx > 0:
+            strips.append(pygame.Rect(0, 0, dx, screen_rect.height))
+        elif dx < 0:
+            strips.append(pygame.Rect(screen_rect.width + dx, 0, -dx, screen_rect.height))
+        if dy > 0:
+            strips.append(pygame.Rect(0, 0, screen_rect.width, dy))
+        elif dy < 0:
+            strips.append(pygame.Rect(0, screen_rect.height + dy, screen_rect.width, -dy))
+        return strips
@@ -0,0 +1,130 @@
+import pygame
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+class System(NamedTuple):
+    """Sistema do loop de atualização: chama 'method' de todos os componentes do tipo 'kind'."""
+    kind: str
+    method: str
+    uses_delta_time: bool
+
+
+class Archetype:
+    """Tabela das entidades que possuem exatamente o mesmo conjunto de tipos de componentes.
+
+    Cada coluna guarda, para um sistema, os métodos já ligados dos componentes das entidades,
+    na mesma ordem das linhas; remover uma entidade move a última linha para o seu lugar.
+    """
+
+    __slots__ = ('signature', 'entities', 'columns', '_rows')
+
+    def __init__(self, signature: Tuple[str, ...]) -> None:
+        """Inicializa a tabela vazia com uma coluna por tipo de componente."""
+        self.signature = signature
+        self.entities: List[pygame.sprite.Sprite] = []
+        self.columns: Dict[str, List[Callable]] = {kind: [] for kind in signature}
+        self._rows: Dict[pygame.sprite.Sprite, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, entity: pygame.sprite.Sprite, row: Dict[str, Callable]) -> None:
+        """Adiciona uma linha com os métodos dos componentes da entidade."""
+        self._rows[entity] = len(self.entities)
+        self.entities.append(entity)
+        for kind, column in self.columns.items():
+            column.append(row[kind])
+
+    def remove(self, entity: pygame.sprite.Sprite) -> None:
+        """Remove a linha da entidade em O(1), movendo a última linha para o seu lugar."""
+        index = self._rows.pop(entity)
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[index] = last
+            self._rows[last] = index
+        for column in self.columns.values():
+            value = column.pop()
+            if last is not entity:
+                column[index] = value
+
+
+class EntityStore:
+    """Armazena as entidades em tabelas de arquétipo e as atualiza sistema por sistema.
+
+    Em vez de cada entidade chamar seus componentes em 'update', cada sistema percorre, em
+    uma ordem fixa, as colunas de todas as tabelas que possuem seu tipo de componente.
+    As entidades são definidas pelos componentes que expõem em 'components()'.
+    """
+
+    SYSTEMS = (
+        System('movement', 'handle_collision', True),
+        System('attack', 'update', False),
+        System('float', 'update', True),
+        System('life_bar', 'update_life_bar', False),
+        System('orientation', 'sync_orientation', False),
+        System('animation', 'update', True),
+    )
+
+    def __init__(self) -> None:
+        """Inicializa o armazenamento sem entidades."""
+        self._archetypes: Dict[Tuple[str, ...], Archetype] = {}
+        self._locations: Dict[pygame.sprite.Sprite, Archetype] = {}
+        self._system_tables: List[List[Archetype]] = [[] for _ in self.SYSTEMS]
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, entity: pygame.sprite.Sprite) -> bool:
+        return entity in self._locations
+
+    @property
+    def archetypes(self) -> Tuple[Archetype, ...]:
+        """Tabelas de arquétipo criadas até agora."""
+        return tuple(self._archetypes.values())
+
+    def add(self, entity: pygame.sprite.Sprite) -> None:
+        """Adiciona a entidade à tabela correspondente ao seu conjunto de componentes."""
+        if entity in self._locations:
+            return
+        components = entity.components()
+        row = {
+            system.kind: getattr(components[system.kind], system.method) 
+            for system in self.SYSTEMS if system.kind in components
+        }
+        signature = tuple(row)
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype = self._archetypes[signature] = Archetype(signature)
+            for tables, system in zip(self._system_tables, self.SYSTEMS):
+                if system.kind in signature:
+                    tables.append(archetype)
+        archetype.add(entity, row)
+        self._locations[entity] = archetype
+
+    def remove(self, entity: pygame.sprite.Sprite) -> None:
+        """Remove a entidade do armazenamento, caso esteja presente."""
+        archetype = self._locations.pop(entity, None)
+        if archetype is not None:
+            archetype.remove(entity)
+
+    def sync(self, group: Iterable[pygame.sprite.Sprite]) -> None:
+        """Sincroniza o armazenamento com as entidades do grupo (entradas e saídas)."""
+        locations = self._locations
+        entities = group.sprites() if isinstance(group, pygame.sprite.AbstractGroup) else list(group)
+        if len(entities) == len(locations) and all(entity in locations for entity in entities):
+            return
+        current = set(entities)
+        for entity in [entity for entity in locations if entity not in current]:
+            self.remove(entity)
+        for entity in entities:
+            self.add(entity)
+
+    def run(self, delta_time: float) -> None:
+        """Executa os sistemas na ordem de 'SYSTEMS' sobre todas as tabelas."""
+        for system, tables in zip(self.SYSTEMS, self._system_tables):
+            for archetype in tables:
+                if system.uses_delta_time:
+                    for method in archetype.columns[system.kind]:
+                        method(delta_time)
+                else:
+                    for method in archetype.columns[system.kind]:
+                        method()
@@ -1,28 +1,65 @@
-from typing import Any, Dict, Optional
+import weakref
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 class EventManager:
-    """Gerencia eventos do jogo."""
+    """Gerencia eventos do jogo.
+
+    Além das inscrições globais por tipo de evento, aceita inscrições restritas a um alvo:
+    um evento com a chave 'target' é entregue em O(1) apenas aos listeners daquele alvo
+    (e aos listeners globais do tipo), independentemente de quantas entidades existam.
+
+    Listeners e alvos são mantidos por referência fraca: o EventManager nunca mantém uma
+    entidade viva, e as inscrições de objetos coletados são removidas automaticamente.
+    """
 
     def __init__(self) -> None:
-        """Inicializa o dicionário para armazenar os listeners por tipo de evento."""
-        self.listeners = {}
+        """Inicializa os dicionários para armazenar os listeners por tipo de evento e por alvo."""
+        self.listeners: Dict[str, List[weakref.ref]] = {}
+        self.targeted_listeners: Dict[str, weakref.WeakKeyDictionary] = {}
+        self._subscriptions = weakref.WeakKeyDictionary()
+
+    def subscribe(self, event_type: str, listener: object, target: Optional[Hashable] = None) -> None:
+        """Inscreve um listener em um tipo específico de evento, caso ainda não esteja inscrito.
 
-    def subscribe(self, event_type: str, listener: object) -> None:
-        """Inscreve um listener em um tipo específico de evento."""
-        if event_type not in self.listeners:
-            self.listeners[event_type] = [] 
-        self.listeners[event_type].append(listener)
+        Com 'target', o listener recebe apenas os eventos desse tipo cujo 'target' é o alvo informado.
+        """
+        subscriptions = self._subscriptions.setdefault(listener, [])
+        if any(self._matches(subscription, event_type, target) for subscription in subscriptions):
+            return
+        bucket = self._get_bucket(event_type, target, create=True)
+        bucket.append(weakref.ref(listener, lambda ref: self._discard(bucket, ref)))
+        subscriptions.append((event_type, None if target is None else weakref.ref(target)))
 
-    def unsubscribe(self, event_type: str, listener: object) -> None:
+    def unsubscribe(self, event_type: str, listener: object, target: Optional[Hashable] = None) -> None:
         """Remove um listener registrado para um tipo específico de evento, caso exista."""
-        if event_type in self.listeners and listener in self.listeners[event_type]:
-            self.listeners[event_type].remove(listener)
+        subscriptions = self._subscriptions.get(listener, [])
+        for subscription in subscriptions:
+            if self._matches(subscription, event_type, target):
+                subscriptions.remove(subscription)
+                self._remove_from_bucket(event_type, listener, target)
+                return
+
+    def unsubscribe_all(self, listener: object) -> None:
+        """Remove todas as inscrições do listener (usado quando sua entidade sai do jogo)."""
+        for event_type, target_ref in self._subscriptions.pop(listener, []):
+            target = target_ref() if target_ref is not None else None
+            if target_ref is not None and target is None:
+                continue  # O canal do alvo já foi descartado junto com ele
+            self._remove_from_bucket(event_type, listener, target)
+
+    def listener_count(self) -> int:
+        """Retorna o número de inscrições ativas (globais e por alvo)."""
+        count = sum(len(bucket) for bucket in self.listeners.values())
+        for channels in self.targeted_listeners.values():
+            count += sum(len(bucket) for bucket in channels.values())
+        return count
 
     def notify(self, event: Dict[str, Any]) -> Optional[Any]:
         """Notifica os listeners inscritos no tipo de evento.
-        
+
         Verifica se o tipo do evento recebido existe no dicionário de listeners,
         caso exista, chama o método notify do listener e armazena o resultado (se houver).
+        Se o evento tiver a chave 'target', os listeners inscritos nesse alvo são notificados primeiro.
 
         Args:
         - event: Um dicionário contendo pelo menos a chave 'type' que define o tipo de evento.
@@ -32,9 +69,66 @@ class EventManager:
         - Retorna None se nenhum listener retornar um valor válido.
         """
         event_type = event.get('type')
+        target = event.get('target')
+        if target is not None and event_type in self.targeted_listeners:
+            result = self._dispatch(self.targeted_listeners[event_type].get(target, ()), event)
+            if result is not None:
+                return result
         if event_type in self.listeners:
-            for listener in self.listeners[event_type]:
+            return self._dispatch(self.listeners[event_type], event)
+        return None
+
+    def _dispatch(self, bucket: List[weakref.ref], event: Dict[str, Any]) -> Optional[Any]:
+        # Notifica uma cópia da lista, pois listeners podem cancelar inscrições durante o evento.
+        for ref in tuple(bucket):
+            listener = ref()
+            if listener is not None:
                 result = listener.notify(event)
                 if result is not None:
                     return result
-        return None
\ No newline at end of file
+        return None
+
+    def _get_bucket(
+            self,
+            event_type: str,
+            target: Optional[Hashable],
+            create: bool = False
+        ) -> Optional[List[weakref.ref]]:
+        # Retorna a lista de referências dos listeners do tipo de evento (e do alvo, se houver).
+        if target is None:
+            if create:
+                return self.listeners.setdefault(event_type, [])
+            return self.listeners.get(event_type)
+        if create:
+            channels = self.targeted_listeners.setdefault(event_type, weakref.WeakKeyDictionary())
+            return channels.setdefault(target, [])
+        return self.targeted_listeners.get(event_type, {}).get(target)
+
+    def _remove_from_bucket(self, event_type: str, listener: object, target: Optional[Hashable]) -> None:
+        # Remove a referência ao listener e descarta o canal do alvo quando fica vazio.
+        bucket = self._get_bucket(event_type, target)
+        if bucket is None:
+            return
+        for ref in bucket:
+            if ref() is listener:
+                bucket.remove(ref)
+                break
+        if target is not None and not bucket:
+            del self.targeted_listeners[event_type][target]
+
+    @staticmethod
+    def _discard(bucket: List[weakref.ref], ref: weakref.ref) -> None:
+        # Callback das referências fracas: remove a inscrição de um listener coletado.
+        if ref in bucket:
+            bucket.remove(ref)
+
+    @staticmethod
+    def _matches(
+            subscription: Tuple[str, Optional[weakref.ref]],
+            event_type: str,
+            target: Optional[Hashable]
+        ) -> bool:
+        # Verifica se a inscrição registrada corresponde ao tipo de evento e ao alvo.
+        subscribed_type, target_ref = subscription
+        subscribed_target = target_ref() if target_ref is not None else None
+        return subscribed_type == event_type and subscribed_target is target
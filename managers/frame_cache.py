@@ -0,0 +1,88 @@
+import pygame
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+from utils.frame_set import FrameSet, frame_box_size, frame_format
+
+class FrameCache:
+    """Cache de animações recortadas, compartilhado por todo o processo.
+
+    Cada animação é identificada pelo nome do spritesheet e pelo conjunto de coordenadas,
+    é recortada uma única vez e o mesmo FrameSet imutável é entregue a todas as instâncias.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o cache vazio e os contadores de acertos e falhas."""
+        self._frames: Dict[Tuple[str, Hashable], FrameSet] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Tuple[str, Hashable]) -> bool:
+        return key in self._frames
+
+    def get_frames(
+            self,
+            sheet_name: str,
+            coords: Hashable,
+            slicer: Callable[[], Iterable[pygame.Surface]]
+        ) -> FrameSet:
+        """Retorna a animação em cache ou a recorta com 'slicer' na primeira solicitação."""
+        key = (sheet_name, coords)
+        frames = self._frames.get(key)
+        if frames is None:
+            self.misses += 1
+            frames = self._frames[key] = FrameSet(slicer())
+        else:
+            self.hits += 1
+        return frames
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores do cache e a memória ocupada pelos frames (incluindo os espelhados).
+
+        'area' é a soma das áreas dos frames (sem os espelhados) e 'untrimmed_area', a soma
+        das áreas das caixas originais, antes de aparar as margens transparentes. Os frames que
+        são subsuperfícies de um spritesheet não ocupam memória própria: seus pixels entram em
+        'shared_bytes', e apenas as variantes espelhadas entram em 'bytes'.
+        """
+        frames = [frame for frame_set in self._frames.values() for frame in frame_set]
+        frame_bytes = shared_bytes = 0
+        for frame in frames:
+            size = frame.get_width() * frame.get_height() * frame.get_bytesize()
+            if frame.get_parent() is not None:
+                frame_bytes += size
+                shared_bytes += size
+            else:
+                frame_bytes += 2 * size
+        area = sum(frame.get_width() * frame.get_height() for frame in frames)
+        untrimmed_area = 0
+        for frame in frames:
+            box_width, box_height = frame_box_size(frame)
+            untrimmed_area += box_width * box_height
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'animations': len(self._frames),
+            'frames': len(frames),
+            'bytes': frame_bytes,
+            'shared_bytes': shared_bytes,
+            'area': area,
+            'untrimmed_area': untrimmed_area
+        }
+
+    def format_report(self) -> Dict[str, Dict[str, int]]:
+        """Retorna, para cada spritesheet, quantos frames usam cada caminho de blit ('frame_format').
+
+        As variantes espelhadas têm o mesmo formato dos originais e não são contadas.
+        """
+        report: Dict[str, Counter] = {}
+        for (sheet_name, _), frame_set in self._frames.items():
+            report.setdefault(sheet_name, Counter()).update(frame_format(frame) for frame in frame_set)
+        return {sheet_name: dict(formats) for sheet_name, formats in report.items()}
+
+    def clear(self) -> None:
+        """Descarta as animações em cache e zera os contadores."""
+        self._frames.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+frame_cache = FrameCache()
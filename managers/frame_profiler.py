@@ -0,0 +1,211 @@
+import pygame
+from collections import deque
+from time import perf_counter
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+class _Section:
+    # Gerenciador de contexto reutilizável que soma o tempo gasto em uma seção ao quadro atual.
+    __slots__ = ('_totals', '_name', '_started')
+
+    def __init__(self, totals: Dict[str, float], name: str) -> None:
+        self._totals = totals
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._totals[self._name] = self._totals.get(self._name, 0.0) + perf_counter() - self._started
+
+
+class FrameProfiler:
+    """Mede o tempo de cada quadro e das seções que o compõem.
+
+    As seções são gerenciadores de contexto pré-alocados ('with profiler.section(nome):'),
+    com custo de duas chamadas a 'perf_counter' por uso. Os tempos dos últimos 'WINDOW'
+    quadros ficam em janelas circulares, das quais 'stats' calcula a média e os percentis.
+    O tempo do quadro vai de 'begin_frame' a 'end_frame' e não inclui a espera do limite de FPS.
+
+    Uma seção chamada 'pai.filha' é medida dentro da seção 'pai' (por exemplo,
+    'update.systems' dentro de 'update'): sua fração ('share') é relativa ao tempo do pai,
+    e não ao do quadro, de modo que as frações das seções de primeiro nível somam no máximo
+    100% e as de cada nível, no máximo 100% do pai.
+    """
+
+    WINDOW = 300
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window: int = WINDOW) -> None:
+        """Inicializa o profiler sem nenhum quadro medido."""
+        self._window = window
+        self._frame_times: Deque[float] = deque(maxlen=window)
+        self._section_times: Dict[str, Deque[float]] = {}
+        self._current: Dict[str, float] = {}
+        self._sections: Dict[str, _Section] = {}
+        self._frame_started: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._frame_times)
+
+    def section(self, name: str) -> _Section:
+        """Retorna o gerenciador de contexto que mede a seção informada no quadro atual."""
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self._current, name)
+        return section
+
+    def begin_frame(self) -> None:
+        """Marca o início de um quadro."""
+        self._frame_started = perf_counter()
+
+    def end_frame(self) -> None:
+        """Encerra o quadro atual, guardando seu tempo total e o de cada seção."""
+        if self._frame_started is None:
+            return
+        self._frame_times.append(perf_counter() - self._frame_started)
+        self._frame_started = None
+        for name, elapsed in self._current.items():
+            times = self._section_times.get(name)
+            if times is None:
+                # Seções novas começam zeradas nos quadros anteriores da janela
+                times = self._section_times[name] = deque(
+                    [0.0] * (len(self._frame_times) - 1), maxlen=self._window
+                )
+            times.append(elapsed)
+        for name, times in self._section_times.items():
+            if name not in self._current:
+                times.append(0.0)
+        self._current.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Retorna as estatísticas da janela atual, em milissegundos.
+
+        Returns:
+        - Um dicionário com o número de quadros, o tempo médio do quadro, os percentis
+          ('p50_ms', 'p95_ms', 'p99_ms') e, por seção, o tempo médio e a fração do tempo da
+          seção pai (ou do quadro, para as seções de primeiro nível).
+        """
+        frame_times = sorted(self._frame_times)
+        frame_mean = sum(frame_times) / len(frame_times) if frame_times else 0.0
+        stats: Dict[str, Any] = {'frames': len(frame_times), 'frame_ms': round(frame_mean * 1000, 3)}
+        for percentile in self.PERCENTILES:
+            stats[f'p{percentile}_ms'] = round(self._percentile(frame_times, percentile) * 1000, 3)
+        means = {
+            name: sum(times) / len(times) if times else 0.0 for name, times in self._section_times.items()
+        }
+        sections = {}
+        for name, mean in means.items():
+            total = means.get(_parent(name), frame_mean)
+            sections[name] = {
+                'ms': round(mean * 1000, 3),
+                'share': round(mean / total, 4) if total else 0.0
+            }
+        stats['sections'] = sections
+        return stats
+
+    def reset(self) -> None:
+        """Descarta os quadros medidos."""
+        self._frame_times.clear()
+        self._section_times.clear()
+        self._current.clear()
+        self._frame_started = None
+
+    @staticmethod
+    def _percentile(ordered: List[float], percentile: float) -> float:
+        # Percentil pelo método do posto mais próximo sobre uma lista já ordenada.
+        if not ordered:
+            return 0.0
+        rank = max(1, -(-len(ordered) * percentile // 100))
+        return ordered[int(rank) - 1]
+
+
+def _parent(name: str) -> str:
+    # Nome da seção pai ('update' para 'update.systems'; vazio no primeiro nível).
+    return name.rpartition('.')[0]
+
+
+def _section_tree(sections: Dict[str, Dict[str, float]]) -> List[Tuple[int, str]]:
+    # Ordena as seções em profundidade, cada nível da mais cara para a mais barata, com o nível
+    # de aninhamento. Uma seção cujo pai não foi medido fica no primeiro nível.
+    children: Dict[str, List[str]] = {}
+    for name in sections:
+        parent = _parent(name)
+        children.setdefault(parent if parent in sections else '', []).append(name)
+    ordered: List[Tuple[int, str]] = []
+    by_cost = lambda name: sections[name]['ms']
+    pending = [(0, name) for name in sorted(children.get('', ()), key=by_cost)]
+    while pending:
+        depth, name = pending.pop()
+        ordered.append((depth, name))
+        pending.extend((depth + 1, child) for child in sorted(children.get(name, ()), key=by_cost))
+    return ordered
+
+
+class FrameOverlay:
+    """Painel na tela com as estatísticas do FrameProfiler.
+
+    O texto é renderizado novamente apenas a cada 'REFRESH_FRAMES' quadros; nos demais,
+    desenhar o painel custa um único blit.
+    """
+
+    REFRESH_FRAMES = 30
+    POSITION = (8, 8)
+    FONT_SIZE = 18
+    TEXT_COLOR = (255, 255, 255)
+    BACKGROUND_COLOR = (0, 0, 0, 170)
+    PADDING = 4
+
+    def __init__(self, profiler: FrameProfiler) -> None:
+        """Inicializa o painel oculto."""
+        self._profiler = profiler
+        self._font: Optional[pygame.font.Font] = None
+        self._surface: Optional[pygame.Surface] = None
+        self._frames_until_refresh = 0
+        self.visible = False
+
+    def toggle(self) -> None:
+        """Mostra ou oculta o painel."""
+        self.visible = not self.visible
+        self._frames_until_refresh = 0
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """Desenha o painel na tela e retorna a área ocupada (vazia se estiver oculto)."""
+        if not self.visible:
+            return pygame.Rect(self.POSITION, (0, 0))
+        if self._frames_until_refresh <= 0 or self._surface is None:
+            self._surface = self._render(self.lines(self._profiler.stats()))
+            self._frames_until_refresh = self.REFRESH_FRAMES
+        self._frames_until_refresh -= 1
+        return screen.blit(self._surface, self.POSITION)
+
+    @staticmethod
+    def lines(stats: Dict[str, Any]) -> List[str]:
+        """Formata as estatísticas em linhas de texto, das seções mais caras para as mais baratas.
+
+        As seções aninhadas aparecem recuadas logo abaixo da seção pai, com a fração do pai.
+        """
+        lines = [
+            f"quadro {stats['frame_ms']:.2f} ms  ({stats['frames']} quadros)",
+            f"p50 {stats['p50_ms']:.2f}  p95 {stats['p95_ms']:.2f}  p99 {stats['p99_ms']:.2f} ms"
+        ]
+        sections = stats['sections']
+        lines.extend(
+            f"{'  ' * depth + name:<24} {sections[name]['ms']:6.2f} ms {sections[name]['share']:6.1%}"
+            for depth, name in _section_tree(sections)
+        )
+        return lines
+
+    def _render(self, lines: List[str]) -> pygame.Surface:
+        # Renderiza as linhas sobre um fundo translúcido.
+        if self._font is None:
+            self._font = pygame.font.Font(None, self.FONT_SIZE)
+        rendered = [self._font.render(line, True, self.TEXT_COLOR) for line in lines]
+        line_height = self._font.get_linesize()
+        width = max(surface.get_width() for surface in rendered) + 2 * self.PADDING
+        height = line_height * len(rendered) + 2 * self.PADDING
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill(self.BACKGROUND_COLOR)
+        for index, line in enumerate(rendered):
+            surface.blit(line, (self.PADDING, self.PADDING + index * line_height))
+        return surface
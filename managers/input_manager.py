@@ -0,0 +1,88 @@
+import pygame
+from typing import Iterable, Optional, Sequence, Union
+from managers.input_recording import InputRecorder, InputReplay, decode_keys, encode_keys, RESET_BIT
+
+class KeySnapshot:
+    """Estado imutável das teclas em um tick.
+
+    Indexável da mesma forma que o retorno de 'pygame.key.get_pressed()'.
+    """
+
+    __slots__ = ('_pressed',)
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        self._pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+
+
+class InputManager:
+    """Centraliza a leitura do teclado, mantendo um único snapshot por tick.
+
+    No modo interativo o snapshot vem de 'pygame.key.get_pressed()'; no modo headless
+    as teclas são definidas de forma programática com 'set_pressed'. O snapshot de cada tick
+    pode ser gravado com um InputRecorder e reproduzido com um InputReplay, que passa a
+    substituir as teclas lidas ou definidas.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o gerenciador sem nenhuma tecla pressionada."""
+        self._keys: Union[KeySnapshot, Sequence[bool]] = KeySnapshot()
+        self._reset_requested = False
+        self._recorder: Optional[InputRecorder] = None
+        self._replay: Optional[InputReplay] = None
+
+    @property
+    def replay(self) -> Optional[InputReplay]:
+        """Gravação em reprodução, se houver."""
+        return self._replay
+
+    def poll(self) -> None:
+        """Lê o estado atual do teclado."""
+        self._keys = pygame.key.get_pressed()
+
+    def set_pressed(self, keys: Iterable[int]) -> None:
+        """Define as teclas pressionadas no tick atual (entradas scriptadas)."""
+        self._keys = KeySnapshot(keys)
+
+    def get_pressed(self) -> Union[KeySnapshot, Sequence[bool]]:
+        """Retorna o snapshot de teclas do tick atual."""
+        return self._keys
+
+    def request_reset(self) -> None:
+        """Pede o reset do jogo no início do próximo tick (gravado junto com as teclas)."""
+        self._reset_requested = True
+
+    def start_recording(self, recorder: InputRecorder) -> None:
+        """Passa a gravar o snapshot de cada tick."""
+        self._recorder = recorder
+
+    def stop_recording(self, tick_count: int) -> None:
+        """Finaliza a gravação em andamento, informando o total de ticks."""
+        if self._recorder is not None:
+            self._recorder.close(tick_count)
+            self._recorder = None
+
+    def start_replay(self, replay: InputReplay) -> None:
+        """Passa a reproduzir as entradas da gravação, ignorando o teclado e 'set_pressed'."""
+        self._replay = replay
+
+    def begin_tick(self, tick: int) -> bool:
+        """Fixa o snapshot do tick, aplicando o replay e a gravação.
+
+        Retorna True se o tick deve começar com o reset do jogo.
+        """
+        if self._replay is not None:
+            mask = self._replay.mask_at(tick)
+            self._keys = KeySnapshot(decode_keys(mask))
+            reset = bool(mask & RESET_BIT)
+        else:
+            reset = self._reset_requested
+        self._reset_requested = False
+        if self._recorder is not None:
+            mask = encode_keys(self._keys, reset)
+            # O jogo vê exatamente o que foi gravado, garantindo um replay idêntico
+            self._keys = KeySnapshot(decode_keys(mask))
+            self._recorder.record(tick, mask)
+        return reset
@@ -0,0 +1,83 @@
+import struct
+import pygame
+from bisect import bisect_right
+from typing import BinaryIO, FrozenSet, List, Sequence, Tuple
+
+# Formato do arquivo: cabeçalho (assinatura, versão, ticks por segundo) seguido de registros
+# (tick, máscara de teclas) gravados apenas quando a máscara muda. O último registro tem o
+# bit END_BIT e o tick final da sessão.
+MAGIC = b'SLRP'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+RECORD = struct.Struct('<IH')
+
+TRACKED_KEYS: Tuple[int, ...] = (pygame.K_a, pygame.K_d, pygame.K_SPACE, pygame.K_LCTRL)
+RESET_BIT = 1 << 14
+END_BIT = 1 << 15
+
+
+def encode_keys(keys: Sequence[bool], reset: bool = False) -> int:
+    """Converte um snapshot de teclas (e o pedido de reset) na máscara de bits gravada."""
+    mask = RESET_BIT if reset else 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask: int) -> FrozenSet[int]:
+    """Retorna as teclas pressionadas representadas pela máscara."""
+    return frozenset(key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit))
+
+
+class InputRecorder:
+    """Grava as entradas de uma sessão, um registro por mudança de teclas."""
+
+    def __init__(self, path: str, ticks_per_second: int) -> None:
+        """Abre o arquivo de gravação e escreve o cabeçalho."""
+        self.path = path
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, ticks_per_second))
+        self._last_mask = None
+
+    def record(self, tick: int, mask: int) -> None:
+        """Registra a máscara do tick, caso seja diferente da anterior."""
+        if mask != self._last_mask:
+            self._file.write(RECORD.pack(tick, mask))
+            self._last_mask = mask
+
+    def close(self, tick_count: int) -> None:
+        """Grava o registro final com o total de ticks e fecha o arquivo."""
+        if not self._file.closed:
+            self._file.write(RECORD.pack(tick_count, END_BIT))
+            self._file.close()
+
+
+class InputReplay:
+    """Reproduz uma sessão gravada pelo InputRecorder, tick a tick."""
+
+    def __init__(self, path: str) -> None:
+        """Lê e valida o arquivo de gravação."""
+        with open(path, 'rb') as replay_file:
+            data = replay_file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f'Arquivo de replay inválido: {path}')
+        magic, version, self.ticks_per_second = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'Arquivo de replay inválido ou de versão não suportada: {path}')
+        self._ticks: List[int] = []
+        self._masks: List[int] = []
+        self.length = None
+        for tick, mask in RECORD.iter_unpack(data[HEADER.size:]):
+            if mask & END_BIT:
+                self.length = tick
+                break
+            self._ticks.append(tick)
+            self._masks.append(mask)
+        if self.length is None:
+            raise ValueError(f'Replay incompleto (sem registro final): {path}')
+
+    def mask_at(self, tick: int) -> int:
+        """Retorna a máscara de teclas ativa no tick informado."""
+        index = bisect_right(self._ticks, tick) - 1
+        return self._masks[index] if index >= 0 else 0
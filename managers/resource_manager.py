@@ -1,74 +1,228 @@
+import os
+import time
+import weakref
 import pygame
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from config.constants import IMAGES_DIR, SOUNDS_DIR
+from managers.asset_pack import Animations, AssetPack
 
 class ResourceManager:
-    """Gerencia os recursos do jogo."""
+    """Gerencia os recursos do jogo.
 
-    def __init__(self) -> None:
-        """Inicializa os dicionários para armazenar imagens e sons."""
-        self.images = {}
+    Os arquivos são lidos e decodificados em paralelo por um pool de threads, pois os
+    carregadores de imagem e som do pygame liberam o GIL durante a maior parte do trabalho.
+    A conversão das imagens para o formato da tela é feita depois, na thread principal.
+
+    As imagens residentes ficam em ordem de uso recente. Uma imagem liberada ('release_image'),
+    ou descartada para respeitar o orçamento de memória, é carregada de novo sob demanda por
+    'get_image'; enquanto outro objeto ainda a referenciar, a mesma superfície é reaproveitada.
+    """
+
+    MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+    IMAGE_FILES = {
+        # Scenario
+        'background': 'background_2_sized.png',
+        # Player
+        'player_attacking': 'attack_spritesheet.png',
+        'player_spritesheet': 'player_spritesheet.png',
+        'cannon_attack': 'cannon_spritesheet.png',
+        'stats_interface': 'stats_interface.png',
+        'life_bar': 'life_bar.png',
+        'xp_bar': 'xp_bar.png',
+        # Enemy
+        'soul_default': 'soul_1.png',
+        'soul_attacking': 'soul_attacking.png',
+        'troll_idle_spritesheet': 'troll_idle_spritesheet.png',
+        'troll_attack_spritesheet': 'troll_attack_spritesheet.png',
+        'troll_damage_spritesheet': 'troll_damage_spritesheet.png',
+        'troll_death_spritesheet': 'troll_death_spritesheet.png',
+        'troll_spawn_spritesheet': 'troll_spawn_spritesheet.png'
+    }
+    SOUND_FILES = {
+        # Player
+        #'attack_sound': 'attack_sound.wav',
+        'attack_sound': 'zoio1.wav',
+        'attack_sound_2': 'zoio2.wav',
+        'cannon_sound': 'zoio3.wav',
+        'player_jump': 'player_jump.wav',
+        # Enemy
+        'blood_pop': 'blood_pop.wav',
+        'game_over': 'game_over.wav',
+        'hit_player': 'hit_player.wav',
+        'level_complete': 'level_complete.wav',
+        'mob_pain': 'monster_pain.wav',
+        'troll_pain': 'troll_pain.wav',
+        'troll_death': 'troll_death.wav'
+    }
+
+    def __init__(
+            self, 
+            asset_pack: Optional[str] = None, 
+            animations: Animations = (), 
+            memory_budget: Optional[int] = None
+        ) -> None:
+        """Inicializa os dicionários para armazenar imagens e sons.
+
+        Args:
+        - asset_pack: Caminho do pacote de frames pré-recortados. Com ele, as imagens vêm do
+          pacote (gerado novamente se os arquivos de origem mudarem) e os spritesheets só são
+          decodificados se forem solicitados inteiros.
+        - animations: Tabela de animações (spritesheet, coordenadas) gravada no pacote.
+        - memory_budget: Limite, em bytes, para os pixels das imagens residentes. Acima dele,
+          as imagens usadas há mais tempo são descartadas (None para não limitar).
+        """
+        self.images: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
         self.sounds = {}
-        self.file_paths = {
-            'images': {
-                # Scenario
-                'background': 'background_2_sized.png',
-                # Player
-                'player_attacking': 'attack_spritesheet.png',
-                'player_spritesheet': 'player_spritesheet.png',
-                'cannon_attack': 'cannon_spritesheet.png',
-                'stats_interface': 'stats_interface.png',
-                'life_bar': 'life_bar.png',
-                'xp_bar': 'xp_bar.png',
-                # Enemy
-                'soul_default': 'soul_1.png',
-                'soul_attacking': 'soul_attacking.png',
-                'troll_idle_spritesheet': 'troll_idle_spritesheet.png',
-                'troll_attack_spritesheet': 'troll_attack_spritesheet.png',
-                'troll_damage_spritesheet': 'troll_damage_spritesheet.png',
-                'troll_death_spritesheet': 'troll_death_spritesheet.png',
-                'troll_spawn_spritesheet': 'troll_spawn_spritesheet.png'
-            },
-            'sounds': {
-                # Player
-                #'attack_sound': 'attack_sound.wav',
-                'attack_sound': 'zoio1.wav',
-                'attack_sound_2': 'zoio2.wav',
-                'cannon_sound': 'zoio3.wav',
-                'player_jump': 'player_jump.wav',
-                # Enemy
-                'blood_pop': 'blood_pop.wav',
-                'game_over': 'game_over.wav',
-                'hit_player': 'hit_player.wav',
-                'level_complete': 'level_complete.wav',
-                'mob_pain': 'monster_pain.wav',
-                'troll_pain': 'troll_pain.wav',
-                'troll_death': 'troll_death.wav'
-            }
-        }
+        self.load_time = 0.0
+        self.memory_budget = memory_budget
+        self.evictions = 0
+        self.reloads = 0
+        self._released: Dict[str, weakref.ref] = {}
+        self.pack: Optional[AssetPack] = None
+        self._asset_pack = asset_pack
+        self._animations = animations
+        self.file_paths = {'images': dict(self.IMAGE_FILES), 'sounds': dict(self.SOUND_FILES)}
         self.load_resources()
 
     def load_resources(self) -> None:
-        """Carrega imagens e sons necessários e armazena nos dicionários."""
+        """Carrega imagens e sons necessários e armazena nos dicionários.
+
+        O tempo total do carregamento fica em 'load_time'.
+        """
+        started = time.perf_counter()
         try:
-            self._load_images()
-            self._load_sounds()
+            image_files = self.file_paths['images']
+            if self._asset_pack:
+                image_files = self._load_pack()
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                images = self._submit(executor, pygame.image.load, IMAGES_DIR, image_files)
+                sounds = self._submit(executor, pygame.mixer.Sound, SOUNDS_DIR, self.file_paths['sounds'])
+                self._load_images(images)
+                self._load_sounds(sounds)
         except FileNotFoundError as e:
             print(f"Erro: {e} - Arquivo não encontrado.")
         else:
-            print(f"Sucesso ao carregar os recursos!")
+            self.load_time = time.perf_counter() - started
+            print(f"Sucesso ao carregar os recursos! ({self.load_time:.2f}s)")
+
+    @staticmethod
+    def _submit(
+            executor: ThreadPoolExecutor, 
+            loader: Callable[[str], object], 
+            directory: str, 
+            files: Dict[str, str]
+        ) -> Dict[str, Future]:
+        # Envia a decodificação dos arquivos ao pool, dos maiores para os menores.
+        paths = {name: f'{directory}/{file}' for name, file in files.items()}
+        ordered = sorted(paths, key=lambda name: os.path.getsize(paths[name]), reverse=True)
+        futures = {name: executor.submit(loader, paths[name]) for name in ordered}
+        return {name: futures[name] for name in files}
 
-    def _load_images(self) -> None:
+    def _load_pack(self) -> Dict[str, str]:
+        # Abre (ou gera) o pacote de frames e retorna as imagens que ainda precisam ser decodificadas.
+        self.pack = AssetPack.ensure(self._asset_pack, IMAGES_DIR, self.file_paths['images'], self._animations)
+        sliced = {sheet_name for sheet_name, coords in self._animations}
+        pending = {}
         for name, file in self.file_paths['images'].items():
-            image = pygame.image.load(f'{IMAGES_DIR}/{file}')
-            self.images[name] = image.convert_alpha() if name != 'background' else image.convert()
+            image = self.pack.image(name)
+            if image is not None:
+                self._store(name, image)
+            elif name not in sliced:
+                pending[name] = file
+        return pending
 
-    def _load_sounds(self) -> None:
-        for name, file in self.file_paths['sounds'].items():
-            self.sounds[name] = pygame.mixer.Sound(f'{SOUNDS_DIR}/{file}')
+    def _load_images(self, images: Dict[str, Future]) -> None:
+        # 'convert' depende da janela e é feito na thread principal, na ordem original.
+        for name, future in images.items():
+            self._store(name, self._convert(name, future.result()))
+
+    def _load_sounds(self, sounds: Dict[str, Future]) -> None:
+        for name, future in sounds.items():
+            self.sounds[name] = future.result()
 
     def get_image(self, name: str) -> pygame.Surface:
-        """Retorna uma imagem com base no 'name'."""
-        return self.images.get(name)
+        """Retorna uma imagem com base no 'name'.
+
+        Imagens liberadas (e, com o pacote de frames, os spritesheets gravados apenas
+        recortados) são carregadas novamente na primeira solicitação.
+        """
+        image = self.images.get(name)
+        if image is not None:
+            self.images.move_to_end(name)
+            return image
+        if name not in self.file_paths['images']:
+            return None
+        released = self._released.get(name)
+        image = released() if released is not None else None
+        if image is None:
+            image = self._convert(name, pygame.image.load(f"{IMAGES_DIR}/{self.file_paths['images'][name]}"))
+            self.reloads += 1
+        self._store(name, image)
+        return image
+
+    def release_image(self, name: str) -> None:
+        """Deixa de manter a imagem residente (ex.: um spritesheet cujos frames já foram recortados)."""
+        image = self.images.pop(name, None)
+        if image is not None:
+            self._released[name] = weakref.ref(image)
+
+    def resident_bytes(self) -> int:
+        """Retorna o total de bytes de pixels das imagens residentes."""
+        return sum(self.surface_bytes(image) for image in self.images.values())
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Retorna o uso de memória das imagens.
+
+        Returns:
+        - Um dicionário com o orçamento, o total residente, os bytes de cada imagem residente
+          (da menos para a mais recentemente usada), as imagens liberadas que ainda são
+          referenciadas por outros objetos e os contadores de descartes e recarregamentos.
+        """
+        released_in_use = {}
+        for name, released in self._released.items():
+            image = released()
+            if image is not None:
+                released_in_use[name] = self.surface_bytes(image)
+        return {
+            'budget': self.memory_budget,
+            'resident_bytes': self.resident_bytes(),
+            'images': {name: self.surface_bytes(image) for name, image in self.images.items()},
+            'released_in_use': released_in_use,
+            'evictions': self.evictions,
+            'reloads': self.reloads
+        }
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Retorna o número de bytes ocupados pelos pixels da superfície."""
+        return surface.get_pitch() * surface.get_height()
+
+    def _store(self, name: str, image: pygame.Surface) -> None:
+        # Torna a imagem residente (a mais recentemente usada) e aplica o orçamento de memória.
+        self.images[name] = image
+        self.images.move_to_end(name)
+        self._released.pop(name, None)
+        if self.memory_budget is None:
+            return
+        resident = self.resident_bytes()
+        # Uma imagem maior que o orçamento inteiro é entregue, mas não fica residente
+        while resident > self.memory_budget and self.images:
+            oldest = next(iter(self.images))
+            resident -= self.surface_bytes(self.images[oldest])
+            self.release_image(oldest)
+            self.evictions += 1
+
+    def get_frames(self, sheet_name: str, coords: Optional[Sequence]) -> Optional[List[pygame.Surface]]:
+        """Retorna os frames pré-recortados do pacote, ou None se não houver pacote ou animação."""
+        return self.pack.frames(sheet_name, coords) if self.pack is not None else None
+
+    @staticmethod
+    def _convert(name: str, image: pygame.Surface) -> pygame.Surface:
+        # Converte a imagem para o formato da tela (o fundo não tem transparência).
+        return image.convert_alpha() if name != 'background' else image.convert()
 
     def get_sound(self, name: str) -> pygame.mixer.Sound:
         """Retorna um som com base no 'name'."""
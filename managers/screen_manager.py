@@ -1,23 +1,64 @@
 import pygame
+from typing import Iterable, Optional, Tuple
 from managers.resource_manager import ResourceManager
 from core.camera import Camera
 from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
 
 class ScreenManager:
-    """ Gerencia e desenha a janela do jogo. """
+    """ Gerencia e desenha a janela do jogo.
+
+    O fundo é desenhado apenas na região visível pela câmera: a área recortada do fundo é
+    calculada uma vez por posição de câmera e a limpeza da tela é omitida quando o fundo
+    cobre a janela inteira.
+    """
 
     def __init__(self) -> None:
         """ Inicializa e configura a janela e o relógio do jogo. """
         self.screen = pygame.display.set_mode(size=(SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(title="Slayer")
         self.clock = pygame.time.Clock()
+        self._background: Optional[pygame.Surface] = None
+        self._camera_position: Optional[Tuple[int, int]] = None
+        self._background_area = pygame.Rect(0, 0, 0, 0)
+        self._background_position = (0, 0)
+        self._background_covers_screen = False
 
     def draw_window(
             self: "ScreenManager", 
             resource_manager: ResourceManager, 
             camera: Camera
         ) -> None:
-        """ Desenha a janela e a imagem de fundo. """
-        self.screen.fill(color=BLACK)
-        background = resource_manager.get_image('background')
-        self.screen.blit(background, (camera.camera.x, camera.camera.y))
\ No newline at end of file
+        """ Desenha a janela e a parte visível da imagem de fundo. """
+        background = self._get_background(resource_manager, camera)
+        if not self._background_covers_screen:
+            self.screen.fill(color=BLACK)
+        self.screen.blit(background, self._background_position, self._background_area)
+
+    def restore_background(
+            self: "ScreenManager", 
+            resource_manager: ResourceManager, 
+            camera: Camera, 
+            rects: Iterable[pygame.Rect]
+        ) -> None:
+        """ Redesenha o fundo apenas nas áreas da tela informadas. """
+        background = self._get_background(resource_manager, camera)
+        camera_x, camera_y = camera.camera.topleft
+        for rect in rects:
+            if not self._background_covers_screen:
+                self.screen.fill(BLACK, rect)
+            self.screen.blit(background, rect, rect.move(-camera_x, -camera_y))
+
+    def _get_background(self, resource_manager: ResourceManager, camera: Camera) -> pygame.Surface:
+        # Retorna o fundo em cache, recalculando a área visível quando a câmera muda de posição.
+        if self._background is None:
+            self._background = resource_manager.get_image('background')
+        position = camera.camera.topleft
+        if position != self._camera_position:
+            self._camera_position = position
+            screen_rect = self.screen.get_rect()
+            visible = screen_rect.move(-position[0], -position[1])
+            area = visible.clip(self._background.get_rect())
+            self._background_area = area
+            self._background_position = (area.x + position[0], area.y + position[1])
+            self._background_covers_screen = area.size == screen_rect.size
+        return self._background
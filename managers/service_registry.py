@@ -0,0 +1,29 @@
+from typing import Dict, Type, TypeVar
+
+T = TypeVar('T')
+
+class ServiceRegistry:
+    """Registro tipado dos serviços compartilhados do jogo.
+
+    Substitui as consultas feitas pelo EventManager ('notify' com valor de retorno):
+    quem precisa de um serviço obtém uma referência direta a ele uma única vez, e o
+    barramento de eventos passa a transportar apenas eventos.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o registro vazio."""
+        self._services: Dict[type, object] = {}
+
+    def register(self, service_type: Type[T], service: T) -> None:
+        """Registra a instância que atende ao tipo de serviço informado."""
+        self._services[service_type] = service
+
+    def get(self, service_type: Type[T]) -> T:
+        """Retorna a instância registrada para o tipo de serviço.
+
+        Levanta LookupError se nenhuma instância foi registrada para o tipo.
+        """
+        try:
+            return self._services[service_type]
+        except KeyError:
+            raise LookupError(f'Serviço não registrado: {service_type.__name__}') from None
@@ -1,13 +1,48 @@
 import pygame
-from typing import Any, Dict
+import weakref
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 from managers.resource_manager import ResourceManager
 from managers.event_manager import EventManager
+from managers.frame_cache import FrameCache, frame_cache as shared_frame_cache
+from managers.frame_profiler import FrameProfiler
+from utils.frame_set import FrameSet, frame_anchor, frame_view, optimize_frame, trim_frame
+from utils.collision_index import CollisionIndex
+from managers.entity_store import EntityStore
 from entities.player import Player
 from entities.mob import Mob
 from core.camera import Camera
 
+if TYPE_CHECKING:
+    from managers.crowd_simulation import CrowdSimulation
+
+class RenderPlan:
+    """Elementos extras desenhados junto com uma entidade, decididos uma única vez ao adicioná-la.
+
+    Guarda as funções da classe (e não métodos ligados) para não manter a entidade viva, além
+    da última imagem desenhada e da sua âncora (deslocamento dos frames aparados).
+    """
+
+    __slots__ = ('draw_hud', 'overlay_blit', 'image', 'anchor')
+
+    def __init__(self, entity: pygame.sprite.Sprite) -> None:
+        """Define o HUD (fixo na tela) ou o overlay (acompanha a entidade) a desenhar."""
+        entity_type = type(entity)
+        self.draw_hud: Optional[Callable[..., pygame.Rect]] = getattr(entity_type, 'draw_stats_bar', None)
+        self.overlay_blit: Optional[Callable[..., Tuple[pygame.Surface, Tuple[int, int]]]] = (
+            None if self.draw_hud else getattr(entity_type, 'life_bar_blit', None)
+        )
+        self.image: Optional[pygame.Surface] = None
+        self.anchor = (0, 0)
+
+
 class SpriteManager:
-    """Gerencia os sprites do jogo."""
+    """Gerencia os sprites do jogo.
+
+    Ao desenhar, as entidades fora da área visível da câmera (mais 'CULL_MARGIN' pixels)
+    são ignoradas; o HUD é sempre desenhado.
+    """
+
+    CULL_MARGIN = 64
     
     PLAYER_SPRITE_COORDS = [
         (5, 8, 290, 148),    # Sprite 1 (1ª linha, 1ª coluna)
@@ -107,18 +142,54 @@ class SpriteManager:
         (586, 29, 169, 105),
         (800, 26, 169, 108)
     ]
+    # Animações recortadas pelas fábricas (spritesheet, coordenadas), gravadas no pacote de frames
+    ANIMATIONS = (
+        ('player_spritesheet', PLAYER_SPRITE_COORDS),
+        ('player_attacking', ATTACK_SPRITE_COORDS),
+        ('cannon_attack', CANNON_ATTACK_COORDS),
+        ('troll_idle_spritesheet', TROLL_SPRITE_COORDS),
+        ('troll_attack_spritesheet', TROLL_ATTACK_COORDS),
+        ('troll_damage_spritesheet', TROLL_DAMAGE_COORDS),
+        ('troll_death_spritesheet', TROLL_DEATH_COORDS)
+    )
 
     def __init__(
             self: 'SpriteManager', 
             resource_manager: ResourceManager, 
-            event_manager: EventManager
+            event_manager: EventManager,
+            frame_cache: Optional[FrameCache] = None,
+            profiler: Optional[FrameProfiler] = None,
+            frame_views: bool = False,
+            optimize_frames: bool = True
         ) -> None:
-        """Inicializa os grupos de sprites."""
+        """Inicializa os grupos de sprites.
+
+        Por padrão utiliza o cache de frames compartilhado pelo processo. O 'profiler'
+        recebe o tempo de cada etapa de 'update_all'. Com 'frame_views', os frames são
+        subsuperfícies que compartilham os pixels do spritesheet em vez de cópias; o
+        spritesheet continua na memória enquanto os frames existirem. Com 'optimize_frames',
+        os frames recortados são convertidos para o formato de blit mais rápido
+        ('optimize_frame'); um SpriteManager sem a otimização deve usar um cache de frames
+        próprio.
+        """
         self.event_manager = event_manager
         self.resource_manager = resource_manager
+        self.frame_cache = frame_cache or shared_frame_cache
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.frame_views = frame_views
+        self.optimize_frames = optimize_frames
         self.all_sprites = pygame.sprite.Group()
         self.player_sprites = pygame.sprite.Group()
         self.mob_sprites = pygame.sprite.Group()
+        self.player_index = CollisionIndex(self.player_sprites)
+        self.mob_index = CollisionIndex(self.mob_sprites)
+        self._previous_positions: Dict[pygame.sprite.Sprite, Tuple[int, int]] = {}
+        self._render_plans: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.crowd_simulation: Optional['CrowdSimulation'] = None
+        self.entity_store = EntityStore()
+        self._sheet_animations: Dict[str, List[Tuple[Tuple[int, int, int, int], ...]]] = {}
+        for sheet_name, coords in self.ANIMATIONS:
+            self._sheet_animations.setdefault(sheet_name, []).append(tuple(coords))
         self.player_sprite_coords = self.PLAYER_SPRITE_COORDS
         self.attack_sprite_coords = self.ATTACK_SPRITE_COORDS
         self.cannon_attack_coords = self.CANNON_ATTACK_COORDS
@@ -129,35 +200,91 @@ class SpriteManager:
             'death': self.TROLL_DEATH_COORDS,
             'attack': self.TROLL_ATTACK_COORDS
         }
-        self._subscribe_to_events()
-
-    def _subscribe_to_events(self) -> None:
-        self.event_manager.subscribe('get_mob_sprites', self)
-        self.event_manager.subscribe('get_player_sprites', self)
 
     def add_player(self, player: Player) -> None:
         """ Adiciona o player aos grupos de sprites. """
         self.player_sprites.add(player)
         self.all_sprites.add(player)
+        self._render_plans[player] = RenderPlan(player)
 
     def add_mob(self, mob: Mob) -> None:
         """ Adiciona um mob ao grupo de mobs e grupo de todos os sprites. """
         self.mob_sprites.add(mob)
         self.all_sprites.add(mob)
+        self._render_plans[mob] = RenderPlan(mob)
 
-    def draw_all(self, screen: pygame.Surface, camera: Camera) -> None:
-        """Desenha os sprites e seus elementos na tela."""
+    def draw_all(self, screen: pygame.Surface, camera: Camera, alpha: float = 1.0) -> List[pygame.Rect]:
+        """Desenha os sprites e seus elementos na tela, interpolando entre os dois últimos ticks.
+
+        Os sprites visíveis e, em seguida, suas barras de vida são enviados em lotes com
+        'Surface.blits'; o HUD é desenhado por último, sobre todos eles.
+        Retorna as áreas da tela desenhadas (sprites, barras de vida e HUD).
+        """
+        sprite_blits = []
+        overlay_blits = []
+        huds = []
+        visible_area = camera.visible_area(self.CULL_MARGIN)
+        camera_x, camera_y = camera.camera.topleft
+        plans = self._render_plans
         for entity in self.all_sprites:
-            screen.blit(entity.image, camera.apply(entity))
-            if hasattr(entity, 'draw_stats_bar'):
-                entity.draw_stats_bar(screen)
-            elif hasattr(entity, 'draw_life_bar'):
-                entity.draw_life_bar(screen, camera)
+            plan = plans.get(entity) or plans.setdefault(entity, RenderPlan(entity))
+            if entity.rect.colliderect(visible_area):
+                offset = self._interpolation_offset(entity, alpha)
+                image = entity.image
+                if image is not plan.image:
+                    plan.image, plan.anchor = image, frame_anchor(image)
+                sprite_blits.append((
+                    image, 
+                    (
+                        entity.rect.x + camera_x + offset[0] + plan.anchor[0], 
+                        entity.rect.y + camera_y + offset[1] + plan.anchor[1]
+                    )
+                ))
+                if plan.overlay_blit:
+                    overlay_blits.append(plan.overlay_blit(entity, camera, offset))
+            if plan.draw_hud:
+                huds.append((plan.draw_hud, entity))
+        drawn = screen.blits(sprite_blits)
+        drawn.extend(screen.blits(overlay_blits))
+        drawn.extend(draw_hud(entity, screen) for draw_hud, entity in huds)
+        return drawn
+
+    def store_previous_positions(self) -> None:
+        """Guarda a posição das entidades antes de um passo de simulação."""
+        self._previous_positions = {entity: entity.rect.midbottom for entity in self.all_sprites}
+
+    def _interpolation_offset(self, entity: pygame.sprite.Sprite, alpha: float) -> Tuple[int, int]:
+        # Retorna o deslocamento entre a posição atual e a interpolada da entidade.
+        previous = self._previous_positions.get(entity)
+        if previous is None or alpha >= 1:
+            return (0, 0)
+        current_x, current_y = entity.rect.midbottom
+        return (
+            round((previous[0] - current_x) * (1 - alpha)), 
+            round((previous[1] - current_y) * (1 - alpha))
+        )
     
     def update_all(self, delta_time: float) -> None:
-        """ Chama o método update das entidades. """
-        self.player_sprites.update(delta_time)
-        self.mob_sprites.update(delta_time)
+        """ Chama o método update das entidades. 
+        
+        Cada índice de colisão é atualizado antes do grupo que o consulta: os players
+        consultam os mobs e os mobs consultam os players. Os mobs são atualizados pelos
+        sistemas do EntityStore; no modo multidão, a CrowdSimulation os move antes.
+        """
+        section = self.profiler.section
+        with section('update.mob_index'):
+            self.mob_index.refresh()
+        with section('update.players'):
+            self.player_sprites.update(delta_time)
+        with section('update.player_index'):
+            self.player_index.refresh()
+        with section('update.sync'):
+            self.entity_store.sync(self.mob_sprites)
+        if self.crowd_simulation is not None:
+            with section('update.crowd'):
+                self.crowd_simulation.step(delta_time)
+        with section('update.systems'):
+            self.entity_store.run(delta_time)
 
     def get_sprite(
             self, 
@@ -171,6 +298,52 @@ class SpriteManager:
         sprite = pygame.Surface((width, height), pygame.SRCALPHA)
         sprite.blit(spritesheet, (0, 0), (x, y, width, height))
         return sprite
+
+    def get_frames(
+            self, 
+            sheet_name: str, 
+            coords: Optional[Sequence[Tuple[int, int, int, int]]] = None
+        ) -> FrameSet:
+        """Retorna a animação de 'sheet_name' recortada nas coordenadas, usando o cache de frames.
+
+        Os frames recortados são aparados nas margens transparentes ('trim_frame') e convertidos
+        para o formato de blit mais rápido ('optimize_frame'); sem coordenadas, a imagem inteira
+        é tratada como um único frame. Depois que todas as animações do spritesheet (segundo
+        'ANIMATIONS') estão no cache, o ResourceManager deixa de mantê-lo residente.
+        """
+        key = tuple(coords) if coords is not None else None
+        frames = self.frame_cache.get_frames(
+            sheet_name, key, lambda: self._slice_frames(sheet_name, key)
+        )
+        if key is not None:
+            self._release_sheet(sheet_name, key)
+        return frames
+
+    def _release_sheet(self, sheet_name: str, key: Tuple[Tuple[int, int, int, int], ...]) -> None:
+        # Libera o spritesheet quando nenhuma das suas animações precisa mais ser recortada.
+        pending = self._sheet_animations.get(sheet_name, (key,))
+        if all((sheet_name, animation) in self.frame_cache for animation in pending):
+            self.resource_manager.release_image(sheet_name)
+
+    def _slice_frames(
+            self, 
+            sheet_name: str, 
+            coords: Optional[Tuple[Tuple[int, int, int, int], ...]]
+        ) -> List[pygame.Surface]:
+        # Recorta, apara e otimiza os frames do spritesheet (ou retorna a imagem inteira, sem
+        # coordenadas), a menos que já estejam recortados no pacote de frames.
+        frames = self.resource_manager.get_frames(sheet_name, coords)
+        if frames is None:
+            spritesheet = self.resource_manager.get_image(sheet_name)
+            if coords is None:
+                frames = [spritesheet]
+            elif self.frame_views:
+                return [frame_view(spritesheet, coord) for coord in coords]
+            else:
+                frames = [trim_frame(self.get_sprite(spritesheet, *coord)) for coord in coords]
+        if not self.optimize_frames:
+            return frames
+        return [optimize_frame(frame) for frame in frames]
     
     def get_player_sprites(self) -> pygame.sprite.Group:
         return self.player_sprites
@@ -178,13 +351,6 @@ class SpriteManager:
     def get_mob_sprites(self) -> pygame.sprite.Group:
         return self.mob_sprites
     
-    def notify(self, event: Dict[str, Any]) -> pygame.Surface | None:
-        """Chama os métodos inscritos no tipo do evento recebido."""
-        if event['type'] == 'get_mob_sprites':
-            return self.get_mob_sprites()
-        elif event['type'] == 'get_player_sprites':
-            return self.get_player_sprites()
-    
     def reset_game(self) -> None:
         """Reseta o estado das entidades e gera um novo mob."""
         print('\n Reset... \n')
@@ -0,0 +1,56 @@
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from managers.sprite_manager import SpriteManager
+    from utils.collision_index import CollisionIndex
+    from entities.player import Player
+    from entities.mob import Mob
+
+class World:
+    """Consultas tipadas ao estado do mundo, com resultados em cache por tick.
+
+    Os componentes recebem uma referência ao World na construção e leem 'players',
+    'mobs' e os índices de colisão diretamente, sem passar pelo EventManager.
+    As listas são recalculadas em cada 'begin_tick' e quando o tamanho do grupo muda (uma
+    entidade que sai some no mesmo tick); o reset do jogo, que troca os mobs, acontece
+    antes do 'begin_tick'.
+    """
+
+    def __init__(self, sprite_manager: 'SpriteManager') -> None:
+        """Inicializa as consultas sobre os grupos do SpriteManager."""
+        self._sprite_manager = sprite_manager
+        self._player_sprites = sprite_manager.player_sprites
+        self._mob_sprites = sprite_manager.mob_sprites
+        self._players: Optional[Tuple['Player', ...]] = None
+        self._mobs: Optional[Tuple['Mob', ...]] = None
+
+    def begin_tick(self) -> None:
+        """Invalida os resultados em cache do tick anterior."""
+        self._players = None
+        self._mobs = None
+
+    @property
+    def players(self) -> Tuple['Player', ...]:
+        """Jogadores ativos no tick atual (recalculado se algum sair do grupo)."""
+        players = self._players
+        if players is None or len(players) != len(self._player_sprites.spritedict):
+            players = self._players = tuple(self._player_sprites)
+        return players
+
+    @property
+    def mobs(self) -> Tuple['Mob', ...]:
+        """Mobs ativos no tick atual (recalculado se algum sair do grupo)."""
+        mobs = self._mobs
+        if mobs is None or len(mobs) != len(self._mob_sprites.spritedict):
+            mobs = self._mobs = tuple(self._mob_sprites)
+        return mobs
+
+    @property
+    def player_index(self) -> 'CollisionIndex':
+        """Índice de colisão dos jogadores."""
+        return self._sprite_manager.player_index
+
+    @property
+    def mob_index(self) -> 'CollisionIndex':
+        """Índice de colisão dos mobs."""
+        return self._sprite_manager.mob_index
@@ -0,0 +1,63 @@
+import random
+import pygame
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+class Bot:
+    """Jogador automático simples usado nas simulações em lote.
+
+    Anda em direção ao mob mais próximo, vira para ele e ataca com a espada quando está ao
+    alcance, usando o canhão com probabilidade 'cannon_rate'. Um tempo de reação aleatório
+    (em ticks), controlado pela semente, torna as repetições de uma mesma configuração distintas.
+    """
+
+    ATTACK_DISTANCE = 140
+    MAX_REACTION_TICKS = 6
+
+    def __init__(self, seed: int = 0, cannon_rate: float = 0.05) -> None:
+        """Inicializa o gerador aleatório e o estado do bot."""
+        self._random = random.Random(seed)
+        self._cannon_rate = cannon_rate
+        self._facing_right = True
+        self._wait = 0
+
+    def inputs(self, observation: Dict[str, Any]) -> Set[int]:
+        """Retorna as teclas pressionadas no próximo tick a partir da observação atual."""
+        if self._wait > 0:
+            self._wait -= 1
+            return set()
+        player = observation['player']
+        mobs = [mob for mob in observation['mobs'] if mob['life'] > 0]
+        if not mobs:
+            return set()
+        target = min(mobs, key=lambda mob: abs(mob['x'] - player['x']))
+        to_the_right = target['x'] >= player['x']
+        if abs(target['x'] - player['x']) > self.ATTACK_DISTANCE or to_the_right != self._facing_right:
+            self._facing_right = to_the_right
+            return {pygame.K_d if to_the_right else pygame.K_a}
+        self._wait = self._random.randint(0, self.MAX_REACTION_TICKS)
+        return {pygame.K_LCTRL if self._random.random() < self._cannon_rate else pygame.K_SPACE}
+
+
+class ScriptedInputs:
+    """Sequência fixa de entradas: lista de (teclas, número de ticks), repetida até o fim da simulação."""
+
+    def __init__(self, script: Sequence[Tuple[Sequence[str], int]]) -> None:
+        """Converte os nomes das teclas (ex.: 'd', 'space', 'left ctrl') em constantes do pygame."""
+        self._steps: List[Tuple[FrozenSet[int], int]] = [
+            (frozenset(pygame.key.key_code(name) for name in keys), ticks) for keys, ticks in script
+        ]
+        self._index = 0
+        self._remaining: Optional[int] = None
+
+    def inputs(self, observation: Dict[str, Any]) -> FrozenSet[int]:
+        """Retorna as teclas do passo atual do script."""
+        if not self._steps:
+            return frozenset()
+        keys, ticks = self._steps[self._index]
+        if self._remaining is None:
+            self._remaining = ticks
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._index = (self._index + 1) % len(self._steps)
+            self._remaining = None
+        return keys
@@ -0,0 +1,68 @@
+import ast
+import importlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+
+# Classes ajustáveis pelo nome curto (ex.: 'Troll.STRENGTH=30')
+OVERRIDE_MODULES = {
+    'Game': 'core.game',
+    'Player': 'entities.player',
+    'Soul': 'entities.soul',
+    'Troll': 'entities.troll',
+    'LevelManager': 'entities.level_manager',
+    'MobMovementComponent': 'components.movement.mob_movement_component',
+    'BasicAttackComponent': 'components.attack.basic_atk_component',
+    'PlayerAttackComponent': 'components.attack.player_atk_component',
+}
+
+
+def parse_value(text: str) -> Any:
+    """Converte o texto de um valor em literal Python (número, tupla, ...) ou mantém a string."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_override(text: str) -> Tuple[str, Any]:
+    """Separa 'Classe.ATRIBUTO=valor' em ('Classe.ATRIBUTO', valor)."""
+    target, separator, value = text.partition('=')
+    if not separator or not target:
+        raise ValueError(f'Override inválido: {text!r} (esperado Classe.ATRIBUTO=valor)')
+    return target.strip(), parse_value(value.strip())
+
+
+def resolve_target(target: str) -> Tuple[type, str]:
+    """Retorna a classe e o atributo de 'Classe.ATRIBUTO' ou 'modulo.Classe.ATRIBUTO'."""
+    parts = target.split('.')
+    if len(parts) < 2:
+        raise ValueError(f'Override inválido: {target!r} (esperado Classe.ATRIBUTO)')
+    *module_parts, class_name, attribute = parts
+    module_name = '.'.join(module_parts) or OVERRIDE_MODULES.get(class_name)
+    if module_name is None:
+        raise ValueError(f'Classe desconhecida: {class_name!r}; use o caminho completo (modulo.Classe.ATRIBUTO)')
+    cls = getattr(importlib.import_module(module_name), class_name)
+    if not hasattr(cls, attribute):
+        raise ValueError(f'{class_name} não possui o atributo {attribute!r}')
+    return cls, attribute
+
+
+@contextmanager
+def applied_overrides(overrides: Dict[str, Any]) -> Iterator[None]:
+    """Aplica os overrides nas classes e restaura os valores originais ao sair."""
+    originals = []
+    try:
+        for target, value in overrides.items():
+            cls, attribute = resolve_target(target)
+            originals.append((cls, attribute, cls.__dict__.get(attribute, _MISSING)))
+            setattr(cls, attribute, value)
+        yield
+    finally:
+        for cls, attribute, original in reversed(originals):
+            if original is _MISSING:
+                delattr(cls, attribute)
+            else:
+                setattr(cls, attribute, original)
+
+
+_MISSING = object()
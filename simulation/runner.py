@@ -0,0 +1,74 @@
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from simulation.bot import Bot, ScriptedInputs
+from simulation.overrides import applied_overrides
+
+class _KillCounter:
+    # Registra o tick de cada mob derrotado (evento 'mob_defeated').
+    def __init__(self, game) -> None:
+        self.game = game
+        self.kill_ticks: List[int] = []
+
+    def notify(self, event: Dict[str, Any]) -> None:
+        if event['type'] == 'mob_defeated':
+            self.kill_ticks.append(self.game.tick)
+
+
+def run_simulation(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Executa uma simulação headless e retorna suas métricas.
+
+    A especificação é um dicionário simples (para ser enviado a outros processos) com:
+    - overrides: {'Classe.ATRIBUTO': valor} aplicados durante a simulação.
+    - max_ticks: Número máximo de ticks (a simulação para antes se o player morrer ou não houver mobs).
+    - seed: Semente do bot.
+    - script: Lista de (teclas, ticks) para entradas scriptadas; sem script, o bot joga.
+    """
+    from core.game import Game
+
+    with applied_overrides(spec.get('overrides', {})):
+        started = time.perf_counter()
+        game = Game(headless=True)
+        try:
+            kill_counter = _KillCounter(game)
+            game._event_manager.subscribe('mob_defeated', kill_counter)
+            script = spec.get('script')
+            policy = ScriptedInputs(script) if script else Bot(seed=spec.get('seed', 0))
+            observation = game.observe()
+            damage_taken = 0
+            for _ in range(spec.get('max_ticks', 3600)):
+                life = observation['player']['life']
+                observation = game.step(policy.inputs(observation))
+                damage_taken += max(0, life - observation['player']['life'])
+                if not observation['player']['alive'] or not observation['mobs']:
+                    break
+            kills = kill_counter.kill_ticks
+            frame_stats = game.frame_stats()
+            return {
+                **{key: value for key, value in spec.items() if key != 'script'},
+                'ticks': game.tick,
+                'kills': len(kills),
+                'time_to_first_kill': _seconds(kills[0] if kills else None, Game.FPS),
+                'time_to_clear': _seconds(game.tick if not observation['mobs'] else None, Game.FPS),
+                'damage_taken': damage_taken,
+                'player_alive': observation['player']['alive'],
+                'level': observation['player']['level'],
+                'xp': observation['player']['xp'],
+                'ticks_per_second': round(game.ticks_per_second, 1),
+                'tick_p50_ms': frame_stats['p50_ms'],
+                'tick_p95_ms': frame_stats['p95_ms'],
+                'tick_p99_ms': frame_stats['p99_ms'],
+                'wall_time': round(time.perf_counter() - started, 3)
+            }
+        finally:
+            pygame.quit()
+
+
+def _seconds(tick: Optional[int], fps: int) -> Optional[float]:
+    # Converte um tick em segundos de jogo (None se o evento não aconteceu).
+    return None if tick is None else round(tick / fps, 3)
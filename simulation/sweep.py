@@ -0,0 +1,134 @@
+"""Varredura de balanceamento: executa simulações headless em paralelo e agrega as métricas.
+
+Executar a partir da raiz do projeto, por exemplo:
+    python -m simulation.sweep -p Troll.STRENGTH=15,25,35 -p Soul.ATTACK_RANGE=300,365 \\
+        --repeats 20 --max-ticks 3600 --output balance.csv
+"""
+import argparse
+import ast
+import csv
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Sequence, Tuple
+
+from simulation.overrides import parse_value, resolve_target
+from simulation.runner import run_simulation
+
+SUMMARY_METRICS = (
+    'kills', 'time_to_first_kill', 'time_to_clear', 'damage_taken', 
+    'player_alive', 'level', 'ticks_per_second', 'tick_p95_ms'
+)
+
+
+def parse_param(text: str) -> Tuple[str, List[Any]]:
+    """Separa 'Classe.ATRIBUTO=v1,v2,...' no alvo e na lista de valores a varrer."""
+    target, separator, values = text.partition('=')
+    if not separator or not values:
+        raise argparse.ArgumentTypeError(f'Parâmetro inválido: {text!r} (esperado Classe.ATRIBUTO=v1,v2)')
+    try:
+        parsed = ast.literal_eval(f'[{values}]')
+    except (ValueError, SyntaxError):
+        parsed = [parse_value(value) for value in values.split(',')]
+    return target.strip(), list(parsed)
+
+
+def build_specs(
+        params: Sequence[Tuple[str, List[Any]]], 
+        repeats: int, 
+        max_ticks: int, 
+        script: Any = None
+    ) -> List[Dict[str, Any]]:
+    """Monta uma especificação por combinação de valores (produto cartesiano) e repetição."""
+    targets = [target for target, _ in params]
+    specs = []
+    for combination in itertools.product(*(values for _, values in params)):
+        overrides = dict(zip(targets, combination))
+        for seed in range(repeats):
+            specs.append({
+                'run_id': len(specs), 
+                'overrides': overrides, 
+                'seed': seed, 
+                'max_ticks': max_ticks, 
+                'script': script
+            })
+    return specs
+
+
+def run_sweep(specs: Sequence[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+    """Executa as simulações em um pool de processos, reportando o progresso."""
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_simulation, spec) for spec in specs]
+        for done, future in enumerate(as_completed(futures), 1):
+            results.append(future.result())
+            print(f'\r{done}/{len(specs)} simulações', end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    return sorted(results, key=lambda result: result['run_id'])
+
+
+def summarize(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Agrega as métricas por combinação de overrides (médias, ignorando eventos que não ocorreram)."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        groups.setdefault(json.dumps(result['overrides'], sort_keys=True), []).append(result)
+    summary = []
+    for runs in groups.values():
+        row = dict(runs[0]['overrides'])
+        row['runs'] = len(runs)
+        for metric in SUMMARY_METRICS:
+            values = [float(run[metric]) for run in runs if run[metric] is not None]
+            row[f'{metric}_mean'] = round(statistics.fmean(values), 3) if values else None
+        summary.append(row)
+    return summary
+
+
+def write_report(path: str, results: Sequence[Dict[str, Any]], summary: Sequence[Dict[str, Any]]) -> None:
+    """Grava o relatório em JSON (execuções e resumo) ou CSV (resumo), conforme a extensão."""
+    if path.endswith('.json'):
+        with open(path, 'w', encoding='utf-8') as report:
+            json.dump({'summary': summary, 'runs': results}, report, indent=2)
+        return
+    with open(path, 'w', newline='', encoding='utf-8') as report:
+        writer = csv.DictWriter(report, fieldnames=list(summary[0]) if summary else [])
+        writer.writeheader()
+        writer.writerows(summary)
+
+
+def main(argv: Sequence[str] = None) -> None:
+    args = _parse_args(argv)
+    for target, _ in args.param:
+        resolve_target(target)  # Falha cedo em nomes de atributos inválidos
+    script = None
+    if args.script:
+        with open(args.script, encoding='utf-8') as script_file:
+            script = json.load(script_file)
+    specs = build_specs(args.param, args.repeats, args.max_ticks, script)
+    started = time.perf_counter()
+    results = run_sweep(specs, args.workers)
+    elapsed = time.perf_counter() - started
+    summary = summarize(results)
+    write_report(args.output, results, summary)
+    print(f'{len(results)} simulações em {elapsed:.1f}s; relatório em {args.output}')
+
+
+def _parse_args(argv: Sequence[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Varredura de balanceamento com simulações headless.')
+    parser.add_argument(
+        '-p', '--param', type=parse_param, action='append', default=[], 
+        help='Parâmetro e valores a varrer, ex.: Troll.STRENGTH=15,25,35 (pode repetir).'
+    )
+    parser.add_argument('--repeats', type=int, default=10, help='Simulações por combinação (sementes do bot).')
+    parser.add_argument('--max-ticks', type=int, default=3600, help='Limite de ticks por simulação.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Número de processos.')
+    parser.add_argument('--script', default=None, help='JSON com [[teclas, ticks], ...] em vez do bot.')
+    parser.add_argument('--output', default='balance_report.csv', help='Arquivo do relatório (.csv ou .json).')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    main()
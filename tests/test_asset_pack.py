@@ -0,0 +1,133 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import pygame
+from config.constants import IMAGES_DIR
+from managers import asset_pack
+from managers.asset_pack import AssetPack, bake
+from managers.resource_manager import ResourceManager
+from managers.sprite_manager import SpriteManager
+from utils.frame_set import frame_anchor, frame_box_size, trim_frame
+
+IMAGE_FILES = {
+    'background': 'background_2_sized.png',
+    'soul_default': 'soul_1.png',
+    'troll_idle_spritesheet': 'troll_idle_spritesheet.png'
+}
+ANIMATIONS = (('troll_idle_spritesheet', SpriteManager.TROLL_SPRITE_COORDS),)
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, 'RGBA')
+
+class TestAssetPack(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((64, 64))
+        self.directory = tempfile.mkdtemp()
+        self.images_dir = os.path.join(self.directory, 'images')
+        os.mkdir(self.images_dir)
+        for file in IMAGE_FILES.values():
+            shutil.copy(os.path.join(IMAGES_DIR, file), self.images_dir)
+        self.path = os.path.join(self.directory, 'frames.pack')
+        bake(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS)
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.directory)
+
+    def _load(self, name):
+        image = pygame.image.load(os.path.join(self.images_dir, IMAGE_FILES[name]))
+        return image.convert() if name == 'background' else image.convert_alpha()
+
+    def test_frames_match_runtime_slicing(self):
+        sheet = self._load('troll_idle_spritesheet')
+        frames = AssetPack(self.path).frames('troll_idle_spritesheet', SpriteManager.TROLL_SPRITE_COORDS)
+        self.assertEqual(len(frames), len(SpriteManager.TROLL_SPRITE_COORDS))
+        for frame, coord in zip(frames, SpriteManager.TROLL_SPRITE_COORDS):
+            expected = pygame.Surface(coord[2:], pygame.SRCALPHA)
+            expected.blit(sheet, (0, 0), coord)
+            expected = trim_frame(expected)
+            self.assertEqual(frame.get_size(), expected.get_size())
+            self.assertEqual(frame_anchor(frame), frame_anchor(expected))
+            self.assertEqual(frame_box_size(frame), coord[2:])
+            self.assertEqual(_pixels(frame), _pixels(expected))
+
+    def test_whole_images_keep_their_format(self):
+        pack = AssetPack(self.path)
+        self.assertEqual(_pixels(pack.image('soul_default')), _pixels(self._load('soul_default')))
+        background = pack.image('background')
+        self.assertFalse(background.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(_pixels(background), _pixels(self._load('background')))
+
+    def test_sliced_sheets_are_not_stored_whole(self):
+        pack = AssetPack(self.path)
+        self.assertIsNone(pack.image('troll_idle_spritesheet'))
+        self.assertIsNone(pack.frames('troll_idle_spritesheet', [(0, 0, 10, 10)]))
+
+    def test_touched_source_with_same_content_stays_fresh(self):
+        source = os.path.join(self.images_dir, IMAGE_FILES['soul_default'])
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertTrue(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+        with mock.patch.object(asset_pack, '_sha1', side_effect=AssertionError('hash recalculado')):
+            self.assertTrue(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+        self.assertEqual(_pixels(AssetPack(self.path).image('soul_default')), _pixels(self._load('soul_default')))
+
+    def test_missing_source_makes_pack_stale(self):
+        os.remove(os.path.join(self.images_dir, IMAGE_FILES['soul_default']))
+        self.assertFalse(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+
+    def test_changed_source_or_table_makes_pack_stale(self):
+        self.assertFalse(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ()))
+        source = os.path.join(self.images_dir, IMAGE_FILES['soul_default'])
+        pygame.image.save(pygame.Surface((4, 4)), source)
+        self.assertFalse(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+
+    def test_ensure_rebuilds_stale_pack(self):
+        source = os.path.join(self.images_dir, IMAGE_FILES['soul_default'])
+        pygame.image.save(pygame.Surface((4, 4)), source)
+        pack = AssetPack.ensure(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS)
+        self.assertEqual(pack.image('soul_default').get_size(), (4, 4))
+        self.assertTrue(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+
+    def test_invalid_pack_is_stale(self):
+        with open(self.path, 'wb') as pack:
+            pack.write(b'not a pack')
+        self.assertFalse(AssetPack.is_fresh(self.path, self.images_dir, IMAGE_FILES, ANIMATIONS))
+
+
+class TestResourceManagerWithPack(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((64, 64))
+        self.directory = tempfile.mkdtemp()
+        self.resource_manager = ResourceManager(
+            asset_pack=os.path.join(self.directory, 'frames.pack'),
+            animations=SpriteManager.ANIMATIONS
+        )
+
+    def tearDown(self):
+        pygame.quit()
+        shutil.rmtree(self.directory)
+
+    def test_sliced_sheets_are_decoded_on_demand(self):
+        self.assertNotIn('cannon_attack', self.resource_manager.images)
+        self.assertIn('stats_interface', self.resource_manager.images)
+        sheet = self.resource_manager.get_image('cannon_attack')
+        self.assertIsNotNone(sheet)
+        self.assertIs(self.resource_manager.get_image('cannon_attack'), sheet)
+
+    def test_packed_frames_are_served_to_the_sprite_manager(self):
+        frames = self.resource_manager.get_frames('cannon_attack', SpriteManager.CANNON_ATTACK_COORDS)
+        self.assertEqual(len(frames), len(SpriteManager.CANNON_ATTACK_COORDS))
+        self.assertEqual(frame_box_size(frames[0]), SpriteManager.CANNON_ATTACK_COORDS[0][2:])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from utils.collision_index import CollisionIndex
+
+class SpriteMock(pygame.sprite.Sprite):
+    def __init__(self, x, width=50):
+        super().__init__()
+        self.rect = pygame.Rect(x, 0, width, 50)
+
+class TestCollisionIndex(unittest.TestCase):
+    def setUp(self):
+        self.group = pygame.sprite.Group()
+        self.sprites = [SpriteMock(x) for x in (900, 100, 500, 300, 2000)]
+        self.group.add(*self.sprites)
+        self.index = CollisionIndex(self.group)
+        self.index.refresh()
+
+    def test_query_rect_matches_brute_force(self):
+        rect = pygame.Rect(280, 0, 260, 50)
+        expected = {sprite for sprite in self.sprites if sprite.rect.colliderect(rect)}
+        self.assertEqual(set(self.index.query_rect(rect)), expected)
+
+    def test_query_range_uses_centers(self):
+        found = self.index.query_range(525, 200)
+        self.assertEqual({sprite.rect.x for sprite in found}, {300, 500})
+
+    def test_nearest(self):
+        self.assertEqual(self.index.nearest(1500).rect.x, 2000)
+        self.assertEqual(self.index.nearest(0).rect.x, 100)
+
+    def test_nearest_with_wide_entity_on_the_left(self):
+        wide = SpriteMock(0, width=1000)
+        self.group.add(wide)
+        self.index.refresh()
+        self.assertIs(self.index.nearest(510), wide)
+
+    def test_refresh_follows_movement_and_membership(self):
+        self.sprites[1].rect.x = 1000
+        self.sprites[2].kill()
+        self.index.refresh()
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.query_rect(pygame.Rect(1010, 0, 10, 10)), [self.sprites[1]])
+        self.assertEqual(self.index.query_range(525, 10), [])
+
+    def test_killed_entities_are_skipped_before_refresh(self):
+        self.sprites[3].kill()
+        self.assertEqual(self.index.query_range(325, 10), [])
+
+if __name__ == '__main__':
+    unittest.main()
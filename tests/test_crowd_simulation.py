@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import math
+import unittest
+import pygame
+from core.game import Game
+from managers.crowd_simulation import np
+
+@unittest.skipIf(np is None, 'numpy não instalado')
+class TestCrowdSimulation(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True, crowd=True)
+        self.crowd = self.game._sprite_manager.crowd_simulation
+        self.mobs = {mob.type: mob for mob in self.game._sprite_manager.mob_sprites}
+        self.player = self.game._player
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_mobs_chase_player_at_exact_speed(self):
+        troll = self.mobs['Troll']
+        start = troll.rect.x
+        for _ in range(30):
+            self.game.step()
+        expected = start - 30 * troll.speed * Game.FIXED_DELTA_TIME
+        self.assertAlmostEqual(troll.rect.x, expected, delta=1)
+        self.assertEqual(troll.direction, -1)
+        self.assertTrue(troll.crowd_driven)
+
+    def test_soul_float_matches_per_object_formula(self):
+        soul = self.mobs['Soul']
+        for tick in range(1, 11):
+            self.game.step()
+            phase = soul.FLOAT_SPEED * Game.FIXED_DELTA_TIME * tick
+            self.assertEqual(soul.rect.y, int(soul.INITIAL_POSITION[1] + soul.FLOAT_AMPLITUDE * math.sin(phase)))
+
+    def test_collided_mob_attacks_instead_of_moving(self):
+        troll = self.mobs['Troll']
+        troll.rect.centerx = self.player.rect.centerx + 50
+        x = troll.rect.x
+        self.game.step()
+        attack_component = troll.attack_component
+        self.assertEqual(attack_component.state, attack_component.ATTACK_STATE)
+        # Apenas o recuo do próprio ataque, sem o passo de perseguição
+        self.assertEqual(troll.rect.x, x + attack_component.KNOCKBACK_DISTANCE)
+
+    def test_mob_leaving_the_map_returns_to_initial_position(self):
+        troll = self.mobs['Troll']
+        troll.rect.left = -250
+        self.game.step()
+        self.assertEqual(troll.rect.center, troll.INITIAL_POSITION)
+
+    def test_external_rect_changes_are_adopted(self):
+        troll = self.mobs['Troll']
+        self.game.step()
+        troll.rect.x = 1500
+        self.game.step()
+        self.assertAlmostEqual(troll.rect.x, 1500 - troll.speed * Game.FIXED_DELTA_TIME, delta=1)
+
+    def test_removed_mobs_are_released_from_the_simulation(self):
+        troll = self.mobs['Troll']
+        self.game.step()
+        troll.kill()
+        self.game.step()
+        self.assertFalse(troll.crowd_driven)
+        self.assertEqual(len(self.crowd), 1)
+
+if __name__ == '__main__':
+    unittest.main()
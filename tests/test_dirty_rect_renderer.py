@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from managers.dirty_rect_renderer import DirtyRectRenderer
+
+class TestDirtyRectRenderer(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True, dirty_rects=True)
+        self.renderer = self.game._dirty_rect_renderer
+        self.screen = self.game._screen_manager.screen
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _full_frame(self, alpha):
+        # Desenha o quadro completo em uma cópia da tela, sem alterar o estado do renderizador.
+        dirty_frame = self.screen.copy()
+        self.game._screen_manager.draw_window(self.game._resource_manager, self.game._camera)
+        self.game._sprite_manager.draw_all(self.screen, self.game._camera, alpha)
+        full_frame = self.screen.copy()
+        self.screen.blit(dirty_frame, (0, 0))
+        return dirty_frame, full_frame
+
+    def _assert_matches_full_redraw(self, inputs, ticks, alpha=1.0):
+        for _ in range(ticks):
+            self.game.step(inputs)
+            self.game._draw(alpha)
+            dirty_frame, full_frame = self._full_frame(alpha)
+            self.assertEqual(
+                pygame.image.tobytes(dirty_frame, 'RGB'), 
+                pygame.image.tobytes(full_frame, 'RGB')
+            )
+
+    def test_static_camera_matches_full_redraw(self):
+        self._assert_matches_full_redraw((), 30)
+        self.assertEqual(self.renderer.full_redraws, 1)
+        self.assertEqual(self.renderer.partial_redraws, 29)
+
+    def test_scrolling_camera_matches_full_redraw(self):
+        self._assert_matches_full_redraw({pygame.K_d}, 120, alpha=0.5)
+        self.assertLess(self.game._camera.camera.x, -100)
+        self.assertEqual(self.renderer.full_redraws, 1)
+
+    def test_large_camera_jump_falls_back_to_full_redraw(self):
+        self.game._draw()
+        self.game._player.rect.x += 4 * DirtyRectRenderer.SCROLL_THRESHOLD
+        self.game.step()
+        self.game._draw()
+        self.assertEqual(self.renderer.full_redraws, 2)
+
+    def test_invalidate_forces_full_redraw(self):
+        self.game._draw()
+        self.renderer.invalidate()
+        self.game._draw()
+        self.assertEqual(self.renderer.full_redraws, 2)
+
+if __name__ == '__main__':
+    unittest.main()
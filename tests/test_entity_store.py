@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from managers.entity_store import EntityStore
+
+class _Recorder:
+    # Componente de teste que registra as chamadas dos sistemas.
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    def handle_collision(self, delta_time):
+        self.calls.append((self.name, 'movement'))
+
+    def update(self, *args):
+        self.calls.append((self.name, 'update'))
+
+    def sync_orientation(self):
+        self.calls.append((self.name, 'orientation'))
+
+
+class _Entity(pygame.sprite.Sprite):
+    def __init__(self, calls, name, with_attack=True):
+        super().__init__()
+        self._components = {'movement': _Recorder(calls, name), 'orientation': _Recorder(calls, name)}
+        if with_attack:
+            self._components['attack'] = _Recorder(calls, name)
+
+    def components(self):
+        return self._components
+
+
+class TestEntityStore(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.store = EntityStore()
+        self.group = pygame.sprite.Group()
+
+    def test_entities_are_grouped_by_archetype(self):
+        self.group.add(_Entity(self.calls, 'a'), _Entity(self.calls, 'b'), _Entity(self.calls, 'c', False))
+        self.store.sync(self.group)
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(
+            sorted(archetype.signature for archetype in self.store.archetypes), 
+            [('movement', 'attack', 'orientation'), ('movement', 'orientation')]
+        )
+
+    def test_systems_run_in_fixed_order(self):
+        self.group.add(_Entity(self.calls, 'a'), _Entity(self.calls, 'b'))
+        self.store.sync(self.group)
+        self.store.run(1 / 60)
+        systems = [system for _, system in self.calls]
+        self.assertEqual(systems, ['movement'] * 2 + ['update'] * 2 + ['orientation'] * 2)
+
+    def test_sync_removes_killed_entities(self):
+        entities = [_Entity(self.calls, name) for name in 'abcd']
+        self.group.add(*entities)
+        self.store.sync(self.group)
+        entities[1].kill()
+        self.store.sync(self.group)
+        self.store.run(1 / 60)
+        self.assertNotIn(entities[1], self.store)
+        self.assertEqual(len(self.store), 3)
+        self.assertNotIn('b', {name for name, _ in self.calls})
+        self.assertEqual(len(self.calls), 9)
+
+
+class TestEntityStoreGame(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_mobs_are_composed_from_their_components(self):
+        self.game.step()
+        store = self.game._sprite_manager.entity_store
+        signatures = {archetype.signature for archetype in store.archetypes}
+        self.assertIn(('movement', 'attack', 'float', 'life_bar', 'orientation'), signatures)
+        self.assertIn(('movement', 'attack', 'life_bar', 'orientation', 'animation'), signatures)
+
+    def test_released_mobs_leave_the_store(self):
+        self.game.step()
+        self.game._sprite_manager.reset_game()
+        self.game.step()
+        store = self.game._sprite_manager.entity_store
+        self.assertEqual(len(store), len(self.game._sprite_manager.mob_sprites))
+
+if __name__ == '__main__':
+    unittest.main()
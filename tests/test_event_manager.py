@@ -0,0 +1,87 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import unittest
+from managers.event_manager import EventManager
+
+class ListenerMock:
+    def __init__(self, result=None):
+        self.events = []
+        self.result = result
+
+    def notify(self, event):
+        self.events.append(event)
+        return self.result
+
+class TargetMock:
+    pass
+
+class TestEventManager(unittest.TestCase):
+    def setUp(self):
+        self.event_manager = EventManager()
+
+    def test_global_listener_receives_event(self):
+        listener = ListenerMock()
+        self.event_manager.subscribe('player_up', listener)
+        self.event_manager.notify({'type': 'player_up'})
+        self.assertEqual(len(listener.events), 1)
+
+    def test_targeted_listener_only_receives_its_target(self):
+        hit, other = TargetMock(), TargetMock()
+        hit_listener, other_listener = ListenerMock(), ListenerMock()
+        self.event_manager.subscribe('damage_event', hit_listener, target=hit)
+        self.event_manager.subscribe('damage_event', other_listener, target=other)
+        self.event_manager.notify({'type': 'damage_event', 'target': hit})
+        self.assertEqual(len(hit_listener.events), 1)
+        self.assertEqual(other_listener.events, [])
+
+    def test_targeted_and_global_listeners_are_both_notified(self):
+        target = TargetMock()
+        targeted, global_listener = ListenerMock(), ListenerMock()
+        self.event_manager.subscribe('damage_event', targeted, target=target)
+        self.event_manager.subscribe('damage_event', global_listener)
+        self.event_manager.notify({'type': 'damage_event', 'target': target})
+        self.assertEqual((len(targeted.events), len(global_listener.events)), (1, 1))
+
+    def test_unsubscribe_targeted_listener(self):
+        target, listener = TargetMock(), ListenerMock()
+        self.event_manager.subscribe('damage_event', listener, target=target)
+        self.event_manager.unsubscribe('damage_event', listener, target=target)
+        self.event_manager.notify({'type': 'damage_event', 'target': target})
+        self.assertEqual(listener.events, [])
+
+    def test_notify_returns_first_result(self):
+        listeners = [ListenerMock(), ListenerMock(result='mob')]
+        for listener in listeners:
+            self.event_manager.subscribe('get_mob', listener)
+        self.assertEqual(self.event_manager.notify({'type': 'get_mob'}), 'mob')
+
+    def test_subscribe_is_idempotent(self):
+        listener = ListenerMock()
+        self.event_manager.subscribe('player_up', listener)
+        self.event_manager.subscribe('player_up', listener)
+        self.assertEqual(self.event_manager.listener_count(), 1)
+
+    def test_collected_listener_is_pruned(self):
+        self.event_manager.subscribe('player_up', ListenerMock())
+        gc.collect()
+        self.assertEqual(self.event_manager.listener_count(), 0)
+
+    def test_collected_target_drops_its_channel(self):
+        target, listener = TargetMock(), ListenerMock()
+        self.event_manager.subscribe('damage_event', listener, target=target)
+        del target
+        gc.collect()
+        self.assertEqual(self.event_manager.listener_count(), 0)
+
+    def test_unsubscribe_all(self):
+        target, listener = TargetMock(), ListenerMock()
+        self.event_manager.subscribe('player_up', listener)
+        self.event_manager.subscribe('damage_event', listener, target=target)
+        self.event_manager.unsubscribe_all(listener)
+        self.assertEqual(self.event_manager.listener_count(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
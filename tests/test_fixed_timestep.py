@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import random
+import unittest
+from unittest import mock
+import pygame
+from core.game import Game
+
+STEP = Game.FIXED_DELTA_TIME
+
+class TestFixedSteps(unittest.TestCase):
+    def test_frame_time_is_consumed_in_fixed_steps(self):
+        steps, accumulator = Game.fixed_steps(0.0, 2.5 * STEP)
+        self.assertEqual(steps, 2)
+        self.assertAlmostEqual(accumulator, 0.5 * STEP)
+
+    def test_short_frames_accumulate(self):
+        steps, accumulator = Game.fixed_steps(0.0, 0.6 * STEP)
+        self.assertEqual(steps, 0)
+        steps, accumulator = Game.fixed_steps(accumulator, 0.6 * STEP)
+        self.assertEqual(steps, 1)
+        self.assertAlmostEqual(accumulator, 0.2 * STEP)
+
+    def test_frame_time_is_clamped(self):
+        with mock.patch.object(Game, 'MAX_STEPS_PER_FRAME', 1000):
+            steps, _ = Game.fixed_steps(0.0, 10.0)
+        self.assertEqual(steps, round(Game.MAX_FRAME_TIME / STEP))
+
+    def test_backlog_over_the_step_cap_is_dropped(self):
+        steps, accumulator = Game.fixed_steps(0.0, Game.MAX_FRAME_TIME)
+        self.assertEqual(steps, Game.MAX_STEPS_PER_FRAME)
+        self.assertLess(accumulator, STEP)
+        self.assertEqual(Game.fixed_steps(accumulator, 0.0)[0], 0)
+
+    def test_interpolation_stays_below_one(self):
+        rng = random.Random(7)
+        accumulator = 0.0
+        for _ in range(1000):
+            _, accumulator = Game.fixed_steps(accumulator, rng.uniform(0.0, 0.3))
+            self.assertGreaterEqual(accumulator / STEP, 0.0)
+            self.assertLess(accumulator / STEP, 1.0)
+
+
+class TestGameLoop(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(fps_cap=0)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_loop_steps_and_draws_with_the_remaining_fraction(self):
+        game = self.game
+        clock = mock.Mock(**{'tick.return_value': 1.5 * STEP * 1000})
+        with mock.patch.object(game._screen_manager, 'clock', clock), \
+                mock.patch.object(game._camera, 'interpolate', wraps=game._camera.interpolate) as interpolate, \
+                mock.patch.object(game._sprite_manager, 'draw_all', wraps=game._sprite_manager.draw_all) as draw_all:
+            game._game_loop()
+            self.assertEqual(game.tick, 1)
+            game._game_loop()
+            self.assertEqual(game.tick, 3)
+        alphas = [call.args[0] for call in interpolate.call_args_list]
+        self.assertAlmostEqual(alphas[0], 0.5)
+        self.assertAlmostEqual(alphas[1], 0.0)
+        self.assertEqual([call.args[2] for call in draw_all.call_args_list], alphas)
+
+if __name__ == '__main__':
+    unittest.main()
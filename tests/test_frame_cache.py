@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from managers.frame_cache import FrameCache
+from managers.event_manager import EventManager
+from managers.sprite_manager import SpriteManager
+
+class TestFrameCache(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.mob_factory = self.game._mob_factory
+        self.frame_cache = self.game._sprite_manager.frame_cache
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_get_frames_slices_once(self):
+        cache = FrameCache()
+        calls = []
+        slicer = lambda: calls.append(1) or [pygame.Surface((2, 2))]
+        first = cache.get_frames('sheet', ((0, 0, 2, 2),), slicer)
+        second = cache.get_frames('sheet', ((0, 0, 2, 2),), slicer)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_spawning_trolls_reuses_frames(self):
+        first = self.mob_factory.create_mob('Troll')
+        stats = self.frame_cache.stats()
+        trolls = [self.mob_factory.create_mob('Troll') for _ in range(100)]
+        self.assertEqual(self.frame_cache.stats()['misses'], stats['misses'])
+        self.assertEqual(self.frame_cache.stats()['bytes'], stats['bytes'])
+        self.assertTrue(all(troll.default_frames is first.default_frames for troll in trolls))
+
+    def test_create_player_reuses_frames(self):
+        misses = self.frame_cache.misses
+        player = self.game._player_factory.create_player()
+        self.assertEqual(self.frame_cache.misses, misses)
+        self.assertIs(player.cannon_frames, self.game._player.cannon_frames)
+
+    def test_sliced_sheets_are_released(self):
+        images = self.game._resource_manager.images
+        for sheet_name in ('cannon_attack', 'player_attacking', 'troll_idle_spritesheet'):
+            self.assertNotIn(sheet_name, images)
+        self.assertIn('stats_interface', images)
+
+    def test_frame_views_share_sheet_pixels(self):
+        resource_manager = self.game._resource_manager
+        sprite_manager = SpriteManager(resource_manager, EventManager(), frame_cache=FrameCache(), frame_views=True)
+        frames = sprite_manager.get_frames('troll_idle_spritesheet', SpriteManager.TROLL_SPRITE_COORDS)
+        self.assertTrue(all(frame.get_parent() is not None for frame in frames))
+        self.assertNotIn('troll_idle_spritesheet', resource_manager.images)
+        self.assertIn('troll_idle_spritesheet', resource_manager.memory_report()['released_in_use'])
+        stats = sprite_manager.frame_cache.stats()
+        self.assertGreater(stats['shared_bytes'], 0)
+        self.assertEqual(stats['bytes'], stats['shared_bytes'])
+
+    def test_format_report_counts_frames_per_sheet(self):
+        report = self.frame_cache.format_report()
+        self.assertEqual(report['cannon_attack'], {'colorkey+rle': len(SpriteManager.CANNON_ATTACK_COORDS)})
+        self.assertEqual(sum(report['troll_idle_spritesheet'].values()), len(SpriteManager.TROLL_SPRITE_COORDS))
+
+if __name__ == '__main__':
+    unittest.main()
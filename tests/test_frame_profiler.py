@@ -0,0 +1,120 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from managers.frame_profiler import FrameProfiler, FrameOverlay
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = FrameProfiler(window=10)
+
+    def _frame(self, **sections):
+        # Simula um quadro com os tempos de seção informados (em segundos).
+        self.profiler.begin_frame()
+        self.profiler._current.update(sections)
+        self.profiler.end_frame()
+
+    def test_sections_accumulate_within_a_frame(self):
+        self.profiler.begin_frame()
+        for _ in range(3):
+            with self.profiler.section('update'):
+                pass
+        self.profiler.end_frame()
+        stats = self.profiler.stats()
+        self.assertEqual(stats['frames'], 1)
+        self.assertIn('update', stats['sections'])
+        self.assertLessEqual(stats['sections']['update']['share'], 1)
+
+    def test_window_keeps_last_frames(self):
+        for _ in range(25):
+            self._frame(update=0.001)
+        self.assertEqual(len(self.profiler), 10)
+
+    def test_sections_missing_from_a_frame_count_as_zero(self):
+        self._frame(update=0.004)
+        self._frame(update=0.004, draw=0.002)
+        self._frame(update=0.004)
+        self.assertEqual(len(self.profiler._section_times['draw']), 3)
+        self.assertAlmostEqual(self.profiler.stats()['sections']['draw']['ms'], 2 / 3, places=3)
+
+    def test_nested_sections_share_their_parent_time(self):
+        self._frame(update=0.004, draw=0.002, **{'update.systems': 0.003, 'update.players': 0.001})
+        self.profiler._frame_times[-1] = 0.008
+        sections = self.profiler.stats()['sections']
+        self.assertAlmostEqual(sections['update.systems']['share'], 0.75)
+        self.assertAlmostEqual(sections['update.players']['share'], 0.25)
+        self.assertAlmostEqual(sections['update']['share'], 0.5)
+        self.assertAlmostEqual(sections['draw']['share'], 0.25)
+
+    def test_percentiles_use_nearest_rank(self):
+        self.profiler._frame_times.extend(value / 1000 for value in range(1, 11))
+        stats = self.profiler.stats()
+        self.assertEqual(stats['p50_ms'], 5)
+        self.assertEqual(stats['p95_ms'], 10)
+        self.assertEqual(stats['p99_ms'], 10)
+
+    def test_end_frame_without_begin_is_ignored(self):
+        self.profiler.end_frame()
+        self.assertEqual(len(self.profiler), 0)
+        self.assertEqual(self.profiler.stats()['p99_ms'], 0)
+
+
+class TestFrameStatsInGame(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_headless_steps_report_update_sections(self):
+        for _ in range(20):
+            self.game.step()
+        stats = self.game.frame_stats()
+        self.assertEqual(stats['frames'], 20)
+        for section in ('update', 'update.players', 'update.systems'):
+            self.assertIn(section, stats['sections'])
+        self.assertNotIn('update.crowd', stats['sections'])
+        self.assertGreater(stats['p95_ms'], 0)
+
+    def test_overlay_draws_only_when_visible(self):
+        for _ in range(5):
+            self.game.step()
+        screen = pygame.Surface((640, 480))
+        overlay = FrameOverlay(self.game._frame_profiler)
+        self.assertEqual(overlay.draw(screen).size, (0, 0))
+        overlay.toggle()
+        area = overlay.draw(screen)
+        self.assertGreater(area.width, 0)
+        self.assertGreater(area.height, 0)
+
+    def test_overlay_lines_list_sections_by_cost(self):
+        lines = FrameOverlay.lines({
+            'frames': 2, 'frame_ms': 3.0, 'p50_ms': 3.0, 'p95_ms': 4.0, 'p99_ms': 4.0,
+            'sections': {'draw': {'ms': 1.0, 'share': 0.33}, 'update': {'ms': 2.0, 'share': 0.66}}
+        })
+        self.assertTrue(lines[2].startswith('update'))
+        self.assertTrue(lines[3].startswith('draw'))
+
+    def test_overlay_lines_indent_nested_sections_under_their_parent(self):
+        lines = FrameOverlay.lines({
+            'frames': 2, 'frame_ms': 3.0, 'p50_ms': 3.0, 'p95_ms': 4.0, 'p99_ms': 4.0,
+            'sections': {
+                'update.players': {'ms': 0.5, 'share': 0.25},
+                'draw': {'ms': 1.0, 'share': 0.33},
+                'update': {'ms': 2.0, 'share': 0.66},
+                'update.systems': {'ms': 1.5, 'share': 0.75},
+                'draw.flip': {'ms': 0.2, 'share': 0.2}
+            }
+        })
+        self.assertEqual(
+            [line.split()[0] for line in lines[2:]],
+            ['update', 'update.systems', 'update.players', 'draw', 'draw.flip']
+        )
+        self.assertTrue(lines[3].startswith('  update.systems'))
+        self.assertTrue(lines[5].startswith('draw'))
+
+if __name__ == '__main__':
+    unittest.main()
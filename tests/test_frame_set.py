@@ -0,0 +1,148 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest import mock
+import pygame
+from utils.frame_set import (
+    COLORKEY_CANDIDATES, FrameSet, frame_anchor, frame_box_size, frame_format, frame_rect, frame_view,
+    optimize_frame, trim_frame
+)
+
+def _frame_with_content(box_size, content_rect, color=(200, 40, 40, 255)):
+    frame = pygame.Surface(box_size, pygame.SRCALPHA)
+    frame.fill(color, content_rect)
+    frame.set_at(content_rect.topleft, (10, 20, 30, 90))
+    return frame
+
+def _draw(frame, position):
+    screen = pygame.Surface((120, 80))
+    screen.fill((0, 90, 0))
+    anchor = frame_anchor(frame)
+    screen.blit(frame, (position[0] + anchor[0], position[1] + anchor[1]))
+    return pygame.image.tobytes(screen, 'RGB')
+
+class TestFrameSet(unittest.TestCase):
+    def setUp(self):
+        self.frames = [_frame_with_content((30, 20), pygame.Rect(2, 3, 10 + i, 8)) for i in range(3)]
+        self.frame_set = FrameSet(self.frames)
+
+    def test_mirrored_frames_match_transform_flip(self):
+        for index, frame in enumerate(self.frames):
+            expected = pygame.transform.flip(frame, True, False)
+            mirrored = self.frame_set.get(index, mirrored=True)
+            self.assertEqual(pygame.image.tobytes(mirrored, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'))
+            self.assertIs(self.frame_set.get(index), frame)
+
+    def test_mirrored_frames_are_built_once(self):
+        first = self.frame_set.get(1, mirrored=True)
+        with mock.patch('pygame.transform.flip') as flip:
+            for _ in range(10):
+                self.assertIs(self.frame_set.get(1, mirrored=True), first)
+            self.assertIs(self.frame_set.mirror(self.frames[1]), first)
+            self.assertIs(self.frame_set.mirror(first), self.frames[1])
+        flip.assert_not_called()
+
+class TestTrimmedFrames(unittest.TestCase):
+    def setUp(self):
+        self.box = _frame_with_content((60, 40), pygame.Rect(10, 5, 20, 30))
+        self.trimmed = trim_frame(self.box)
+
+    def test_trim_keeps_only_visible_pixels(self):
+        self.assertEqual(self.trimmed.get_size(), (20, 30))
+        self.assertEqual(frame_anchor(self.trimmed), (10, 5))
+        self.assertEqual(frame_box_size(self.trimmed), (60, 40))
+
+    def test_trimmed_frame_draws_like_the_original_box(self):
+        self.assertEqual(_draw(self.trimmed, (17, 9)), _draw(self.box, (17, 9)))
+
+    def test_frame_rect_uses_the_original_box(self):
+        self.assertEqual(
+            frame_rect(self.trimmed, centerx=50, bottom=70),
+            self.box.get_rect(centerx=50, bottom=70)
+        )
+
+    def test_frame_without_margins_is_not_copied(self):
+        full = _frame_with_content((8, 8), pygame.Rect(0, 0, 8, 8))
+        self.assertIs(trim_frame(full), full)
+        self.assertEqual(frame_anchor(full), (0, 0))
+        self.assertEqual(frame_box_size(full), (8, 8))
+
+    def test_mirrored_frame_gets_mirrored_anchor(self):
+        frames = FrameSet([self.trimmed])
+        mirrored = frames.get(0, mirrored=True)
+        self.assertEqual(frame_anchor(mirrored), (60 - 10 - 20, 5))
+        self.assertEqual(frame_box_size(mirrored), (60, 40))
+        expected = pygame.transform.flip(self.box, True, False)
+        self.assertEqual(_draw(mirrored, (3, 4)), _draw(expected, (3, 4)))
+
+class TestFrameViews(unittest.TestCase):
+    def setUp(self):
+        self.sheet = pygame.Surface((100, 60), pygame.SRCALPHA)
+        self.sheet.fill((50, 60, 70, 255), pygame.Rect(48, 12, 20, 30))
+        self.rect = (40, 10, 60, 40)
+
+    def test_view_shares_the_sheet_pixels(self):
+        view = frame_view(self.sheet, self.rect)
+        self.assertIs(view.get_parent(), self.sheet)
+        self.assertEqual(view.get_offset(), (48, 12))
+        self.sheet.set_at((48, 12), (1, 2, 3, 255))
+        self.assertEqual(tuple(view.get_at((0, 0))), (1, 2, 3, 255))
+
+    def test_view_matches_trimmed_copy(self):
+        copy = pygame.Surface(self.rect[2:], pygame.SRCALPHA)
+        copy.blit(self.sheet, (0, 0), self.rect)
+        trimmed, view = trim_frame(copy), frame_view(self.sheet, self.rect)
+        self.assertEqual(view.get_size(), trimmed.get_size())
+        self.assertEqual(frame_anchor(view), frame_anchor(trimmed))
+        self.assertEqual(frame_box_size(view), (60, 40))
+        self.assertEqual(pygame.image.tobytes(view, 'RGBA'), pygame.image.tobytes(trimmed, 'RGBA'))
+
+    def test_view_keeps_the_sheet_alive(self):
+        view = frame_view(self.sheet, self.rect)
+        del self.sheet
+        self.assertEqual(view.get_parent().get_size(), (100, 60))
+
+class TestOptimizedFrames(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((16, 16))
+        self.frame = pygame.Surface((40, 30), pygame.SRCALPHA)
+        self.frame.fill((200, 40, 40, 255), pygame.Rect(5, 5, 20, 10))
+        self.frame.fill((255, 0, 255, 255), pygame.Rect(25, 5, 5, 10))
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_binary_alpha_frame_becomes_rle_colorkey(self):
+        optimized = optimize_frame(self.frame)
+        self.assertEqual(frame_format(self.frame), 'alpha')
+        self.assertEqual(frame_format(optimized), 'colorkey+rle')
+        self.assertEqual(_draw(optimized, (7, 3)), _draw(self.frame, (7, 3)))
+
+    def test_colorkey_avoids_colors_of_visible_pixels(self):
+        optimized = optimize_frame(self.frame)
+        self.assertNotEqual(tuple(optimized.get_colorkey())[:3], COLORKEY_CANDIDATES[0])
+
+    def test_partial_alpha_frame_is_kept(self):
+        self.frame.set_at((6, 6), (10, 20, 30, 90))
+        self.assertIs(optimize_frame(self.frame), self.frame)
+        self.assertEqual(frame_format(self.frame), 'alpha')
+
+    def test_optimized_trimmed_frame_keeps_anchor_and_mirror(self):
+        trimmed = trim_frame(self.frame)
+        frames = FrameSet([optimize_frame(trimmed)])
+        self.assertEqual(frame_anchor(frames[0]), frame_anchor(trimmed))
+        self.assertEqual(frame_box_size(frames[0]), (40, 30))
+        expected = pygame.transform.flip(self.frame, True, False)
+        self.assertEqual(frame_format(frames.get(0, mirrored=True)), 'colorkey+rle')
+        self.assertEqual(_draw(frames.get(0, mirrored=True), (3, 4)), _draw(expected, (3, 4)))
+
+    def test_views_are_not_copied(self):
+        view = frame_view(self.frame, (0, 0, 40, 30))
+        self.assertIs(optimize_frame(view), view)
+        self.assertEqual(frame_format(view), 'view')
+
+if __name__ == '__main__':
+    unittest.main()
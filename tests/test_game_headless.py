@@ -0,0 +1,52 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+
+class TestGameHeadless(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_step_advances_one_tick(self):
+        observation = self.game.step()
+        self.assertEqual(observation['tick'], 1)
+        self.assertEqual(self.game.tick, 1)
+
+    def test_step_applies_scripted_inputs(self):
+        initial_x = self.game.observe()['player']['x']
+        for _ in range(10):
+            observation = self.game.step({pygame.K_d})
+        self.assertGreater(observation['player']['x'], initial_x)
+
+    def test_observation_lists_mobs(self):
+        observation = self.game.observe()
+        self.assertEqual(sorted(mob['type'] for mob in observation['mobs']), ['Soul', 'Troll'])
+
+    def test_run_requires_max_ticks(self):
+        with self.assertRaises(ValueError):
+            self.game.run()
+
+    def test_run_reports_ticks_per_second(self):
+        self.game.run(max_ticks=50)
+        self.assertEqual(self.game.tick, 50)
+        self.assertGreater(self.game.ticks_per_second, 0)
+
+    def test_observation_follows_player_created_on_reset(self):
+        player = self.game._player
+        player.life = 0
+        player.kill()
+        self.assertFalse(self.game.step()['player']['alive'])
+        self.game._input_manager.request_reset()
+        observation = self.game.step()
+        self.assertIsNot(self.game._player, player)
+        self.assertTrue(observation['player']['alive'])
+        self.assertEqual(observation['player']['life'], player.MAX_LIFE)
+
+if __name__ == '__main__':
+    unittest.main()
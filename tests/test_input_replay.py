@@ -0,0 +1,70 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+import pygame
+from core.game import Game
+from managers.input_manager import KeySnapshot
+from managers.input_recording import HEADER, RECORD, InputReplay, decode_keys, encode_keys
+
+SCRIPT = [({pygame.K_d}, 90), ({pygame.K_SPACE}, 40), ((), 20), ({pygame.K_a, pygame.K_LCTRL}, 60), ({pygame.K_d}, 50)]
+RESET_TICK = 200
+
+
+class TestInputReplay(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.rec')
+        os.close(handle)
+
+    def tearDown(self):
+        pygame.quit()
+        os.remove(self.path)
+
+    def _record_session(self):
+        game = Game(headless=True)
+        game.record_inputs(self.path)
+        observations = []
+        for keys, ticks in SCRIPT:
+            for _ in range(ticks):
+                if game.tick == RESET_TICK:
+                    game._input_manager.request_reset()
+                observations.append(game.step(keys))
+        game._input_manager.stop_recording(game.tick)
+        pygame.quit()
+        return observations
+
+    def test_replay_reproduces_the_session(self):
+        recorded = self._record_session()
+        game = Game(headless=True)
+        game.replay_inputs(self.path)
+        replayed = [game.step() for _ in range(len(recorded))]
+        self.assertEqual(replayed, recorded)
+
+    def test_file_stores_only_key_changes(self):
+        self._record_session()
+        # Uma mudança por passo do script, duas pelo reset e o registro final
+        expected = HEADER.size + RECORD.size * (len(SCRIPT) + 2 + 1)
+        self.assertEqual(os.path.getsize(self.path), expected)
+        self.assertEqual(InputReplay(self.path).length, sum(ticks for _, ticks in SCRIPT))
+
+    def test_run_stops_at_the_end_of_the_replay(self):
+        self._record_session()
+        game = Game(headless=True)
+        game.replay_inputs(self.path)
+        game.run()
+        self.assertEqual(game.tick, sum(ticks for _, ticks in SCRIPT))
+
+    def test_invalid_file_is_rejected(self):
+        with open(self.path, 'wb') as replay_file:
+            replay_file.write(b'not a replay')
+        with self.assertRaises(ValueError):
+            InputReplay(self.path)
+
+    def test_mask_round_trip(self):
+        keys = {pygame.K_a, pygame.K_SPACE}
+        self.assertEqual(decode_keys(encode_keys(KeySnapshot(keys))), frozenset(keys))
+
+if __name__ == '__main__':
+    unittest.main()
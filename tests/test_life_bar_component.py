@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from config.constants import BLUE_LIFEBAR
+from components.life_bar_component import LifeBarComponent
+
+class TestLifeBarComponent(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.game.step()
+        self.screen = self.game._screen_manager.screen
+        self.camera = self.game._camera
+        self.mobs = list(self.game._sprite_manager.mob_sprites)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _draw_rects(self, bar):
+        # Referência: desenha a barra diretamente com 'pygame.draw.rect'.
+        self.screen.fill((40, 50, 60))
+        pygame.draw.rect(self.screen, bar.color, self.camera.apply(bar.inner), border_radius=5)
+        pygame.draw.rect(self.screen, BLUE_LIFEBAR, self.camera.apply(bar.outline), width=2, border_radius=5)
+        return pygame.image.tobytes(self.screen, 'RGB')
+
+    def _draw_prerendered(self, bar):
+        self.screen.fill((40, 50, 60))
+        bar.draw_life_bar(self.screen, self.camera)
+        return pygame.image.tobytes(self.screen, 'RGB')
+
+    def test_prerendered_bar_matches_draw_rect(self):
+        for mob in self.mobs:
+            bar = mob.life_bar_component
+            for life in range(0, mob.MAX_LIFE + 1, 9):
+                mob.life = life
+                bar.update_life_bar()
+                self.assertEqual(self._draw_prerendered(bar), self._draw_rects(bar))
+
+    def test_surfaces_are_shared_by_fill_width(self):
+        bar = self.mobs[0].life_bar_component
+        surface = bar.life_bar_blit(self.camera)[0]
+        key = (bar.width, bar.height, bar.color, bar.inner.width)
+        self.assertIs(LifeBarComponent._surfaces[key], surface)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gc
+import io
+import contextlib
+import unittest
+import pygame
+from core.game import Game
+
+CYCLES = 2000
+WARMUP_CYCLES = 200
+MAX_RSS_GROWTH = 16 * 1024 * 1024
+
+def _rss_bytes():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+class TestListenerSoak(unittest.TestCase):
+    """Milhares de ciclos de spawn/reset não devem acumular listeners nem memória."""
+
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.sprite_manager = self.game._sprite_manager
+        self.event_manager = self.game._event_manager
+        self.mob_factory = self.game._mob_factory
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _cycle(self, index):
+        # Derrota alguns mobs extras, mata o jogador a cada poucos ciclos e reseta o jogo.
+        for name in ('Soul', 'Troll'):
+            mob = self.mob_factory.create_mob(name)
+            mob.kill()
+        if index % 3 == 0:
+            for player in self.sprite_manager.player_sprites:
+                player.kill()
+        self.sprite_manager.reset_game()
+        self.game.step()
+
+    def _run_cycles(self, start, stop):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for index in range(start, stop):
+                self._cycle(index)
+        gc.collect()
+
+    def test_listener_count_stays_flat(self):
+        self._run_cycles(0, WARMUP_CYCLES)
+        baseline = self.event_manager.listener_count()
+        self._run_cycles(WARMUP_CYCLES, CYCLES)
+        self.assertEqual(self.event_manager.listener_count(), baseline)
+
+    @unittest.skipUnless(os.path.exists('/proc/self/statm'), 'Requer /proc/self/statm')
+    def test_rss_stays_flat(self):
+        self._run_cycles(0, WARMUP_CYCLES)
+        baseline = _rss_bytes()
+        self._run_cycles(WARMUP_CYCLES, CYCLES)
+        self.assertLess(_rss_bytes() - baseline, MAX_RSS_GROWTH)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from utils.object_pool import ObjectPool
+
+class PooledMock:
+    def __init__(self, name):
+        self.type = name
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+class TestObjectPool(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+        self.pool = ObjectPool(self._factory, max_idle=2)
+
+    def _factory(self, name):
+        obj = PooledMock(name)
+        self.created.append(obj)
+        return obj
+
+    def test_get_reuses_released_object_of_same_type(self):
+        soul = self.pool.get(name='Soul')
+        self.pool.release(soul)
+        self.pool.get(name='Troll')
+        reused = self.pool.get(name='Soul')
+        self.assertIs(reused, soul)
+        self.assertEqual(reused.resets, 1)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 2))
+
+    def test_release_respects_max_idle(self):
+        self.pool.release(*(PooledMock('Soul') for _ in range(3)))
+        self.assertEqual(self.pool.size, 2)
+        self.assertEqual(self.pool.discarded, 1)
+
+    def test_prewarm_avoids_construction_on_get(self):
+        self.pool.prewarm('Troll', 2)
+        created = len(self.created)
+        self.pool.get(name='Troll')
+        self.pool.get(name='Troll')
+        self.assertEqual(len(self.created), created)
+        self.assertEqual(self.pool.stats()['peak_size'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import unittest
+import pygame
+from config.constants import IMAGES_DIR
+from managers.resource_manager import ResourceManager
+
+class TestResourceManager(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((64, 64))
+        self.resource_manager = ResourceManager()
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_loads_every_resource(self):
+        self.assertEqual(set(self.resource_manager.images), set(self.resource_manager.file_paths['images']))
+        self.assertEqual(set(self.resource_manager.sounds), set(self.resource_manager.file_paths['sounds']))
+        self.assertGreater(self.resource_manager.load_time, 0)
+
+    def test_images_are_converted_on_the_main_thread(self):
+        images = self.resource_manager.images
+        self.assertFalse(images['background'].get_flags() & pygame.SRCALPHA)
+        self.assertTrue(images['life_bar'].get_flags() & pygame.SRCALPHA)
+
+    def test_parallel_decoding_matches_serial_load(self):
+        file = self.resource_manager.file_paths['images']['soul_default']
+        expected = pygame.image.load(f'{IMAGES_DIR}/{file}').convert_alpha()
+        image = self.resource_manager.get_image('soul_default')
+        self.assertEqual(image.get_size(), expected.get_size())
+        self.assertEqual(pygame.image.tobytes(image, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'))
+
+    def test_missing_file_is_reported(self):
+        self.resource_manager.file_paths['images']['missing'] = 'missing.png'
+        self.resource_manager.images.clear()
+        self.resource_manager.load_resources()
+        self.assertNotIn('missing', self.resource_manager.images)
+
+    def test_released_image_is_reloaded_on_demand(self):
+        self.resource_manager.release_image('soul_default')
+        self.assertNotIn('soul_default', self.resource_manager.images)
+        image = self.resource_manager.get_image('soul_default')
+        self.assertIsNotNone(image)
+        self.assertEqual(self.resource_manager.reloads, 1)
+
+    def test_released_image_still_in_use_is_reused(self):
+        image = self.resource_manager.get_image('life_bar')
+        self.resource_manager.release_image('life_bar')
+        self.assertIn('life_bar', self.resource_manager.memory_report()['released_in_use'])
+        self.assertIs(self.resource_manager.get_image('life_bar'), image)
+        self.assertEqual(self.resource_manager.reloads, 0)
+
+    def test_unknown_image_returns_none(self):
+        self.assertIsNone(self.resource_manager.get_image('missing'))
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        sizes = self.resource_manager.memory_report()['images']
+        budget = sizes['soul_default'] + sizes['soul_attacking'] + sizes['life_bar']
+        resource_manager = ResourceManager(memory_budget=budget)
+        self.assertLessEqual(resource_manager.resident_bytes(), budget)
+        self.assertGreater(resource_manager.evictions, 0)
+        resource_manager.get_image('soul_default')
+        resource_manager.get_image('soul_attacking')
+        resource_manager.get_image('life_bar')
+        self.assertEqual(list(resource_manager.images), ['soul_default', 'soul_attacking', 'life_bar'])
+
+    def test_memory_report_counts_pixel_bytes(self):
+        report = self.resource_manager.memory_report()
+        image = self.resource_manager.get_image('xp_bar')
+        self.assertEqual(report['images']['xp_bar'], image.get_pitch() * image.get_height())
+        self.assertEqual(report['resident_bytes'], sum(report['images'].values()))
+        self.assertIsNone(report['budget'])
+
+if __name__ == '__main__':
+    unittest.main()
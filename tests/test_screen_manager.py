@@ -0,0 +1,47 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from config.constants import BLACK
+
+class TestScreenManagerBackground(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.screen_manager = self.game._screen_manager
+        self.resource_manager = self.game._resource_manager
+        self.camera = self.game._camera
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _full_background(self):
+        # Referência: limpa a tela e desenha o fundo inteiro na posição da câmera.
+        screen = self.screen_manager.screen
+        screen.fill(BLACK)
+        screen.blit(self.resource_manager.get_image('background'), self.camera.camera.topleft)
+        return pygame.image.tobytes(screen, 'RGB')
+
+    def _viewport_background(self):
+        self.screen_manager.screen.fill((1, 2, 3))
+        self.screen_manager.draw_window(self.resource_manager, self.camera)
+        return pygame.image.tobytes(self.screen_manager.screen, 'RGB')
+
+    def _move_camera(self, x, y):
+        self.camera.camera = pygame.Rect(x, y, self.camera.width, self.camera.height)
+
+    def test_viewport_blit_matches_full_background(self):
+        for position in [(0, 0), (-700, -48), (-2048, -48)]:
+            self._move_camera(*position)
+            self.assertEqual(self._viewport_background(), self._full_background())
+            self.assertTrue(self.screen_manager._background_covers_screen)
+
+    def test_uncovered_screen_is_cleared(self):
+        self._move_camera(100, 20)
+        self.assertEqual(self._viewport_background(), self._full_background())
+        self.assertFalse(self.screen_manager._background_covers_screen)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from entities.troll import Troll
+from entities.level_manager import LevelManager
+from simulation.overrides import applied_overrides, parse_override, resolve_target
+from simulation.runner import run_simulation
+from simulation.sweep import build_specs, parse_param, run_sweep, summarize
+
+class TestOverrides(unittest.TestCase):
+    def test_parse_override(self):
+        self.assertEqual(parse_override('Troll.STRENGTH=30'), ('Troll.STRENGTH', 30))
+        self.assertEqual(parse_override('Troll.INITIAL_POSITION=(10, 20)'), ('Troll.INITIAL_POSITION', (10, 20)))
+
+    def test_resolve_rejects_unknown_attributes(self):
+        self.assertEqual(resolve_target('entities.troll.Troll.STRENGTH'), (Troll, 'STRENGTH'))
+        with self.assertRaises(ValueError):
+            resolve_target('Troll.STRENGHT')
+        with self.assertRaises(ValueError):
+            resolve_target('Dragon.STRENGTH')
+
+    def test_overrides_are_restored(self):
+        original = Troll.STRENGTH
+        with applied_overrides({'Troll.STRENGTH': original + 10, 'LevelManager.XP_TO_NEXT_LEVEL': 5}):
+            self.assertEqual(Troll.STRENGTH, original + 10)
+            self.assertEqual(LevelManager.XP_TO_NEXT_LEVEL, 5)
+        self.assertEqual(Troll.STRENGTH, original)
+        self.assertEqual(LevelManager.XP_TO_NEXT_LEVEL, 100)
+
+
+class TestSweep(unittest.TestCase):
+    def test_parse_param_values(self):
+        self.assertEqual(parse_param('Troll.STRENGTH=15,25'), ('Troll.STRENGTH', [15, 25]))
+        self.assertEqual(parse_param('Soul.INITIAL_POSITION=(1, 2),(3, 4)'), ('Soul.INITIAL_POSITION', [(1, 2), (3, 4)]))
+
+    def test_build_specs_is_cartesian_product(self):
+        specs = build_specs([('Troll.STRENGTH', [1, 2, 3]), ('Soul.STRENGTH', [4, 5])], repeats=2, max_ticks=10)
+        self.assertEqual(len(specs), 12)
+        self.assertEqual([spec['run_id'] for spec in specs], list(range(12)))
+
+    def test_run_simulation_reports_metrics(self):
+        result = run_simulation({'run_id': 0, 'overrides': {'Troll.STRENGTH': 1}, 'seed': 0, 'max_ticks': 120})
+        self.assertEqual(result['ticks'], 120)
+        for metric in ('kills', 'time_to_first_kill', 'damage_taken', 'level', 'ticks_per_second'):
+            self.assertIn(metric, result)
+
+    def test_sweep_runs_in_process_pool_and_summarizes(self):
+        specs = build_specs([('Troll.STRENGTH', [10, 20])], repeats=2, max_ticks=30)
+        results = run_sweep(specs, workers=2)
+        summary = summarize(results)
+        self.assertEqual(len(results), 4)
+        self.assertEqual([row['Troll.STRENGTH'] for row in summary], [10, 20])
+        self.assertEqual([row['runs'] for row in summary], [2, 2])
+
+if __name__ == '__main__':
+    unittest.main()
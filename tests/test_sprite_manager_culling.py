@@ -0,0 +1,52 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import pygame
+from core.game import Game
+from managers.sprite_manager import RenderPlan, SpriteManager
+
+class TestSpriteManagerCulling(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.game.step()
+        self.sprite_manager = self.game._sprite_manager
+        self.screen = self.game._screen_manager.screen
+        self.camera = self.game._camera
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _move_mobs(self, left):
+        for mob in self.sprite_manager.mob_sprites:
+            mob.rect.left = left
+
+    def test_offscreen_mobs_are_not_drawn(self):
+        self._move_mobs(self.game.MAP_WIDTH - 200)
+        drawn = self.sprite_manager.draw_all(self.screen, self.camera)
+        # Apenas o sprite do player e o HUD
+        self.assertEqual(len(drawn), 2)
+
+    def test_mobs_within_margin_are_drawn(self):
+        self._move_mobs(self.camera.visible_area().right + SpriteManager.CULL_MARGIN // 2)
+        drawn = self.sprite_manager.draw_all(self.screen, self.camera)
+        # Sprite e barra de vida de cada mob, além do player e do HUD
+        self.assertEqual(len(drawn), 2 + 2 * len(self.sprite_manager.mob_sprites))
+
+    def test_hud_is_drawn_even_if_player_is_culled(self):
+        self._move_mobs(self.game.MAP_WIDTH - 200)
+        self.game._player.rect.left = self.game.MAP_WIDTH - 200
+        drawn = self.sprite_manager.draw_all(self.screen, self.camera)
+        self.assertEqual(drawn, [self.game._player.stats_bar_component.draw_stats_bar(self.screen)])
+
+    def test_render_plan_dispatch(self):
+        player_plan = RenderPlan(self.game._player)
+        mob_plan = RenderPlan(next(iter(self.sprite_manager.mob_sprites)))
+        self.assertIsNotNone(player_plan.draw_hud)
+        self.assertIsNone(player_plan.overlay_blit)
+        self.assertIsNone(mob_plan.draw_hud)
+        self.assertIsNotNone(mob_plan.overlay_blit)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest import mock
+import pygame
+from core.game import Game
+from components.stats_bar_component import StatsBarComponent
+
+class TestStatsBarComponent(unittest.TestCase):
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.player = self.game._player
+        self.stats_bar = self.player.stats_bar_component
+        self.screen = self.game._screen_manager.screen
+
+    def tearDown(self):
+        pygame.quit()
+
+    def _count_rebuilds(self, frames):
+        with mock.patch.object(
+            StatsBarComponent, '_bar_width', wraps=StatsBarComponent._bar_width
+        ) as bar_width:
+            for _ in range(frames):
+                self.stats_bar.draw_stats_bar(self.screen)
+        return bar_width.call_count // 2
+
+    def test_composite_is_rebuilt_only_when_stats_change(self):
+        self.assertEqual(self._count_rebuilds(10), 1)
+        self.assertEqual(self._count_rebuilds(10), 0)
+        self.player.life -= 10
+        self.assertEqual(self._count_rebuilds(10), 1)
+        self.stats_bar.notify({'type': 'player_up'})
+        self.assertEqual(self._count_rebuilds(10), 1)
+
+    def test_draw_covers_the_whole_hud(self):
+        area = self.stats_bar.draw_stats_bar(self.screen)
+        self.assertTrue(area.contains(self.stats_bar.interface.get_rect(topleft=StatsBarComponent.INTERFACE_POSITION)))
+
+    def test_bar_width_is_clamped(self):
+        bar = pygame.Surface((100, 10))
+        self.assertEqual(StatsBarComponent._bar_width(bar, 0.5), 50)
+        self.assertEqual(StatsBarComponent._bar_width(bar, 1.7), 100)
+        self.assertEqual(StatsBarComponent._bar_width(bar, -0.2), 0)
+
+if __name__ == '__main__':
+    unittest.main()
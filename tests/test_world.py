@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import types
+import unittest
+import pygame
+from managers.service_registry import ServiceRegistry
+from managers.world import World
+
+class SpriteMock(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 10, 10)
+
+class TestWorld(unittest.TestCase):
+    def setUp(self):
+        self.sprite_manager = types.SimpleNamespace(
+            player_sprites=pygame.sprite.Group(), 
+            mob_sprites=pygame.sprite.Group()
+        )
+        self.mobs = [SpriteMock() for _ in range(3)]
+        self.sprite_manager.mob_sprites.add(*self.mobs)
+        self.world = World(self.sprite_manager)
+        self.world.begin_tick()
+
+    def test_mobs_are_cached_within_a_tick(self):
+        self.assertIs(self.world.mobs, self.world.mobs)
+        self.assertEqual(set(self.world.mobs), set(self.mobs))
+
+    def test_killed_mob_disappears_in_the_same_tick(self):
+        self.world.mobs
+        self.mobs[1].kill()
+        self.assertEqual(set(self.world.mobs), {self.mobs[0], self.mobs[2]})
+
+    def test_begin_tick_refreshes_the_list(self):
+        self.world.mobs
+        self.mobs[0].kill()
+        added = SpriteMock()
+        self.sprite_manager.mob_sprites.add(added)
+        self.world.begin_tick()
+        self.assertEqual(set(self.world.mobs), {self.mobs[1], self.mobs[2], added})
+
+    def test_players_follow_their_group(self):
+        self.assertEqual(self.world.players, ())
+        player = SpriteMock()
+        self.sprite_manager.player_sprites.add(player)
+        self.assertEqual(self.world.players, (player,))
+        player.kill()
+        self.assertEqual(self.world.players, ())
+
+class TestServiceRegistry(unittest.TestCase):
+    def test_returns_registered_service(self):
+        registry = ServiceRegistry()
+        world = object()
+        registry.register(World, world)
+        self.assertIs(registry.get(World), world)
+
+    def test_unregistered_type_raises_lookup_error(self):
+        with self.assertRaises(LookupError):
+            ServiceRegistry().get(World)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import pygame
+from bisect import bisect_left, bisect_right
+from typing import List, Optional
+
+def _left(entity: pygame.sprite.Sprite) -> int:
+    return entity.rect.left
+
+class CollisionIndex:
+    """Índice de colisão 'sweep and prune' no eixo x para um grupo de sprites.
+
+    Mantém as entidades do grupo ordenadas pela borda esquerda do rect. Como as posições
+    mudam pouco de um tick para o outro, 'refresh' reordena a lista do tick anterior, que já
+    está quase ordenada, em tempo praticamente linear. As consultas usam busca binária para
+    restringir os candidatos ao intervalo x de interesse antes do teste exato.
+
+    As consultas refletem as posições do último 'refresh'; deve ser chamado a cada tick,
+    antes das entidades que consultam o índice serem atualizadas.
+    """
+
+    def __init__(self, group: pygame.sprite.AbstractGroup) -> None:
+        """Inicializa o índice vazio associado ao grupo de sprites."""
+        self._group = group
+        self._entities: List[pygame.sprite.Sprite] = []
+        self._lefts: List[int] = []
+        self._max_width = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def refresh(self) -> None:
+        """Sincroniza o índice com o grupo e reordena as entidades pela posição atual."""
+        entities = self._entities
+        group = self._group
+        if len(entities) != len(group) or not all(entity in group for entity in entities):
+            known = set(entities)
+            entities = [entity for entity in entities if entity in group]
+            entities.extend(entity for entity in group if entity not in known)
+        # Timsort detecta as sequências já ordenadas do tick anterior
+        entities.sort(key=_left)
+        self._entities = entities
+        self._lefts = [entity.rect.left for entity in entities]
+        self._max_width = max((entity.rect.width for entity in entities), default=0)
+
+    def query_rect(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Retorna as entidades vivas cujo rect colide com 'rect'."""
+        start = bisect_left(self._lefts, rect.left - self._max_width)
+        end = bisect_left(self._lefts, rect.right)
+        return [
+            entity for entity in self._entities[start:end]
+            if entity.rect.colliderect(rect) and entity.alive()
+        ]
+
+    def query_range(self, centerx: int, distance: int) -> List[pygame.sprite.Sprite]:
+        """Retorna as entidades vivas cujo centro está a até 'distance' pixels de 'centerx'."""
+        start = bisect_left(self._lefts, centerx - distance - self._max_width)
+        end = bisect_right(self._lefts, centerx + distance)
+        return [
+            entity for entity in self._entities[start:end]
+            if abs(entity.rect.centerx - centerx) <= distance and entity.alive()
+        ]
+
+    def nearest(self, centerx: int) -> Optional[pygame.sprite.Sprite]:
+        """Retorna a entidade viva cujo centro está mais próximo de 'centerx' no eixo x."""
+        entities, lefts = self._entities, self._lefts
+        nearest, nearest_distance = None, float('inf')
+        position = bisect_left(lefts, centerx)
+        # À direita o centro nunca fica antes da borda esquerda
+        for index in range(position, len(entities)):
+            if lefts[index] - centerx > nearest_distance:
+                break
+            distance = abs(entities[index].rect.centerx - centerx)
+            if distance < nearest_distance and entities[index].alive():
+                nearest, nearest_distance = entities[index], distance
+        # À esquerda o centro fica no máximo a '_max_width' pixels da borda esquerda
+        for index in range(position - 1, -1, -1):
+            if centerx - lefts[index] - self._max_width > nearest_distance:
+                break
+            distance = abs(entities[index].rect.centerx - centerx)
+            if distance < nearest_distance and entities[index].alive():
+                nearest, nearest_distance = entities[index], distance
+        return nearest
@@ -0,0 +1,156 @@
+import weakref
+import pygame
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Frames aparados: para cada superfície, a posição (x, y) dos seus pixels dentro da caixa
+# original do frame e o tamanho dessa caixa. O posicionamento das entidades usa a caixa.
+_anchors: 'weakref.WeakKeyDictionary[pygame.Surface, Tuple[int, int, int, int]]' = weakref.WeakKeyDictionary()
+
+# Cores tentadas, em ordem, como cor transparente ('colorkey') dos frames de alfa binário; a
+# escolhida não pode aparecer entre os pixels visíveis do frame.
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3))
+
+
+def trim_frame(frame: pygame.Surface) -> pygame.Surface:
+    """Apara o frame no menor retângulo com pixels visíveis, registrando sua âncora.
+
+    Retorna o próprio frame se não houver margens transparentes.
+    """
+    bounds = frame.get_bounding_rect()
+    if bounds.size == frame.get_size():
+        return frame
+    trimmed = frame.subsurface(bounds).copy()
+    set_anchor(trimmed, bounds.topleft, frame.get_size())
+    return trimmed
+
+
+def frame_view(spritesheet: pygame.Surface, rect: Tuple[int, int, int, int]) -> pygame.Surface:
+    """Retorna o frame como subsuperfície do spritesheet, aparado como em 'trim_frame'.
+
+    A subsuperfície compartilha os pixels do spritesheet (nenhum pixel é copiado) e o mantém
+    vivo enquanto existir.
+    """
+    box = spritesheet.subsurface(rect)
+    bounds = box.get_bounding_rect()
+    if bounds.size == box.get_size():
+        return box
+    view = spritesheet.subsurface(bounds.move(rect[0], rect[1]))
+    set_anchor(view, bounds.topleft, box.get_size())
+    return view
+
+
+def optimize_frame(frame: pygame.Surface) -> pygame.Surface:
+    """Converte o frame para o formato de blit mais rápido que o desenha sem diferenças.
+
+    Um frame de alfa binário (cada pixel é transparente ou opaco) é copiado para uma superfície
+    opaca com cor transparente ('colorkey') codificada em RLE ('RLEACCEL'), cujo blit salta as
+    sequências transparentes. Os frames com alfa parcial são retornados sem alteração: o blit
+    RLE com alfa por pixel do SDL arredonda a mistura de outra forma que o do pygame. Também
+    não são alteradas as subsuperfícies, pois convertê-las copiaria os pixels que compartilham
+    com o spritesheet.
+    """
+    if frame.get_parent() is not None or not frame.get_flags() & pygame.SRCALPHA:
+        return frame
+    visible = pygame.mask.from_surface(frame, 0).count()
+    if visible == pygame.mask.from_surface(frame, 254).count():
+        for key in COLORKEY_CANDIDATES:
+            keyed = pygame.Surface(frame.get_size()).convert()
+            keyed.fill(key)
+            keyed.blit(frame, (0, 0))
+            keyed.set_colorkey(key)
+            # Com a cor transparente, a máscara conta os pixels diferentes dela: se algum pixel
+            # visível tiver a mesma cor, a contagem diminui e a próxima cor é tentada.
+            if pygame.mask.from_surface(keyed).count() == visible:
+                keyed.set_colorkey(key, pygame.RLEACCEL)
+                if frame in _anchors:
+                    _anchors[keyed] = _anchors[frame]
+                return keyed
+    return frame
+
+
+def frame_format(frame: pygame.Surface) -> str:
+    """Retorna o caminho de blit do frame, para relatórios.
+
+    'colorkey', 'alpha' ou 'opaque', com o sufixo '+rle' se a superfície é codificada em RLE,
+    ou 'view' para uma subsuperfície de spritesheet.
+    """
+    if frame.get_parent() is not None:
+        return 'view'
+    if frame.get_colorkey() is not None:
+        kind = 'colorkey'
+    elif frame.get_flags() & pygame.SRCALPHA:
+        kind = 'alpha'
+    else:
+        kind = 'opaque'
+    return f'{kind}+rle' if frame.get_flags() & pygame.RLEACCELOK else kind
+
+
+def set_anchor(frame: pygame.Surface, anchor: Tuple[int, int], box_size: Tuple[int, int]) -> None:
+    """Registra a posição dos pixels do frame aparado dentro da caixa original de tamanho 'box_size'."""
+    _anchors[frame] = (*anchor, *box_size)
+
+
+def frame_anchor(frame: pygame.Surface) -> Tuple[int, int]:
+    """Retorna o deslocamento a somar à posição da caixa ao desenhar o frame ((0, 0) se não foi aparado)."""
+    anchor = _anchors.get(frame)
+    return (anchor[0], anchor[1]) if anchor is not None else (0, 0)
+
+
+def frame_box_size(frame: pygame.Surface) -> Tuple[int, int]:
+    """Retorna o tamanho da caixa original do frame (o tamanho da superfície, se não foi aparado)."""
+    anchor = _anchors.get(frame)
+    return (anchor[2], anchor[3]) if anchor is not None else frame.get_size()
+
+
+def frame_rect(frame: pygame.Surface, **position) -> pygame.Rect:
+    """Equivalente a 'frame.get_rect(**position)', usando a caixa original de um frame aparado."""
+    rect = pygame.Rect((0, 0), frame_box_size(frame))
+    for attribute, value in position.items():
+        setattr(rect, attribute, value)
+    return rect
+
+
+class FrameSet:
+    """Sequência imutável de frames com as variantes espelhadas pré-calculadas.
+
+    Os frames voltados para os dois lados são gerados uma única vez, na criação do conjunto,
+    de modo que os componentes apenas indexam o lado desejado em vez de chamar
+    'pygame.transform.flip' (que aloca uma nova superfície) durante o jogo. O espelho de um
+    frame aparado recebe a âncora espelhada dentro da mesma caixa.
+    """
+
+    __slots__ = ('_frames', '_mirrored_frames', '_mirrors')
+
+    def __init__(self, frames: Iterable[pygame.Surface]) -> None:
+        """Armazena os frames originais e gera suas variantes espelhadas horizontalmente."""
+        self._frames = tuple(frames)
+        self._mirrored_frames = tuple(self._flip(frame) for frame in self._frames)
+        self._mirrors = dict(zip(self._frames, self._mirrored_frames))
+        self._mirrors.update(zip(self._mirrored_frames, self._frames))
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index: int) -> pygame.Surface:
+        return self._frames[index]
+
+    def __iter__(self) -> Iterator[pygame.Surface]:
+        return iter(self._frames)
+
+    def get(self, index: int, mirrored: bool = False) -> pygame.Surface:
+        """Retorna o frame no índice informado, espelhado ou não."""
+        return self._mirrored_frames[index] if mirrored else self._frames[index]
+
+    def mirror(self, frame: pygame.Surface) -> Optional[pygame.Surface]:
+        """Retorna a variante oposta de um frame do conjunto, ou None se ele não pertencer ao conjunto."""
+        return self._mirrors.get(frame)
+
+    @staticmethod
+    def _flip(frame: pygame.Surface) -> pygame.Surface:
+        # Espelha o frame horizontalmente, levando junto a âncora de um frame aparado.
+        mirrored = pygame.transform.flip(frame, True, False)
+        anchor = _anchors.get(frame)
+        if anchor is not None:
+            x, y, box_width, box_height = anchor
+            set_anchor(mirrored, (box_width - x - frame.get_width(), y), (box_width, box_height))
+        return mirrored
@@ -1,31 +1,79 @@
-from typing import TYPE_CHECKING
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from entities.mob_factory import MobFactory
+    from entities.mob import Mob
 
 class ObjectPool:
-    """Um pool de objetos reutilizáveis gerenciado por uma função de fábrica para criar novos objetos."""
+    """Um pool de objetos reutilizáveis gerenciado por uma função de fábrica para criar novos objetos.
 
-    def __init__(self, factory: 'MobFactory') -> None:
+    Mantém uma lista livre (deque) por tipo de objeto, de modo que obter e liberar são O(1).
+    O número de objetos ociosos por tipo é limitado por 'max_idle', e o pool pode ser
+    pré-aquecido durante o carregamento para evitar criar objetos no meio do combate.
+    """
+
+    DEFAULT_MAX_IDLE = 32
+
+    def __init__(self, factory: Callable[..., 'Mob'], max_idle: int = DEFAULT_MAX_IDLE) -> None:
         """Inicializa o ObjectPool com uma função de fábrica para criar objetos."""
         self.factory = factory
-        self.pool = []
+        self.max_idle = max_idle
+        self._free: Dict[str, Deque[object]] = defaultdict(deque)
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.peak_size = 0
 
     def get(self, *args, **kwargs) -> object:
         """Obtém um objeto resetado (caso contenha atributo 'reset') do pool, se disponível.
 
         Caso não o possua, cria um novo objeto usando a função de fábrica com base no 'name'. 
         """
-        name = kwargs.get('name')
-        for obj in self.pool:
-            if obj.type == name:
-                self.pool.remove(obj)
-                if hasattr(obj, 'reset'):
-                    obj.reset()
-                return obj
+        free = self._free.get(kwargs.get('name'))
+        if free:
+            self.hits += 1
+            obj = free.pop()
+            if hasattr(obj, 'reset'):
+                obj.reset()
+            return obj
+        self.misses += 1
         return self.factory(*args, **kwargs)
 
     def release(self, *objects) -> None:
-        """Libera um ou mais objetos de volta ao pool para reutilização."""
+        """Libera um ou mais objetos de volta ao pool para reutilização.
+
+        Objetos além do limite de ociosos do seu tipo são descartados.
+        """
         for obj in objects:
-            self.pool.append(obj)
\ No newline at end of file
+            free = self._free[obj.type]
+            if len(free) >= self.max_idle:
+                self.discarded += 1
+                continue
+            free.append(obj)
+        self._update_peak_size()
+
+    def prewarm(self, name: str, count: int, *args, **kwargs) -> None:
+        """Cria objetos do tipo 'name' até haver 'count' ociosos (respeitando 'max_idle')."""
+        free = self._free[name]
+        while len(free) < min(count, self.max_idle):
+            free.append(self.factory(*args, name=name, **kwargs))
+        self._update_peak_size()
+
+    @property
+    def size(self) -> int:
+        """Número total de objetos ociosos no pool."""
+        return sum(len(free) for free in self._free.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores do pool."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'discarded': self.discarded,
+            'size': self.size,
+            'peak_size': self.peak_size
+        }
+
+    def _update_peak_size(self) -> None:
+        # Registra o maior número de objetos ociosos já mantidos pelo pool.
+        self.peak_size = max(self.peak_size, self.size)